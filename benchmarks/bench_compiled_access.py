@@ -0,0 +1,63 @@
+"""
+Cost of reading `conf.db.port` in a tight loop: `AttributeType` wrappers (default),
+native leaves (`rxconf.unboxed_view`), per-shape generated classes with `__slots__` (`rxconf.compiled_view`)
+and a plain object for reference.
+Also reports the time to compile a snapshot and to compile a reload with the same keys.
+
+Usage: poetry run python benchmarks/bench_compiled_access.py [--number 1000000] [--services 1000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import timeit
+import types
+
+import rxconf
+
+
+def _config(services: int, port: int) -> str:
+    lines = ["db:", "  host: localhost", f"  port: {port}", "services:"]
+    for number in range(services):
+        lines += [f"  service_{number}:", "    host: localhost", f"    port: {port + number}", "    enabled: true"]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=1_000_000, help="evaluations per mode")
+    parser.add_argument("--services", type=int, default=1000, help="same-shaped mappings in the config")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.yaml")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(_config(args.services, port=5432))
+        boxed = rxconf.Conf.from_file(path)
+
+        started_at = time.perf_counter()
+        compiled = rxconf.compiled_view(boxed)
+        first = time.perf_counter() - started_at
+
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(_config(args.services, port=5433))
+        reloaded = rxconf.Conf.from_file(path)
+        started_at = time.perf_counter()
+        rxconf.compiled_view(reloaded)
+        second = time.perf_counter() - started_at
+        print(f"compile {args.services} services: first {first * 1e3:.1f} ms, same keys {second * 1e3:.1f} ms")
+
+        modes = {
+            "boxed": boxed,
+            "unboxed": rxconf.unboxed_view(boxed),
+            "compiled": compiled,
+            "plain object": types.SimpleNamespace(db=types.SimpleNamespace(host="localhost", port=5432)),
+        }
+        for name, conf in modes.items():
+            elapsed = timeit.timeit("conf.db.port", globals={"conf": conf}, number=args.number)
+            print(f"conf.db.port  {name:<13} {elapsed / args.number * 1e9:>8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
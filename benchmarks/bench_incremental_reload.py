@@ -0,0 +1,73 @@
+"""
+Building the attribute tree of a big YAML config with a single changed key:
+full rebuild vs structural sharing with the previous tree. YAML parsing is done once beforehand,
+because it costs the same for both strategies.
+Reports the build time, memory allocated by the build and how many attribute nodes of the new tree are new.
+
+Usage: poetry run python benchmarks/bench_incremental_reload.py [--services 5000] [--repeat 5]
+"""
+
+import argparse
+import time
+import tracemalloc
+import typing as tp
+
+from rxconf import attributes
+from rxconf.config_types import YamlConfig
+
+
+def _make_data(services: int, port: int) -> tp.Dict[str, tp.Any]:
+    return {
+        "services": {
+            f"service_{number}": {
+                "host": f"host_{number}",
+                "port": port if number == 0 else number,
+                "tags": ["a", "b", "c"],
+                "limits": {"cpu": 1, "memory": number},
+            }
+            for number in range(services)
+        }
+    }
+
+
+def _nodes(attribute: attributes.AttributeType) -> tp.Iterator[attributes.AttributeType]:
+    yield attribute
+    value = object.__getattribute__(attribute, "_AttributeType__value")
+    children: tp.Iterable[attributes.AttributeType] = ()
+    if isinstance(value, attributes.AttributeMap):
+        children = value.values()
+    elif isinstance(value, (list, set)):
+        children = value
+    for child in children:
+        yield from _nodes(child)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    previous = YamlConfig._process_data(_make_data(args.services, port=1))
+    old_nodes = {id(node) for node in _nodes(previous)}
+    data = _make_data(args.services, port=2)
+
+    for name, base in (("full rebuild", None), ("structural sharing", previous)):
+        started_at = time.perf_counter()
+        for _ in range(args.repeat):
+            root = YamlConfig._process_data(data, previous=base)
+        elapsed = (time.perf_counter() - started_at) / args.repeat
+        tracemalloc.start()
+        YamlConfig._process_data(data, previous=base)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        nodes = list(_nodes(root))
+        new_nodes = sum(id(node) not in old_nodes for node in nodes)
+        print(
+            f"{name:<20} time={elapsed * 1e3:>8.1f} ms  allocated={peak / 2**20:>7.1f} MB  "
+            f"new nodes={new_nodes}/{len(nodes)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
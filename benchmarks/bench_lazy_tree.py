@@ -0,0 +1,59 @@
+"""
+Loading a big shared JSON config of which a service reads only a few keys: eager attribute tree
+(every node wrapped and hashed on load) vs lazy tree (`Conf.from_file(..., lazy=True)`).
+Reports `json.loads` alone, the load time, the time to read the keys and the time to compute the config hash
+(which the lazy tree does on demand, e.g. when the digest of a reloaded file differs).
+
+Usage: poetry run python benchmarks/bench_lazy_tree.py [--keys 20000] [--reads 10] [--repeat 5]
+"""
+
+import argparse
+import json
+import pathlib
+import tempfile
+import time
+
+from rxconf import Conf
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=20000)
+    parser.add_argument("--reads", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = {
+        f"key_{number}": {"host": f"host_{number}", "port": number, "tags": ["a", "b"]} for number in range(args.keys)
+    }
+    content = json.dumps(data)
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "config.json"
+        path.write_text(content, encoding="utf-8")
+
+        started_at = time.perf_counter()
+        for _ in range(args.repeat):
+            json.loads(content)
+        print(f"{'json.loads':<10} {(time.perf_counter() - started_at) / args.repeat * 1e3:>9.2f} ms")
+
+        for name, lazy in (("eager", False), ("lazy", True)):
+            load = read = hashing = 0.0
+            for _ in range(args.repeat):
+                started_at = time.perf_counter()
+                conf = Conf.from_file(path, lazy=lazy)
+                loaded_at = time.perf_counter()
+                for number in range(0, args.keys, max(args.keys // args.reads, 1)):
+                    assert getattr(conf, f"key_{number}").port == number
+                read_at = time.perf_counter()
+                _ = conf._MetaTree__structure.hash
+                load += loaded_at - started_at
+                read += read_at - loaded_at
+                hashing += time.perf_counter() - read_at
+            print(
+                f"{name:<10} load={load / args.repeat * 1e3:>9.2f} ms  "
+                f"{args.reads} reads={read / args.repeat * 1e3:>7.3f} ms  hash={hashing / args.repeat * 1e3:>9.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
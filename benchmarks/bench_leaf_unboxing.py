@@ -0,0 +1,39 @@
+"""
+Cost of reading leaves in hot code: `AttributeType` wrappers (default) vs native Python values (`rxconf.unboxed_view`).
+Reports the time per expression for `conf.limits.rps * 2` and `conf.flags.x == True`.
+
+Usage: poetry run python benchmarks/bench_leaf_unboxing.py [--number 1000000]
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+
+import rxconf
+
+
+_CONFIG = "limits:\n  rps: 100\nflags:\n  x: true\n"
+_EXPRESSIONS = ("conf.limits.rps * 2", "conf.flags.x == True")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=1_000_000, help="evaluations per expression")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.yaml")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(_CONFIG)
+        boxed = rxconf.Conf.from_file(path)
+        modes = {"boxed": boxed, "unboxed": rxconf.unboxed_view(boxed)}
+
+        for expression in _EXPRESSIONS:
+            for name, conf in modes.items():
+                elapsed = timeit.timeit(expression, globals={"conf": conf}, number=args.number)
+                print(f"{expression:<22} {name:<8} {elapsed / args.number * 1e9:>8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
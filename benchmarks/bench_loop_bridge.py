@@ -0,0 +1,51 @@
+"""
+Per-call latency of running a coroutine from synchronous code:
+`asyncio.run` (new event loop per call) vs the shared `LoopBridge` (one loop in a daemon thread).
+That is the cost paid by sync functions decorated with `AsyncRxConf` when the factory or triggers are async.
+
+Usage: poetry run python benchmarks/bench_loop_bridge.py [--calls 2000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import typing as tp
+
+from rxconf import concurrency
+
+
+async def _noop() -> None:
+    return
+
+
+def _measure(run: tp.Callable[[], tp.Any], calls: int) -> tp.List[float]:
+    latencies = []
+    for _ in range(calls):
+        started_at = time.perf_counter()
+        run()
+        latencies.append((time.perf_counter() - started_at) * 1e6)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    bridge = concurrency.get_loop_bridge()
+    bridge.run(_noop())  # starts the thread
+    try:
+        for name, run in (
+            ("asyncio.run", lambda: asyncio.run(_noop())),
+            ("LoopBridge.run", lambda: bridge.run(_noop())),
+        ):
+            latencies = sorted(_measure(run, calls=args.calls))
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(f"{name:<16} median={statistics.median(latencies):>8.1f} us  p99={p99:>8.1f} us")
+    finally:
+        bridge.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Memory of the attribute tree of a config with many leaves: bytes allocated per leaf (tracemalloc),
+counting every node, mapping and subtree hash of the tree, but not the parsed data it is built from.
+Shapes: many small same-shaped mappings (items of a service list) and one wide mapping.
+
+Usage: poetry run python benchmarks/bench_node_memory.py [--leaves 100000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+import typing as tp
+
+from rxconf.config_types import YamlConfig
+
+
+def _services(leaves: int) -> tp.Dict[str, tp.Any]:
+    return {
+        "services": [
+            {
+                "name": f"service_{number}",
+                "host": f"host_{number}",
+                "port": number,
+                "enabled": True,
+                "weight": 0.5,
+                "zone": "eu",
+                "retries": 3,
+                "timeout": 30,
+                "owner": None,
+                "priority": number % 10,
+            }
+            for number in range(leaves // 10)
+        ]
+    }
+
+
+def _wide(leaves: int) -> tp.Dict[str, tp.Any]:
+    return {f"key_{number}": number for number in range(leaves)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leaves", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for name, make in (("same-shaped mappings", _services), ("one wide mapping", _wide)):
+        data = make(args.leaves)
+        gc.collect()
+        tracemalloc.start()
+        root = YamlConfig._process_data(data)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:<22} total={size / 2**20:>8.1f} MiB  per leaf={size / args.leaves:>7.1f} bytes")
+        del root
+
+
+if __name__ == "__main__":
+    main()
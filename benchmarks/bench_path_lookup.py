@@ -0,0 +1,56 @@
+"""
+Resolving a deep key: attribute chain (`conf.a.b.c`, one `__getattr__` per level) vs `rxconf.lookup(conf, "a.b.c")`
+(memoized dotted-path index of the snapshot) vs `rxconf.lookup_many` for a batch of keys.
+
+Usage: poetry run python benchmarks/bench_path_lookup.py [--depth 5] [--calls 200000]
+"""
+
+import argparse
+import functools
+import time
+import typing as tp
+
+from rxconf import Conf, lookup, lookup_many
+from rxconf.config_types import YamlConfig
+
+
+def _measure(name: str, func: tp.Callable[[], tp.Any], calls: int) -> None:
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        func()
+    elapsed = time.perf_counter() - started_at
+    print(f"{name:<16} {elapsed / calls * 1e9:>8.0f} ns/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    keys = [f"level_{number}" for number in range(args.depth)]
+    data: tp.Dict[str, tp.Any] = {"value": 42, "other": 1}
+    for key in reversed(keys):
+        data = {key: data, "sibling": 0}
+    conf = Conf(config=YamlConfig(root_attribute=YamlConfig._process_data(data), path=None))  # type: ignore[arg-type]
+    path = ".".join([*keys, "value"])
+
+    def chain() -> tp.Any:
+        node = conf
+        for key in keys:
+            node = getattr(node, key)
+        return node.value
+
+    assert chain() == lookup(conf, path) == 42
+    _measure("attribute chain", chain, args.calls)
+    _measure("lookup", functools.partial(lookup, conf, path), args.calls)
+    batch = [path, ".".join([*keys, "other"]), ".".join([*keys[:-1], "sibling"])] * 10
+    started_at = time.perf_counter()
+    for _ in range(args.calls // len(batch)):
+        lookup_many(conf, batch)
+    elapsed = time.perf_counter() - started_at
+    print(f"{'lookup_many':<16} {elapsed / (args.calls // len(batch) * len(batch)) * 1e9:>8.0f} ns/key")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Cold start of a big YAML config: parsing the file vs loading its snapshot from the on-disk cache
+(`Conf.from_file(..., cache_dir=...)`, pre-populated by `python -m rxconf compile`).
+Reports the load time and the time of the first access to a few keys, which decodes snapshot nodes lazily.
+
+Usage: poetry run python benchmarks/bench_snapshot_cache.py [--services 5000] [--repeat 5]
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+
+import yaml
+
+from rxconf import Conf
+from rxconf.__main__ import main as rxconf_main
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = {
+        "services": {
+            f"service_{number}": {
+                "host": f"host_{number}",
+                "port": number,
+                "tags": ["a", "b", "c"],
+                "limits": {"cpu": 1, "memory": number},
+            }
+            for number in range(args.services)
+        }
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "config.yaml"
+        path.write_text(yaml.safe_dump(data), encoding="utf-8")
+        cache_dir = pathlib.Path(directory) / "cache"
+        started_at = time.perf_counter()
+        rxconf_main(["compile", "--cache-dir", str(cache_dir), str(path)])
+        print(f"compile: {(time.perf_counter() - started_at) * 1e3:.1f} ms")
+
+        last = f"service_{args.services - 1}"
+        for name, snapshots in (("yaml parse", None), ("snapshot cache", cache_dir)):
+            load = access = 0.0
+            for _ in range(args.repeat):
+                started_at = time.perf_counter()
+                conf = Conf.from_file(path, cache_dir=snapshots)
+                loaded_at = time.perf_counter()
+                assert conf.services[last].port == args.services - 1
+                assert conf.services.service_0.limits.cpu == 1
+                load += loaded_at - started_at
+                access += time.perf_counter() - loaded_at
+            print(
+                f"{name:<16} load={load / args.repeat * 1e3:>9.2f} ms  "
+                f"first access={access / args.repeat * 1e3:>7.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
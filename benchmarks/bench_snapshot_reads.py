@@ -0,0 +1,74 @@
+"""
+Read throughput of decorated functions under threads.
+
+Readers take no locks, so on free-threaded builds (python3.13t with PYTHON_GIL=0)
+the throughput should grow with the number of threads. On GIL builds it stays flat.
+
+Usage: poetry run python benchmarks/bench_snapshot_reads.py [--calls 200000] [--threads 1 2 4 8]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import typing as tp
+
+import rxconf
+
+
+def _run(func: tp.Callable[[], tp.Any], threads: int, calls: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(calls):
+            func()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started_at = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * calls / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000, help="calls per thread")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}, {os.cpu_count()} CPUs")
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, "config.yaml")
+        with open(config_path, "w", encoding="utf-8") as file:
+            file.write("app:\n  name: bench\n  workers: 8\n")
+
+        observers = {
+            "refresh_interval=60": rxconf.RxConf.from_file(config_path=config_path, refresh_interval=60),
+            "watch=True": rxconf.RxConf.from_file(config_path=config_path, watch=True),
+        }
+        try:
+            for name, observer in observers.items():
+
+                @observer.include_config()
+                def read(conf: rxconf.Conf) -> tp.Any:
+                    return conf
+
+                read()
+                for threads in args.threads:
+                    rate = _run(read, threads=threads, calls=args.calls)
+                    print(f"{name:<22} threads={threads:<3} {rate:>14,.0f} calls/s")
+        finally:
+            for observer in observers.values():
+                observer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Trigger matching cost on a large configuration with a single changed attribute:
+checking every OnChange trigger one by one vs the observer-level path trie index.
+Both strategies share one precomputed diff. The index cost should stay flat with the number of triggers
+and depend only on the changed paths.
+
+Usage: poetry run python benchmarks/bench_trigger_dispatch.py [--services 500] [--triggers 10 100 1000]
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import time
+import typing as tp
+
+import rxconf
+from rxconf import rxconf as rx
+
+
+def _write_config(path: str, services: int, changed_port: int) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("services:\n")
+        for number in range(services):
+            port = changed_port if number == 0 else 1000 + number
+            file.write(f"  service_{number}:\n    host: host_{number}\n    port: {port}\n")
+
+
+def _measure(func: tp.Callable[[], tp.Any], repeat: int) -> float:
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started_at) / repeat * 1e6
+
+
+def _call_one_by_one(
+    triggers: tp.List[rxconf.OnChangeTrigger],
+    old_conf: rxconf.Conf,
+    actual_conf: rxconf.Conf,
+    changes: rxconf.ChangeSet,
+) -> None:
+    for trigger in triggers:
+        trigger(old_conf=old_conf, actual_conf=actual_conf, changes=changes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--services", type=int, default=500)
+    parser.add_argument("--triggers", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        confs = []
+        for changed_port in range(2):
+            path = os.path.join(directory, f"config_{changed_port}.yaml")
+            _write_config(path, services=args.services, changed_port=changed_port)
+            confs.append(rxconf.Conf.from_file(config_path=path))
+    old_conf, actual_conf = confs
+    changes = rxconf.diff(old_conf, actual_conf)
+    noop = rxconf.SimpleTrigger(lambda: None)
+
+    for count in args.triggers:
+        triggers = [
+            rxconf.OnChangeTrigger(
+                trigger=noop,
+                any_attributes=(f"services.service_{number % args.services}.port", "services.*.host"),
+            )
+            for number in range(count)
+        ]
+        index = rx._TriggerIndex(triggers)
+        per_trigger = _measure(
+            functools.partial(_call_one_by_one, triggers, old_conf, actual_conf, changes), repeat=args.repeat
+        )
+        indexed = _measure(functools.partial(index._trie.match, changes.paths), repeat=args.repeat)
+        print(f"triggers={count:<6} one-by-one={per_trigger:>10.1f} us  index={indexed:>8.1f} us")
+    # Paid once per reload by both strategies.
+    print(f"diff={_measure(lambda: rxconf.diff(old_conf, actual_conf), repeat=args.repeat):.1f} us")
+
+
+if __name__ == "__main__":
+    main()
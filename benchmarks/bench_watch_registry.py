@@ -0,0 +1,101 @@
+"""
+Cost of watching many files: a watcher per file (one polling thread each) vs the shared `WatchRegistry`
+(one thread for all files, inotify on Linux or `os.scandir`-batched polling otherwise).
+Reports the setup time, the number of threads, the idle CPU time and the delay between
+changing a few files and the last callback of their subscribers.
+
+Usage: poetry run python benchmarks/bench_watch_registry.py [--files 1000] [--changed 10] [--interval 0.1]
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import threading
+import time
+import typing as tp
+
+from rxconf import watchers
+
+
+def _write(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(content)
+
+
+def _measure(
+    name: str,
+    paths: tp.List[str],
+    create: tp.Callable[[str, tp.Callable[[], None]], watchers.MetaWatcher],
+    changed: int,
+    idle: float,
+) -> None:
+    notified: tp.Set[str] = set()
+    lock = threading.Lock()
+
+    def callback(path: str) -> tp.Callable[[], None]:
+        def notify() -> None:
+            with lock:
+                notified.add(path)
+
+        return notify
+
+    threads_before = threading.active_count()
+    started_at = time.perf_counter()
+    watches = [create(path, callback(path)) for path in paths]
+    for watch in watches:
+        watch.start()
+    setup = time.perf_counter() - started_at
+    threads = threading.active_count() - threads_before
+    try:
+        cpu_started_at = time.process_time()
+        time.sleep(idle)
+        cpu = time.process_time() - cpu_started_at
+
+        targets = set(paths[:changed])
+        started_at = time.perf_counter()
+        for path in targets:
+            _write(path, "value: 22")
+        while not targets <= notified:
+            time.sleep(0.001)
+        delay = time.perf_counter() - started_at
+    finally:
+        for watch in watches:
+            watch.stop()
+    print(
+        f"{name:<22} setup={setup * 1e3:>8.1f} ms  threads={threads:>5}  "
+        f"idle cpu={cpu / idle * 100:>6.1f} %  {changed} changed -> {delay * 1e3:>7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=0.1, help="poll interval in seconds")
+    parser.add_argument("--idle", type=float, default=2.0, help="seconds to measure the idle CPU time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"config_{i}.yaml") for i in range(args.files)]
+        for path in paths:
+            _write(path, "value: 1")
+
+        backends: tp.Dict[str, tp.Callable[[str, tp.Callable[[], None]], watchers.MetaWatcher]] = {
+            "per-file polling": functools.partial(watchers.PollingWatcher, poll_interval=args.interval),
+        }
+        registries = {"registry polling": watchers.WatchRegistry(use_inotify=False)}
+        if watchers.inotify_available():
+            registries["registry inotify"] = watchers.WatchRegistry(use_inotify=True)
+        for name, registry in registries.items():
+            backends[name] = functools.partial(watchers.SharedWatcher, poll_interval=args.interval, registry=registry)
+        try:
+            for name, create in backends.items():
+                _measure(name, paths, create, changed=args.changed, idle=args.idle)
+        finally:
+            for registry in registries.values():
+                registry.close()
+
+
+if __name__ == "__main__":
+    main()
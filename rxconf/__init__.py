@@ -1,4 +1,5 @@
-from . import attributes, config_resolver, config_types
+from . import attributes, changesets, compiled, concurrency, config_resolver, config_types, snapshots, watchers
+from .changesets import ChangeSet
 from .exceptions import (
     BrokenConfigSchemaError,
     ConfigNotFoundError,
@@ -6,20 +7,44 @@ from .exceptions import (
     InvalidExtensionError,
     RxConfError,
 )
-from .rxconf import AsyncRxConf, Conf, OnChangeAsyncTrigger, OnChangeTrigger, RxConf, SimpleAsyncTrigger, SimpleTrigger
+from .rxconf import (
+    AsyncRxConf,
+    Conf,
+    OnChangeAsyncTrigger,
+    OnChangeTrigger,
+    RxConf,
+    SimpleAsyncTrigger,
+    SimpleTrigger,
+    compiled_view,
+    diff,
+    lookup,
+    lookup_many,
+    unboxed_view,
+)
 
 
 __all__ = [
     "attributes",
+    "changesets",
+    "compiled",
+    "concurrency",
     "config_types",
     "config_resolver",
+    "snapshots",
+    "watchers",
     "Conf",
+    "ChangeSet",
     "RxConf",
     "AsyncRxConf",
     "SimpleTrigger",
     "SimpleAsyncTrigger",
     "OnChangeTrigger",
     "OnChangeAsyncTrigger",
+    "compiled_view",
+    "diff",
+    "lookup",
+    "lookup_many",
+    "unboxed_view",
     "BrokenConfigSchemaError",
     "ConfigNotFoundError",
     "InvalidExtensionError",
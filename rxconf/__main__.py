@@ -0,0 +1,71 @@
+"""
+Command line interface of rxconf.
+
+Usage: python -m rxconf compile --cache-dir DIR [--encoding utf-8] PATH [PATH ...]
+"""
+
+import argparse
+import pathlib
+import sys
+import typing as tp
+
+from . import config_resolver, exceptions, snapshots
+
+
+def _config_paths(paths: tp.Iterable[str]) -> tp.Iterator[tp.Tuple[pathlib.Path, bool]]:
+    """
+    Yields config files with a flag whether the file was passed explicitly.
+    Directories are walked recursively, files with unsupported extensions inside them are skipped.
+    """
+
+    for path in map(pathlib.Path, paths):
+        if path.is_dir():
+            for child in sorted(path.rglob("*")):
+                if child.is_file():
+                    yield child, False
+        else:
+            yield path, True
+
+
+def _compile(args: argparse.Namespace) -> int:
+    cache = snapshots.SnapshotCache(args.cache_dir)
+    failed = 0
+    for path, explicit in _config_paths(args.paths):
+        try:
+            config_type = config_resolver.DefaultFileConfigResolver.resolve(path=path)
+        except exceptions.InvalidExtensionError as exc:
+            if explicit:
+                print(f"{path}: {exc}", file=sys.stderr)
+                failed += 1
+            continue
+        try:
+            entry = cache.compile(path=path, encoding=args.encoding, config_type=config_type)
+        except (exceptions.RxConfError, OSError) as exc:
+            print(f"{path}: {exc}", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"{path} -> {entry}")
+    return 1 if failed else 0
+
+
+def main(argv: tp.Optional[tp.Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m rxconf", description="rxconf utilities.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile",
+        help="pre-populate the snapshot cache",
+        description="Parses config files and stores their snapshots in the cache directory, "
+        "so services started with the same `cache_dir` skip parsing on a cold start.",
+    )
+    compile_parser.add_argument("paths", nargs="+", help="config files or directories to compile")
+    compile_parser.add_argument("--cache-dir", required=True, help="snapshot cache directory")
+    compile_parser.add_argument("--encoding", default="utf-8", help="encoding of the config files")
+    compile_parser.set_defaults(handler=_compile)
+
+    args = parser.parse_args(argv)
+    return tp.cast(int, args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,9 @@
 import abc
 import functools
 import typing as tp
+import weakref
 
-from . import _types, exceptions
+from . import _types, exceptions, hashtools
 
 
 def _patch_other_value(func: tp.Callable[..., tp.Any]) -> tp.Callable[..., tp.Any]:
@@ -17,11 +18,113 @@ def _patch_other_value(func: tp.Callable[..., tp.Any]) -> tp.Callable[..., tp.An
     return wrapper
 
 
+class _KeyTable(dict):
+    """
+    Key -> index table shared by all `AttributeMap`s with the same keys in the same order.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+# Tables die with the last mapping which uses them.
+_key_tables: "weakref.WeakValueDictionary[tp.Tuple[tp.Any, ...], _KeyTable]" = weakref.WeakValueDictionary()
+# Wider mappings are rarely repeated (and an index per key costs more than it saves): they are stored as dicts.
+_MAX_SHARED_KEYS: tp.Final[int] = 64
+
+
+def _key_table(keys: tp.Tuple[tp.Any, ...]) -> _KeyTable:
+    table = _key_tables.get(keys)
+    if table is None:
+        table = _key_tables.setdefault(keys, _KeyTable((key, index) for index, key in enumerate(keys)))
+    return table
+
+
+class _AttributeMapItems(tp.ItemsView[tp.Any, tp.Any]):
+    __slots__ = ()
+
+    def __iter__(self) -> tp.Iterator[tp.Tuple[tp.Any, tp.Any]]:
+        mapping: AttributeMap = self._mapping  # type: ignore[attr-defined]
+        if mapping._values is None:
+            return iter(mapping._table.items())
+        return zip(mapping._table, mapping._values)  # noqa: B905 (Python 3.9)
+
+
+class _AttributeMapValues(tp.ValuesView[tp.Any]):
+    __slots__ = ()
+
+    def __iter__(self) -> tp.Iterator[tp.Any]:
+        mapping: AttributeMap = self._mapping  # type: ignore[attr-defined]
+        if mapping._values is None:
+            return iter(mapping._table.values())
+        return iter(mapping._values)
+
+
+class AttributeMap(tp.Mapping[tp.Any, tp.Any]):
+    """
+    Compact read-only mapping which stores the children of mapping attributes.
+    Values are kept in a tuple, keys in a key table shared by all mappings with the same keys
+    (e.g. items of a list of services), so the keys and their hash table are stored once per shape, not per node.
+    Mappings wider than `_MAX_SHARED_KEYS` keep a private dict instead.
+    """
+
+    __slots__ = ("_table", "_values")
+
+    def __init__(self, items: tp.Mapping[tp.Any, tp.Any]) -> None:
+        """
+        :param items: mapping to copy the items from.
+        """
+
+        self._table: tp.Dict[tp.Any, tp.Any]
+        self._values: tp.Optional[tp.Tuple[tp.Any, ...]]
+        if len(items) > _MAX_SHARED_KEYS:
+            self._table, self._values = dict(items), None
+        else:
+            self._table, self._values = _key_table(tuple(items)), tuple(items.values())
+
+    def __getitem__(self, key: tp.Any) -> tp.Any:
+        values = self._values
+        return self._table[key] if values is None else values[self._table[key]]
+
+    def __iter__(self) -> tp.Iterator[tp.Any]:
+        return iter(self._table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._table
+
+    def get(self, key: tp.Any, default: tp.Any = None) -> tp.Any:
+        if self._values is None:
+            return self._table.get(key, default)
+        index = self._table.get(key)
+        return default if index is None else self._values[index]
+
+    def keys(self) -> tp.KeysView[tp.Any]:
+        return self._table.keys()
+
+    def items(self) -> tp.ItemsView[tp.Any, tp.Any]:
+        return _AttributeMapItems(self)
+
+    def values(self) -> tp.ValuesView[tp.Any]:
+        return _AttributeMapValues(self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
 class AttributeType(metaclass=abc.ABCMeta):
     """Base class for all supported attribute types."""
 
+    # No instance dictionary: a node is just its value and its subtree hash.
+    __slots__ = ("__value", "__subtree_hash")
+
     def __init__(self, value: tp.Any) -> None:  # pragma: no cover
+        if isinstance(value, dict):
+            value = AttributeMap(value)
         self.__value = value
+        # Merkle hash of the subtree: nested attributes are created first, so their hashes are already known.
+        self.__subtree_hash = hashtools.compute_node_hash(value)
 
     @abc.abstractmethod
     def __getattr__(self, item: str) -> tp.Any:  # pragma: no cover
@@ -183,6 +286,8 @@ class AttributeType(metaclass=abc.ABCMeta):
 class MockAttribute(AttributeType):  # pragma: no cover
     """Mock Attribute class. Only for testing purposes."""
 
+    __slots__ = ()
+
     def __init__(self, value: tp.Any = None) -> None:
         super().__init__(value)
 
@@ -193,6 +298,8 @@ class MockAttribute(AttributeType):  # pragma: no cover
 class VaultAttribute(AttributeType):
     """Class for HashiCorp Vault attribute type."""
 
+    __slots__ = ()
+
     def __init__(
         self: "VaultAttribute",
         value: tp.Union[
@@ -217,7 +324,7 @@ class VaultAttribute(AttributeType):
         tp.Dict[str, "VaultAttribute"],
     ]:
         value = object.__getattribute__(self, "_AttributeType__value")
-        if isinstance(value, dict):
+        if isinstance(value, AttributeMap):
             try:
                 return value[item.lower()]
             except KeyError as exc:
@@ -229,6 +336,8 @@ class VaultAttribute(AttributeType):
 class YamlAttribute(AttributeType):
     """Class for YAML attribute type."""
 
+    __slots__ = ()
+
     def __init__(
         self: "YamlAttribute",
         value: tp.Union[
@@ -253,7 +362,7 @@ class YamlAttribute(AttributeType):
         tp.Dict[str, "YamlAttribute"],
     ]:
         value = object.__getattribute__(self, "_AttributeType__value")
-        if isinstance(value, dict):
+        if isinstance(value, AttributeMap):
             try:
                 return value[item.lower()]
             except KeyError as exc:
@@ -265,6 +374,8 @@ class YamlAttribute(AttributeType):
 class JsonAttribute(AttributeType):
     """Class for JSON attribute type."""
 
+    __slots__ = ()
+
     def __init__(
         self: "JsonAttribute",
         value: tp.Union[
@@ -287,7 +398,7 @@ class JsonAttribute(AttributeType):
         tp.Dict[str, "JsonAttribute"],
     ]:
         value = object.__getattribute__(self, "_AttributeType__value")
-        if isinstance(value, dict):
+        if isinstance(value, AttributeMap):
             try:
                 return value[item.lower()]
             except KeyError as exc:
@@ -299,6 +410,8 @@ class JsonAttribute(AttributeType):
 class TomlAttribute(AttributeType):
     """Class for TOML attribute type."""
 
+    __slots__ = ()
+
     def __init__(
         self: "TomlAttribute",
         value: tp.Union[
@@ -321,7 +434,7 @@ class TomlAttribute(AttributeType):
         tp.Dict[str, "TomlAttribute"],
     ]:
         value = object.__getattribute__(self, "_AttributeType__value")
-        if isinstance(value, dict):
+        if isinstance(value, AttributeMap):
             try:
                 return value[item.lower()]
             except KeyError as exc:
@@ -333,6 +446,8 @@ class TomlAttribute(AttributeType):
 class EnvAttribute(AttributeType):
     """Class for environment variable & .env attribute types."""
 
+    __slots__ = ()
+
     def __init__(
         self: "EnvAttribute",
         value: tp.Union[
@@ -353,7 +468,7 @@ class EnvAttribute(AttributeType):
         tp.Dict[str, "EnvAttribute"],
     ]:
         value = object.__getattribute__(self, "_AttributeType__value")
-        if isinstance(value, dict):
+        if isinstance(value, AttributeMap):
             try:
                 return value[item.lower()]
             except KeyError as exc:
@@ -365,6 +480,8 @@ class EnvAttribute(AttributeType):
 class IniAttribute(AttributeType):
     """Class for INI attribute type."""
 
+    __slots__ = ()
+
     def __init__(
         self: "IniAttribute", value: tp.Union[_types.INI_ATTRIBUTE_TYPE, tp.Dict[str, "IniAttribute"]]
     ) -> None:
@@ -376,10 +493,150 @@ class IniAttribute(AttributeType):
         item: str,
     ) -> tp.Union[_types.INI_ATTRIBUTE_TYPE, tp.Dict[str, "IniAttribute"], "IniAttribute"]:
         value = object.__getattribute__(self, "_AttributeType__value")
-        if isinstance(value, dict):
+        if isinstance(value, AttributeMap):
+            try:
+                return value[item.lower()]
+            except KeyError as exc:
+                raise KeyError(f"Key `{item}` doesn't exist...") from exc
+
+        raise KeyError(f"Key `{item}` doesn't exist...")
+
+
+# Slots of `AttributeType`. Subclasses which compute the value or the hash on demand shadow them with properties
+# and keep the memoized results in them.
+_VALUE_SLOT: tp.Final[tp.Any] = AttributeType.__dict__["_AttributeType__value"]
+_HASH_SLOT: tp.Final[tp.Any] = AttributeType.__dict__["_AttributeType__subtree_hash"]
+
+
+class LazyAttribute(AttributeType):
+    """
+    Attribute of the lazy tree: keeps the parsed value and materializes it on first access.
+    Wrappers of children are created (and memoized) one level at a time, scalars are converted when read,
+    and the subtree hash is computed on demand, so branches which are never read cost nothing.
+    """
+
+    __slots__ = ("__raw", "__convert")
+
+    def __init__(
+        self: "LazyAttribute",
+        value: tp.Any,
+        convert: tp.Optional[tp.Callable[[tp.Any], tp.Any]] = None,
+    ) -> None:
+        """
+        :param value: parsed value (mappings, lists, sets and scalars produced by the parser).
+        :param convert: converts and validates parsed scalars (for example, maps INI strings to primitives).
+        If it is None, the value is already materialized (children are attributes) and only its hash is lazy.
+        """
+
+        self.__raw = value
+        self.__convert = convert
+        if convert is None:
+            _VALUE_SLOT.__set__(self, AttributeMap(value) if isinstance(value, dict) else value)
+            self.__raw = None
+
+    @property
+    def _AttributeType__value(self) -> tp.Any:  # noqa: N802
+        try:
+            return _VALUE_SLOT.__get__(self, LazyAttribute)
+        except AttributeError:
+            value = self.__materialize()
+            _VALUE_SLOT.__set__(self, value)
+            # Children keep their own parts of the parsed value.
+            self.__raw = None
+            return value
+
+    @property
+    def _AttributeType__subtree_hash(self) -> int:  # noqa: N802
+        try:
+            return _HASH_SLOT.__get__(self, LazyAttribute)
+        except AttributeError:
+            subtree_hash = hashtools.compute_node_hash(self._AttributeType__value)
+            _HASH_SLOT.__set__(self, subtree_hash)
+            return subtree_hash
+
+    def __materialize(self) -> tp.Any:
+        raw, convert = self.__raw, self.__convert
+        if isinstance(raw, dict):
+            return AttributeMap({key.lower(): LazyAttribute(child, convert) for key, child in raw.items()})
+        if isinstance(raw, list):
+            return [LazyAttribute(item, convert) for item in raw]
+        if isinstance(raw, set):
+            return {LazyAttribute(item, convert) for item in raw}
+        return convert(raw)  # type: ignore[misc]
+
+    @exceptions.handle_unknown_exception
+    def __getattr__(self: "LazyAttribute", item: str) -> tp.Any:
+        value = self._AttributeType__value
+        if isinstance(value, AttributeMap):
             try:
                 return value[item.lower()]
             except KeyError as exc:
                 raise KeyError(f"Key `{item}` doesn't exist...") from exc
 
         raise KeyError(f"Key `{item}` doesn't exist...")
+
+
+def unbox(attribute: AttributeType) -> tp.Any:
+    """
+    Returns the native value of a leaf (scalar) attribute, and an `UnboxedAttribute` view of a container one.
+    """
+
+    value = object.__getattribute__(attribute, "_AttributeType__value")
+    if isinstance(value, (AttributeMap, list, set)):
+        return UnboxedAttribute(attribute)
+    return value
+
+
+class UnboxedAttribute(AttributeType):
+    """
+    View of a container attribute (mapping, list or set) whose leaves are returned as native Python values:
+    `view.limits.rps * 2` is a plain int operation, without `AttributeType` operator wrappers.
+    Nested containers are returned as views too. The view shares the value and the hash of the attribute.
+    Attributes are immutable, so resolved children are cached in the instance dict
+    and later reads are plain attribute lookups which skip `__getattr__`.
+    """
+
+    __slots__ = ("__attribute", "__dict__")
+
+    def __init__(self: "UnboxedAttribute", attribute: AttributeType) -> None:
+        """
+        :param attribute: container attribute to view.
+        """
+
+        self.__attribute = attribute
+
+    @property
+    def _AttributeType__value(self) -> tp.Any:  # noqa: N802
+        return object.__getattribute__(self.__attribute, "_AttributeType__value")
+
+    @property
+    def _AttributeType__subtree_hash(self) -> int:  # noqa: N802
+        return hashtools.get_subtree_hash(self.__attribute)
+
+    @exceptions.handle_unknown_exception
+    def __getattr__(self: "UnboxedAttribute", item: str) -> tp.Any:
+        value = self._AttributeType__value
+        if isinstance(value, AttributeMap):
+            try:
+                child = value[item.lower()]
+            except KeyError as exc:
+                raise KeyError(f"Key `{item}` doesn't exist...") from exc
+            self.__dict__[item] = unboxed = unbox(child)
+            return unboxed
+
+        raise KeyError(f"Key `{item}` doesn't exist...")
+
+    @exceptions.handle_unknown_exception
+    @_patch_other_value
+    def __getitem__(self, item: tp.Any) -> tp.Any:
+        child = self._AttributeType__value[item]
+        if isinstance(item, slice):
+            return [unbox(element) for element in child]
+        return unbox(child)
+
+    @exceptions.handle_unknown_exception
+    def __iter__(self) -> tp.Iterator[tp.Any]:
+        value = self._AttributeType__value
+        if isinstance(value, AttributeMap):
+            return iter(value)
+        return (unbox(element) for element in value)
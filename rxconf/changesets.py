@@ -0,0 +1,269 @@
+import typing as tp
+
+from . import attributes, hashtools
+
+
+T = tp.TypeVar("T")
+
+WILDCARD: tp.Final[str] = "*"
+GLOBSTAR: tp.Final[str] = "**"
+
+
+class ChangeSet:
+    """
+    Structural diff between two configurations: sets of dotted paths (lowercase) of added, removed
+    and changed attributes. Every ancestor of a modified path is marked as changed too,
+    so "is this attribute (or anything below it) changed?" is a single set lookup.
+    Example: changing `db.pool.size` gives changed = {"db", "db.pool", "db.pool.size"}.
+    """
+
+    def __init__(
+        self,
+        added: tp.AbstractSet[str] = frozenset(),
+        removed: tp.AbstractSet[str] = frozenset(),
+        changed: tp.AbstractSet[str] = frozenset(),
+    ) -> None:
+        """
+        :param added: paths of attributes which exist only in the new configuration.
+        :param removed: paths of attributes which exist only in the old configuration.
+        :param changed: paths of attributes which exist in both configurations, but differ.
+        """
+
+        self._added = frozenset(added)
+        self._removed = frozenset(removed)
+        self._changed = frozenset(changed)
+        self._paths = self._added | self._removed | self._changed
+
+    @property
+    def added(self) -> tp.FrozenSet[str]:
+        """
+        Paths of attributes which exist only in the new configuration.
+        """
+
+        return self._added
+
+    @property
+    def removed(self) -> tp.FrozenSet[str]:
+        """
+        Paths of attributes which exist only in the old configuration.
+        """
+
+        return self._removed
+
+    @property
+    def changed(self) -> tp.FrozenSet[str]:
+        """
+        Paths of attributes which exist in both configurations, but differ (including all ancestors of modifications).
+        """
+
+        return self._changed
+
+    @property
+    def paths(self) -> tp.FrozenSet[str]:
+        """
+        All touched paths: added, removed and changed ones.
+        """
+
+        return self._paths
+
+    def __contains__(self, path: object) -> bool:
+        """
+        Checks if the attribute was added, removed or changed. Case-insensitive.
+        :param path: dotted path to the attribute. Example: "db.pool.size".
+        """
+
+        return isinstance(path, str) and path.lower() in self._paths
+
+    def __bool__(self) -> bool:
+        return bool(self._paths)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChangeSet):
+            return NotImplemented
+        return (self._added, self._removed, self._changed) == (other._added, other._removed, other._changed)
+
+    def __hash__(self) -> int:
+        return hash((self._added, self._removed, self._changed))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(added={sorted(self._added)!r}, "
+            f"removed={sorted(self._removed)!r}, changed={sorted(self._changed)!r})"
+        )
+
+
+class _TrieNode:
+    __slots__ = ("children", "values", "is_globstar")
+
+    def __init__(self, is_globstar: bool = False) -> None:
+        self.children: tp.Dict[str, _TrieNode] = {}
+        self.values: tp.List[tp.Any] = []
+        self.is_globstar = is_globstar
+
+
+class PathTrie(tp.Generic[T]):
+    """
+    Prefix tree of dotted path patterns (case-insensitive). Every pattern holds values (usually triggers).
+    The `*` segment matches exactly one path segment, `**` matches any number of segments (including zero).
+    Examples: "db.pool.size", "services.*.port", "db.**".
+    Matching walks only the trie branches under the given paths, so its cost depends on the number of paths,
+    not on the number of patterns.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def add(self, pattern: str, value: T) -> None:
+        """
+        Adds the value under the pattern.
+        :param pattern: dotted path pattern. Example: "services.*.port".
+        :param value: value returned by `match` when the pattern matches.
+        """
+
+        node = self._root
+        for segment in pattern.lower().split("."):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode(is_globstar=segment == GLOBSTAR)
+            node = child
+        node.values.append(value)
+
+    def match(self, paths: tp.Iterable[str]) -> tp.Set[T]:
+        """
+        Returns values of all patterns matching at least one of the paths.
+        States of path prefixes are memoized, so the ancestors included in a `ChangeSet` cost nothing extra.
+        :param paths: lowercase dotted paths. Example: `ChangeSet.paths`.
+        """
+
+        memo: tp.Dict[str, tp.List[_TrieNode]] = {"": self._closure([self._root])}
+        found: tp.Set[T] = set()
+        for path in paths:
+            for node in self._states(path, memo):
+                found.update(node.values)
+        return found
+
+    def _states(self, path: str, memo: tp.Dict[str, tp.List[_TrieNode]]) -> tp.List[_TrieNode]:
+        states = memo.get(path)
+        if states is not None:
+            return states
+        parent, _, segment = path.rpartition(".")
+        nodes = []
+        for node in self._states(parent, memo):
+            if node.is_globstar:
+                nodes.append(node)
+            for key in (segment, WILDCARD):
+                child = node.children.get(key)
+                if child is not None:
+                    nodes.append(child)
+        states = memo[path] = self._closure(nodes)
+        return states
+
+    @staticmethod
+    def _closure(nodes: tp.List[_TrieNode]) -> tp.List[_TrieNode]:
+        """
+        Adds `**` children (which also match zero segments) and removes duplicates.
+        """
+
+        states: tp.Dict[int, _TrieNode] = {}
+        while nodes:
+            node = nodes.pop()
+            if id(node) in states:
+                continue
+            states[id(node)] = node
+            globstar = node.children.get(GLOBSTAR)
+            if globstar is not None:
+                nodes.append(globstar)
+        return list(states.values())
+
+
+def diff(old: attributes.AttributeType, new: attributes.AttributeType) -> ChangeSet:
+    """
+    Computes the structural diff between two attribute trees (usually root attributes of two configurations).
+    Mappings are compared key by key; lists, sets and scalars are compared as whole values (type-strict).
+    Unchanged subtrees are pruned by their stored hashes.
+    :param old: root attribute of the old configuration.
+    :param new: root attribute of the new configuration.
+    """
+
+    added: tp.Set[str] = set()
+    removed: tp.Set[str] = set()
+    changed: tp.Set[str] = set()
+    _diff(old, new, "", added, removed, changed)
+    return ChangeSet(added=added, removed=removed, changed=changed)
+
+
+def _value(attribute: attributes.AttributeType) -> tp.Any:
+    return object.__getattribute__(attribute, "_AttributeType__value")
+
+
+def _join(prefix: str, key: str) -> str:
+    return f"{prefix}.{key}" if prefix else key
+
+
+def _diff(
+    old: attributes.AttributeType,
+    new: attributes.AttributeType,
+    prefix: str,
+    added: tp.Set[str],
+    removed: tp.Set[str],
+    changed: tp.Set[str],
+) -> bool:
+    """
+    Collects the differences of two subtrees. Returns True if they differ.
+    Subtrees with equal stored hashes are skipped without traversal, so the cost depends on the changed branches only.
+    """
+
+    if old is new or hashtools.get_subtree_hash(old) == hashtools.get_subtree_hash(new):
+        return False
+    old_value, new_value = _value(old), _value(new)
+    if isinstance(old_value, attributes.AttributeMap) and isinstance(new_value, attributes.AttributeMap):
+        is_changed = _diff_mappings(old_value, new_value, prefix, added, removed, changed)
+        if is_changed and prefix:
+            changed.add(prefix)
+        return is_changed
+    if prefix:
+        changed.add(prefix)
+    if isinstance(old_value, attributes.AttributeMap):
+        _collect(old, prefix, removed)
+    if isinstance(new_value, attributes.AttributeMap):
+        _collect(new, prefix, added)
+    return True
+
+
+def _diff_mappings(
+    old_value: attributes.AttributeMap,
+    new_value: attributes.AttributeMap,
+    prefix: str,
+    added: tp.Set[str],
+    removed: tp.Set[str],
+    changed: tp.Set[str],
+) -> bool:
+    is_changed = False
+    for key, old_child in old_value.items():
+        path = _join(prefix, key)
+        if key not in new_value:
+            removed.add(path)
+            _collect(old_child, path, removed)
+            is_changed = True
+        elif _diff(old_child, new_value[key], path, added, removed, changed):
+            is_changed = True
+    for key, new_child in new_value.items():
+        if key not in old_value:
+            path = _join(prefix, key)
+            added.add(path)
+            _collect(new_child, path, added)
+            is_changed = True
+    return is_changed
+
+
+def _collect(attribute: attributes.AttributeType, prefix: str, into: tp.Set[str]) -> None:
+    """
+    Collects paths of all nested attributes of the mapping.
+    """
+
+    value = _value(attribute)
+    if isinstance(value, attributes.AttributeMap):
+        for key, child in value.items():
+            path = _join(prefix, key)
+            into.add(path)
+            _collect(child, path, into)
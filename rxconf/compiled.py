@@ -0,0 +1,163 @@
+import threading
+import typing as tp
+import weakref
+
+from . import attributes, exceptions
+
+
+_MISSING: tp.Final[tp.Any] = object()
+
+
+class CompiledNode:
+    """
+    Base class of the generated per-shape classes (check `shape_class`). Every distinct key tuple of a mapping
+    gets its own class with a real `__slots__` attribute per key, so `node.port` is a C-level slot read
+    instead of the chained `__getattr__` overrides of `AttributeType`. Leaves are native Python values,
+    lists and sets are compiled into tuples and frozensets. Nodes are read-only.
+    Keys which are not identifiers (or start with an underscore) don't get slots: they are stored in `_extra`
+    and are reachable with `getattr` and `node[key]`. Public methods are not defined, so they never shadow keys.
+    """
+
+    __slots__ = ()
+
+    # Filled in by `shape_class`.
+    _fields: tp.ClassVar[tp.Tuple[str, ...]] = ()
+    _slot_fields: tp.ClassVar[tp.FrozenSet[str]] = frozenset()
+    _layout: tp.ClassVar[tp.Tuple[tp.Any, ...]] = ()
+    _extra_slot: tp.ClassVar[tp.Any] = None
+    _extra: tp.Optional[tp.Dict[str, tp.Any]] = None
+
+    @classmethod
+    def _create(cls, values: tp.Iterable[tp.Any]) -> "CompiledNode":
+        node = object.__new__(cls)
+        extra = {}
+        for field, slot, value in zip(cls._fields, cls._layout, values):  # noqa: B905 (Python 3.9)
+            if slot is None:
+                extra[field] = value
+            else:
+                slot.__set__(node, value)
+        if cls._extra_slot is not None:
+            cls._extra_slot.__set__(node, extra)
+        return node
+
+    def _child(self, key: str, default: tp.Any) -> tp.Any:
+        if key in self._slot_fields:
+            return getattr(self, key)
+        extra = self._extra
+        return default if extra is None else extra.get(key, default)
+
+    @exceptions.handle_unknown_exception
+    def __getattr__(self, item: str) -> tp.Any:
+        """
+        Called only for keys without slots: keys in another case and non-identifier keys.
+        """
+
+        value = self._child(item.lower(), _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key `{item}` doesn't exist...")
+        return value
+
+    @exceptions.handle_unknown_exception
+    def __getitem__(self, key: str) -> tp.Any:
+        value = self._child(key.lower(), _MISSING) if isinstance(key, str) else _MISSING
+        if value is _MISSING:
+            raise KeyError(f"Key `{key}` doesn't exist...")
+        return value
+
+    def __setattr__(self, key: str, value: tp.Any) -> None:
+        raise exceptions.RxConfError("Compiled configuration is read-only.")
+
+    def __delattr__(self, key: str) -> None:
+        raise exceptions.RxConfError("Compiled configuration is read-only.")
+
+    def __iter__(self) -> tp.Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._child(key.lower(), _MISSING) is not _MISSING
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompiledNode):
+            return self._fields == other._fields and all(self[key] == other[key] for key in self._fields)
+        if isinstance(other, tp.Mapping):
+            return {key: self[key] for key in self._fields} == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CompiledNode({ {key: self[key] for key in self._fields}!r})"
+
+
+# Generated classes are shared by all nodes (and snapshots) with the same keys, and collected with the last one.
+_SHAPES: "weakref.WeakValueDictionary[tp.Tuple[str, ...], tp.Type[CompiledNode]]" = weakref.WeakValueDictionary()
+_SHAPES_LOCK = threading.Lock()
+
+
+def _has_slot(key: str) -> bool:
+    return key.isidentifier() and not key.startswith("_")
+
+
+def shape_class(fields: tp.Tuple[str, ...]) -> tp.Type[CompiledNode]:
+    """
+    Returns the generated class for mappings with the keys `fields` (in this order). Cached by the keys,
+    so a reload with the same key set reuses the classes instead of generating them again.
+    """
+
+    cls = _SHAPES.get(fields)
+    if cls is not None:
+        return cls
+    with _SHAPES_LOCK:
+        cls = _SHAPES.get(fields)
+        if cls is None:
+            slots = tuple(key for key in fields if _has_slot(key))
+            extra = len(slots) != len(fields)
+            cls = tp.cast(
+                tp.Type[CompiledNode],
+                type("CompiledNode", (CompiledNode,), {"__slots__": slots + (("_extra",) if extra else ())}),
+            )
+            cls._fields = fields
+            cls._slot_fields = frozenset(slots)
+            cls._layout = tuple(cls.__dict__[key] if _has_slot(key) else None for key in fields)
+            cls._extra_slot = cls.__dict__["_extra"] if extra else None
+            _SHAPES[fields] = cls
+    return cls
+
+
+def compile_attribute(attribute: tp.Any) -> tp.Any:
+    """
+    Compiles the attribute tree: mappings into instances of the per-shape classes, lists into tuples,
+    sets into frozensets and leaves into native Python values. Lazy trees are materialized.
+    """
+
+    if not isinstance(attribute, attributes.AttributeType):
+        return attribute
+    value = object.__getattribute__(attribute, "_AttributeType__value")
+    if isinstance(value, attributes.AttributeMap):
+        return shape_class(tuple(value))._create(compile_attribute(child) for child in value.values())
+    if isinstance(value, list):
+        return tuple(compile_attribute(child) for child in value)
+    if isinstance(value, set):
+        return frozenset(compile_attribute(child) for child in value)
+    return value
+
+
+def lookup(node: tp.Any, path: str, default: tp.Any = None) -> tp.Any:
+    """
+    Returns the compiled node at the dotted path or the default value if there is no such node.
+    Integer segments index tuples.
+    """
+
+    for segment in path.lower().split("."):
+        if isinstance(node, CompiledNode):
+            node = node._child(segment, _MISSING)
+            if node is _MISSING:
+                return default
+        elif isinstance(node, tuple) and segment.isdigit() and int(segment) < len(node):
+            node = node[int(segment)]
+        else:
+            return default
+    return node
@@ -0,0 +1,374 @@
+import asyncio
+import collections
+import concurrent.futures
+import threading
+import typing as tp
+
+from . import exceptions
+
+
+T = tp.TypeVar("T")
+
+
+class _Flight(tp.Generic[T]):
+    """
+    Single in-progress call of `SingleFlight`.
+    """
+
+    def __init__(self) -> None:
+        self.owner = threading.get_ident()
+        self.done = threading.Event()
+        self.completed = False
+        self.result: tp.Optional[T] = None
+        self.error: tp.Optional[Exception] = None
+
+
+class SingleFlight(tp.Generic[T]):
+    """
+    Coalesces concurrent calls across threads: while one caller (the leader) runs the function,
+    all other callers wait for its result instead of running the function themselves.
+    Exceptions of the leader are shared with the waiting callers too.
+    If the leader is interrupted by a BaseException (KeyboardInterrupt, SystemExit, etc.),
+    the waiting callers are woken up and one of them becomes the new leader.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flight: tp.Optional[_Flight[T]] = None
+
+    def do(self, func: tp.Callable[[], T]) -> T:
+        """
+        Runs the function or joins the call which is already in progress.
+        Reentrant calls from the leader thread (e.g. from the function itself) run the function directly.
+        :param func: function without arguments to run.
+        """
+
+        while True:
+            with self._lock:
+                flight = self._flight
+                is_leader = flight is None
+                if flight is None:
+                    flight = self._flight = _Flight()
+            if is_leader:
+                return self._lead(flight, func)
+            if flight.owner == threading.get_ident():
+                return func()
+            flight.done.wait()
+            if flight.completed:
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result  # type: ignore[return-value]
+
+    def _lead(self, flight: _Flight[T], func: tp.Callable[[], T]) -> T:
+        try:
+            flight.result = func()
+            flight.completed = True
+            return flight.result
+        except Exception as exc:
+            flight.error = exc
+            flight.completed = True
+            raise
+        finally:
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+
+
+class AsyncSingleFlight(tp.Generic[T]):
+    """
+    Coalesces concurrent calls across asyncio tasks: the first caller starts the coroutine in a separate task,
+    all callers (including the first one) await the shielded task.
+    Cancellation of any caller never cancels the shared task, so the other callers always get the result.
+    """
+
+    def __init__(self) -> None:
+        self._task: tp.Optional[asyncio.Task] = None
+
+    async def do(self, func: tp.Callable[[], tp.Awaitable[T]]) -> T:
+        """
+        Runs the coroutine function or joins the call which is already in progress in the running event loop.
+        Reentrant calls from the shared task itself run the coroutine function directly.
+        :param func: coroutine function without arguments to run.
+        """
+
+        task = self._task
+        if task is not None and task is asyncio.current_task():
+            return await func()
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._task = asyncio.ensure_future(func())
+            task.add_done_callback(self._forget)
+        return await asyncio.shield(task)
+
+    def _forget(self, task: asyncio.Task) -> None:
+        if self._task is task:
+            self._task = None
+        if not task.cancelled():
+            # Marks the exception as retrieved: all callers could have been cancelled.
+            task.exception()
+
+
+class LoopBridge:
+    """
+    Event loop running forever in a daemon thread. Lets synchronous code run coroutines
+    without creating and destroying an event loop per call (as `asyncio.run` does)
+    and works even if the calling thread already runs its own event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: tp.Optional[asyncio.AbstractEventLoop] = None
+        self._thread: tp.Optional[threading.Thread] = None
+
+    def run(self, coro: tp.Coroutine[tp.Any, tp.Any, T]) -> T:
+        """
+        Runs the coroutine in the bridge loop and blocks until it is done.
+        :param coro: coroutine to run.
+        """
+
+        loop = self._loop if self._loop is not None else self._start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise exceptions.RxConfError("LoopBridge.run can't be called from the bridge loop itself.")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """
+        Stops the loop and joins the thread. The bridge is restarted by the next `run` call.
+        """
+
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _start(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._serve, args=(loop,), name="rxconf-loop-bridge", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+
+class TriggerExecutor:
+    """
+    Runs synchronous triggers in a thread pool, off the request path.
+    Calls submitted to the same lane run one by one in the submission order. By default, all calls share
+    one lane (the same order as inline execution); with `parallel=True` every lane (trigger) has its own one,
+    so independent triggers run concurrently while each of them still sees the changes in order.
+    The queue is bounded: `submit` blocks while `max_queue_size` calls are pending (backpressure).
+    Exceptions of the calls are collected and raised by `wait`.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_size: int = 1024, parallel: bool = False) -> None:
+        """
+        :param max_workers: number of threads in the pool.
+        :param max_queue_size: maximum number of pending calls.
+        :param parallel: if True, calls of different lanes run concurrently.
+        """
+
+        if max_workers < 1 or max_queue_size < 1:
+            raise exceptions.RxConfError("max_workers and max_queue_size must be positive.")
+        self._parallel = parallel
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rxconf-trigger")
+        self._slots = threading.BoundedSemaphore(max_queue_size)
+        self._condition = threading.Condition()
+        self._lanes: tp.Dict[tp.Hashable, tp.Deque[tp.Callable[[], tp.Any]]] = {}
+        self._pending = 0
+        self._errors: tp.List[Exception] = []
+
+    def submit(self, lane: tp.Hashable, func: tp.Callable[[], tp.Any]) -> None:
+        """
+        Schedules the call. Blocks while the queue is full.
+        :param lane: ordering key, usually the trigger itself.
+        :param func: function without arguments to call.
+        """
+
+        self._slots.acquire()
+        key = lane if self._parallel else None
+        with self._condition:
+            self._pending += 1
+            queue = self._lanes.get(key)
+            if queue is not None:
+                queue.append(func)
+                return
+            self._lanes[key] = collections.deque([func])
+        self._pool.submit(self._drain, key)
+
+    def wait(self, timeout: tp.Optional[float] = None) -> None:
+        """
+        Waits until all submitted calls are done and raises the first collected exception, if any.
+        :param timeout: maximum time to wait in seconds. RxConfError is raised on timeout.
+        """
+
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._pending == 0, timeout=timeout):
+                raise exceptions.RxConfError(f"Triggers are not completed in {timeout} seconds.")
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def shutdown(self) -> None:
+        """
+        Waits for pending calls and stops the pool.
+        """
+
+        self._pool.shutdown(wait=True)
+
+    def _drain(self, key: tp.Hashable) -> None:
+        while True:
+            with self._condition:
+                queue = self._lanes[key]
+                if not queue:
+                    del self._lanes[key]
+                    return
+                func = queue.popleft()
+            try:
+                func()
+            except Exception as exc:
+                with self._condition:
+                    self._errors.append(exc)
+            finally:
+                self._slots.release()
+                with self._condition:
+                    self._pending -= 1
+                    self._condition.notify_all()
+
+
+class AsyncTriggerExecutor:
+    """
+    Runs asynchronous triggers as background tasks of the event loop, off the request path.
+    Has the same lanes, bounded queue and error semantics as `TriggerExecutor`.
+    The executor is bound to the event loop of the first `submit` (and rebound if that loop is closed).
+    Submitting from another running loop raises RxConfError: the caller could neither wait for a free slot
+    nor be tracked by `wait`. Synchronous callers should use `TriggerExecutor` instead.
+    """
+
+    def __init__(self, max_queue_size: int = 1024, parallel: bool = False) -> None:
+        """
+        :param max_queue_size: maximum number of pending calls.
+        :param parallel: if True, calls of different lanes run concurrently.
+        """
+
+        if max_queue_size < 1:
+            raise exceptions.RxConfError("max_queue_size must be positive.")
+        self._max_queue_size = max_queue_size
+        self._parallel = parallel
+        self._loop: tp.Optional[asyncio.AbstractEventLoop] = None
+        self._slots: tp.Optional[asyncio.Semaphore] = None
+        self._idle: tp.Optional[asyncio.Event] = None
+        self._lanes: tp.Dict[tp.Hashable, tp.Deque[tp.Callable[[], tp.Awaitable[tp.Any]]]] = {}
+        self._tasks: tp.Set[asyncio.Task] = set()
+        self._pending = 0
+        self._errors: tp.List[Exception] = []
+
+    async def submit(self, lane: tp.Hashable, func: tp.Callable[[], tp.Awaitable[tp.Any]]) -> None:
+        """
+        Schedules the call. Waits while the queue is full.
+        :param lane: ordering key, usually the trigger itself.
+        :param func: coroutine function without arguments to await.
+        """
+
+        loop = asyncio.get_running_loop()
+        bound_loop = self._loop if self._loop is not None and not self._loop.is_closed() else self._bind(loop)
+        if bound_loop is not loop:
+            raise exceptions.RxConfError("AsyncTriggerExecutor is bound to another running event loop.")
+        await self._slots.acquire()  # type: ignore[union-attr]
+        key = lane if self._parallel else None
+        self._pending += 1
+        self._idle.clear()  # type: ignore[union-attr]
+        queue = self._lanes.get(key)
+        if queue is not None:
+            queue.append(func)
+            return
+        self._lanes[key] = collections.deque([func])
+        task = loop.create_task(self._drain(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def wait(self) -> None:
+        """
+        Waits until all submitted calls are done and raises the first collected exception, if any.
+        """
+
+        if self._loop is None or self._idle is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.wait(), self._loop))
+            return
+        await self._idle.wait()
+        errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def shutdown(self) -> None:
+        """
+        Cancels pending calls.
+        """
+
+        if self._loop is None or self._loop.is_closed():
+            return
+        for task in list(self._tasks):
+            self._loop.call_soon_threadsafe(task.cancel)
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> asyncio.AbstractEventLoop:
+        self._loop = loop
+        self._slots = asyncio.Semaphore(self._max_queue_size)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._lanes = {}
+        self._pending = 0
+        return loop
+
+    async def _drain(self, key: tp.Hashable) -> None:
+        queue = self._lanes[key]
+        while queue:
+            func = queue.popleft()
+            try:
+                await func()
+            except Exception as exc:
+                self._errors.append(exc)
+            finally:
+                self._slots.release()  # type: ignore[union-attr]
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.set()  # type: ignore[union-attr]
+        del self._lanes[key]
+
+
+_loop_bridge = LoopBridge()
+
+
+def get_loop_bridge() -> LoopBridge:
+    """
+    Returns the loop bridge shared by the whole process.
+    """
+
+    return _loop_bridge
+
+
+_reload_executor: tp.Optional[concurrent.futures.ThreadPoolExecutor] = None
+_reload_executor_lock = threading.Lock()
+
+
+def get_reload_executor() -> concurrent.futures.Executor:
+    """
+    Returns the thread pool shared by the whole process for reloads of watched files.
+    Watch callbacks only schedule reloads there, so a slow file doesn't delay change delivery of the others.
+    """
+
+    global _reload_executor
+    with _reload_executor_lock:
+        if _reload_executor is None:
+            _reload_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="rxconf-reload")
+        return _reload_executor
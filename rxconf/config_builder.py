@@ -3,7 +3,7 @@ import pathlib
 import typing as tp
 
 from . import config_resolver as resolver
-from . import config_types
+from . import config_types, snapshots
 
 
 class MetaConfigTypeBuilder(metaclass=abc.ABCMeta):  # pragma: no cover
@@ -22,37 +22,75 @@ class MetaConfigTypeBuilder(metaclass=abc.ABCMeta):  # pragma: no cover
 class FileConfigTypeBuilder(MetaConfigTypeBuilder):
     """A builder for file-based config types."""
 
-    def __init__(self, config_resolver: resolver.FileConfigResolver) -> None:
+    def __init__(
+        self,
+        config_resolver: resolver.FileConfigResolver,
+        cache: tp.Optional[snapshots.SnapshotCache] = None,
+        lazy: bool = False,
+    ) -> None:
+        """
+        :param config_resolver: resolver of the config type by the file extension.
+        :param cache: optional on-disk snapshot cache. Files with cached content are not parsed.
+        :param lazy: build lazy attribute trees (check `attributes.LazyAttribute`).
+        """
+
         self._config_resolver: resolver.FileConfigResolver = config_resolver
+        self._cache = cache
+        self._lazy = lazy
 
     def build(
         self: "FileConfigTypeBuilder",
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
-    ) -> config_types.FileConfigType:
+        previous: tp.Optional[config_types.MetaConfigType] = None,
+    ) -> config_types.MetaConfigType:
         """
         Build a file-based config type.
         :param path: The path to the file on local filesystem.
         :param encoding: The encoding to use when reading the file.
+        :param previous: The previously built config type. Reused if the file content has not changed.
         """
 
-        return self._config_resolver.resolve(path=path).load_from_path(
-            path=path,
-            encoding=encoding,
-        )
+        config_type = self._config_resolver.resolve(path=path)
+        if self._cache is not None:
+            return self._cache.load(
+                path=path,
+                encoding=encoding,
+                config_type=config_type,
+                previous=previous,
+                lazy=self._lazy,
+            )
+        if not isinstance(previous, config_types.FileConfigType):
+            return config_type.load_from_path(path=path, encoding=encoding, lazy=self._lazy)
+        return config_type.load_from_path(path=path, encoding=encoding, previous=previous, lazy=self._lazy)
 
     async def build_async(
         self,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
-    ) -> config_types.FileConfigType:
+        previous: tp.Optional[config_types.MetaConfigType] = None,
+    ) -> config_types.MetaConfigType:
         """
         Build a file-based config type asynchronously.
         :param path: The path to the file on local filesystem.
         :param encoding: The encoding to use when reading the file.
+        :param previous: The previously built config type. Reused if the file content has not changed.
         """
 
-        return await self._config_resolver.resolve(path=path).load_from_path_async(
+        config_type = self._config_resolver.resolve(path=path)
+        if self._cache is not None:
+            return await self._cache.load_async(
+                path=path,
+                encoding=encoding,
+                config_type=config_type,
+                previous=previous,
+                lazy=self._lazy,
+            )
+        if not isinstance(previous, config_types.FileConfigType):
+            return await config_type.load_from_path_async(path=path, encoding=encoding, lazy=self._lazy)
+        return await config_type.load_from_path_async(
             path=path,
             encoding=encoding,
+            previous=previous,
+            lazy=self._lazy,
         )
@@ -1,6 +1,8 @@
 import abc
 import datetime
+import hashlib
 import importlib
+import io
 import os
 import pathlib
 import sys
@@ -47,11 +49,76 @@ def requires_libraries(*libs: str) -> tp.Callable[[tp.Type], tp.Type]:
     return check_imports
 
 
+AttributeT = tp.TypeVar("AttributeT", bound=attributes.AttributeType)
+
+
+def _previous_child(
+    previous: tp.Optional[attributes.AttributeType],
+    key: tp.Union[str, int],
+) -> tp.Optional[attributes.AttributeType]:
+    """
+    Returns the node of the previous tree at the same position (mapping key or list index), if any.
+    """
+
+    if previous is None:
+        return None
+    value = object.__getattribute__(previous, "_AttributeType__value")
+    if isinstance(value, attributes.AttributeMap) and isinstance(key, str):
+        return value.get(key)
+    if isinstance(value, list) and isinstance(key, int) and key < len(value):
+        return value[key]
+    return None
+
+
+def _share(
+    attribute_type: tp.Type[AttributeT],
+    value: tp.Any,
+    previous: tp.Optional[attributes.AttributeType],
+) -> AttributeT:
+    """
+    Structural sharing: returns the node of the previous tree if its subtree is unchanged, otherwise a new node.
+    Children are processed first, so a mapping or a list is unchanged when all of its children are reused
+    (equal subtree hashes), and a scalar is unchanged when it has the same type and value.
+    Only the changed spine is allocated on reload, unchanged sections keep their identity.
+    """
+
+    if type(previous) is attribute_type and _is_unchanged(previous, value):
+        return previous
+    return attribute_type(value=value)
+
+
+def _is_unchanged(previous: attributes.AttributeType, value: tp.Any) -> bool:
+    previous_value = object.__getattribute__(previous, "_AttributeType__value")
+    if isinstance(value, dict):
+        return (
+            isinstance(previous_value, attributes.AttributeMap)
+            and previous_value.keys() == value.keys()
+            and all(value[key] is previous_value[key] for key in value)
+        )
+    if type(previous_value) is not type(value):
+        return False
+    if isinstance(value, list):
+        return len(previous_value) == len(value) and all(item is previous_value[i] for i, item in enumerate(value))
+    if isinstance(value, set):
+        return hashtools.get_subtree_hash(previous) == hashtools.compute_node_hash(value)
+    return previous_value == value
+
+
+# Upper bound of memoized missing paths per config: arbitrary (e.g. user-supplied) missing paths don't grow memory.
+_MISSING_PATHS_LIMIT: tp.Final[int] = 256
+
+
 class MetaConfigType(metaclass=abc.ABCMeta):  # pragma: no cover
     """
     Metaclass for all config types. It provides basic methods for config types.
     """
 
+    _digest: tp.Optional[bytes] = None
+    # Dotted path -> node. Filled on demand by `lookup`, lives and dies with the config (which is immutable).
+    _path_index: tp.Optional[tp.Dict[str, attributes.AttributeType]] = None
+    # Missing dotted paths, at most `_MISSING_PATHS_LIMIT` of them.
+    _missing_paths: tp.Optional[tp.Set[str]] = None
+
     @abc.abstractmethod
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError()
@@ -65,6 +132,53 @@ class MetaConfigType(metaclass=abc.ABCMeta):  # pragma: no cover
 
         raise NotImplementedError()
 
+    @property
+    def digest(self) -> tp.Optional[bytes]:
+        """
+        Digest of the raw config content. Cheap equality key: equal digests guarantee equal configs.
+        None if the config is not loaded from raw content (environment, Vault, etc.).
+        """
+
+        return self._digest
+
+    def lookup(self, path: str, default: tp.Any = None) -> tp.Any:
+        """
+        Returns the attribute at the dotted path or the default value if there is no such attribute.
+        Resolved paths are memoized in the path index, so repeated lookups cost a single dict lookup.
+        Misses are memoized up to `_MISSING_PATHS_LIMIT` paths, so arbitrary missing paths don't grow the memory.
+        The memoized values are deterministic, so racing lookups store the same values and need no lock.
+        :param path: dotted path to the attribute. Case-insensitive. Integer segments index lists.
+        Example: "db.replicas.0.host".
+        :param default: value returned if the path doesn't exist.
+        """
+
+        index = self._path_index
+        if index is None:
+            index = self._path_index = {}
+        node = index.get(path)
+        if node is not None:
+            return node
+        missing = self._missing_paths
+        if missing is not None and path in missing:
+            return default
+        node = self._root
+        for segment in path.lower().split("."):
+            value = object.__getattribute__(node, "_AttributeType__value")
+            if isinstance(value, attributes.AttributeMap):
+                node = value.get(segment)
+            elif isinstance(value, list) and segment.isdigit() and int(segment) < len(value):
+                node = value[int(segment)]
+            else:
+                node = None
+            if node is None:
+                if missing is None:
+                    missing = self._missing_paths = set()
+                if len(missing) < _MISSING_PATHS_LIMIT:
+                    missing.add(path)
+                return default
+        index[path] = node
+        return node
+
     @exceptions.handle_unknown_exception
     def __getattr__(self, item: str) -> tp.Any:
         """
@@ -178,27 +292,30 @@ class VaultConfig(VaultConfigType):
 
     @classmethod
     @exceptions.handle_unknown_exception
-    def _process_data(cls, data: tp.Any) -> attributes.VaultAttribute:
+    def _process_data(
+        cls,
+        data: tp.Any,
+        previous: tp.Optional[attributes.AttributeType] = None,
+    ) -> attributes.VaultAttribute:
         """
         Data processing method for Vault config. Works recursively. Converts all keys to lowercase.
         :param data: data with optional inner structures to process.
         """
 
         if isinstance(data, dict):
-            return attributes.VaultAttribute(value={k.lower(): cls._process_data(v) for k, v in data.items()})
+            return _share(
+                attributes.VaultAttribute,
+                {k.lower(): cls._process_data(v, _previous_child(previous, k.lower())) for k, v in data.items()},
+                previous,
+            )
         if isinstance(data, list):
-            return attributes.VaultAttribute(
-                value=[
-                    (
-                        cls._process_data(item)
-                        if not isinstance(item, dict)
-                        else attributes.VaultAttribute(value={k.lower(): cls._process_data(v) for k, v in item.items()})
-                    )
-                    for item in data
-                ]
+            return _share(
+                attributes.VaultAttribute,
+                [cls._process_data(item, _previous_child(previous, i)) for i, item in enumerate(data)],
+                previous,
             )
         if isinstance(data, (bool, int, str, float, type(None))):
-            return attributes.VaultAttribute(value=data)
+            return _share(attributes.VaultAttribute, data, previous)
         raise exceptions.BrokenConfigSchemaError(f"Unsupported data type: {type(data)}")  # pragma: no cover
 
     @exceptions.handle_unknown_exception
@@ -243,11 +360,16 @@ class FileConfigType(MetaConfigType, metaclass=abc.ABCMeta):  # pragma: no cover
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional["FileConfigType"] = None,
+        lazy: bool = False,
     ) -> "FileConfigType":
         """
         Load file config from the local filesystem synchronously.
         :param path: path to the config file.
         :param encoding: file encoding (utf-8, cp1251, etc.).
+        :param previous: previously loaded config. Returned as is if the raw content has the same digest.
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`): nested attributes
+        are created on first access and hashes are computed on demand. Unchanged subtrees are not shared.
         """
 
         raise NotImplementedError()
@@ -258,15 +380,65 @@ class FileConfigType(MetaConfigType, metaclass=abc.ABCMeta):  # pragma: no cover
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional["FileConfigType"] = None,
+        lazy: bool = False,
     ) -> "FileConfigType":
         """
         Load file config from the local filesystem asynchronously.
         :param path: path to the config file.
         :param encoding: file encoding (utf-8, cp1251, etc.).
+        :param previous: previously loaded config. Returned as is if the raw content has the same digest.
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`): nested attributes
+        are created on first access and hashes are computed on demand. Unchanged subtrees are not shared.
         """
 
         raise NotImplementedError()
 
+    @classmethod
+    def _read_raw(cls, path: tp.Union[str, pathlib.PurePath]) -> bytes:
+        if not os.path.isfile(str(path)):
+            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
+        with open(str(path), mode="rb") as file:
+            return file.read()
+
+    @classmethod
+    async def _read_raw_async(cls, path: tp.Union[str, pathlib.PurePath]) -> bytes:
+        if not os.path.isfile(str(path)):
+            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
+        async with aiofiles.open(str(path), mode="rb") as file:
+            return await file.read()
+
+    @classmethod
+    def _compute_digest(cls, raw: bytes, encoding: str) -> bytes:
+        """
+        Fast digest of the raw content. Config type and encoding are mixed in,
+        because the same bytes may produce different configs with another parser or encoding.
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{cls.__module__}.{cls.__qualname__}:{encoding}:".encode())
+        digest.update(raw)
+        return digest.digest()
+
+    @classmethod
+    def _previous_root(cls, previous: tp.Optional["FileConfigType"]) -> tp.Optional[attributes.AttributeType]:
+        """
+        Root of the previously loaded config of the same type: its unchanged subtrees are reused by the new tree.
+        Lazy trees are skipped: sharing would materialize them.
+        """
+
+        if not isinstance(previous, cls) or isinstance(previous._root, attributes.LazyAttribute):
+            return None
+        return previous._root
+
+    @staticmethod
+    def _decode(raw: bytes, encoding: str) -> str:
+        """
+        Decodes raw content exactly like a file opened in text mode does (with universal newlines).
+        """
+
+        return io.TextIOWrapper(io.BytesIO(raw), encoding=encoding).read()
+
     def __repr__(self) -> str:
         """
         String representation of the config. Uses the root attribute representation.
@@ -283,17 +455,19 @@ class YamlConfig(FileConfigType):
     """
 
     _allowed_extensions: tp.Final[frozenset] = frozenset({".yaml", ".yml"})
-    _root: tp.Final[attributes.YamlAttribute]
+    _root: tp.Final[attributes.AttributeType]
     _path: tp.Final[pathlib.PurePath]
 
     def __init__(
         self: "YamlConfig",
-        root_attribute: attributes.YamlAttribute,
+        root_attribute: attributes.AttributeType,
         path: pathlib.PurePath,
+        digest: tp.Optional[bytes] = None,
     ) -> None:
         self._root = root_attribute
         self._path = path
-        self._hash = hashtools.compute_conf_hash(root_attribute)
+        self._hash: tp.Optional[int] = None
+        self._digest = digest
 
     @property
     def allowed_extensions(self) -> tp.FrozenSet[str]:
@@ -301,6 +475,8 @@ class YamlConfig(FileConfigType):
 
     @property
     def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
         return self._hash
 
     @classmethod
@@ -316,17 +492,23 @@ class YamlConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "YamlConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        with open(str(path), encoding=encoding) as file:
-            yaml_data = cls._load_yaml_data(file.read(), path)
+        raw = cls._read_raw(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        yaml_data = cls._load_yaml_data(cls._decode(raw, encoding), path)
 
         return cls(
             root_attribute=(
-                cls._process_data(yaml_data) if yaml_data is not None else attributes.YamlAttribute(value={})
+                cls._process_data(yaml_data, previous=cls._previous_root(previous), lazy=lazy)
+                if yaml_data is not None
+                else attributes.YamlAttribute(value={})
             ),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @classmethod
@@ -335,46 +517,62 @@ class YamlConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "YamlConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        async with aiofiles.open(str(path), mode="r", encoding=encoding) as file:
-            content = await file.read()
-            yaml_data = cls._load_yaml_data(content, path)
+        raw = await cls._read_raw_async(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        yaml_data = cls._load_yaml_data(cls._decode(raw, encoding), path)
 
         return cls(
             root_attribute=(
-                cls._process_data(yaml_data) if yaml_data is not None else attributes.YamlAttribute(value={})
+                cls._process_data(yaml_data, previous=cls._previous_root(previous), lazy=lazy)
+                if yaml_data is not None
+                else attributes.YamlAttribute(value={})
             ),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @exceptions.handle_unknown_exception
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MetaConfigType):
             raise TypeError("MetaConfigType is comparable only to MetaConfigType")
-        return self._hash == other.hash
+        return self.hash == other.hash
 
     @classmethod
     @exceptions.handle_unknown_exception
-    def _process_data(cls, data: tp.Any) -> attributes.YamlAttribute:
+    def _process_data(
+        cls,
+        data: tp.Any,
+        previous: tp.Optional[attributes.AttributeType] = None,
+        lazy: bool = False,
+    ) -> attributes.AttributeType:
+        if lazy:
+            return attributes.LazyAttribute(value=data, convert=cls._convert_scalar)
         if isinstance(data, dict):
-            return attributes.YamlAttribute(value={k.lower(): cls._process_data(v) for k, v in data.items()})
+            return _share(
+                attributes.YamlAttribute,
+                {k.lower(): cls._process_data(v, _previous_child(previous, k.lower())) for k, v in data.items()},
+                previous,
+            )
         if isinstance(data, list):
-            return attributes.YamlAttribute(
-                value=[
-                    (
-                        cls._process_data(item)
-                        if not isinstance(item, dict)
-                        else attributes.YamlAttribute(value={k.lower(): cls._process_data(v) for k, v in item.items()})
-                    )
-                    for item in data
-                ]
+            return _share(
+                attributes.YamlAttribute,
+                [cls._process_data(item, _previous_child(previous, i)) for i, item in enumerate(data)],
+                previous,
             )
         if isinstance(data, set):
-            return attributes.YamlAttribute(value={cls._process_data(item) for item in data})  # pragma: no cover
+            items = {cls._process_data(item) for item in data}  # pragma: no cover
+            return _share(attributes.YamlAttribute, items, previous)  # pragma: no cover
+        return _share(attributes.YamlAttribute, cls._convert_scalar(data), previous)
+
+    @staticmethod
+    def _convert_scalar(data: tp.Any) -> tp.Any:
         if isinstance(data, (bool, int, str, float, type(None), datetime.date, datetime.datetime)):
-            return attributes.YamlAttribute(value=data)
+            return data
         raise exceptions.BrokenConfigSchemaError(f"Unsupported data type: {type(data)}")  # pragma: no cover
 
 
@@ -386,17 +584,19 @@ class JsonConfig(FileConfigType):
     """
 
     _allowed_extensions: tp.Final[frozenset] = frozenset({".json"})
-    _root: tp.Final[attributes.JsonAttribute]
+    _root: tp.Final[attributes.AttributeType]
     _path: tp.Final[pathlib.PurePath]
 
     def __init__(
         self: "JsonConfig",
-        root_attribute: attributes.JsonAttribute,
+        root_attribute: attributes.AttributeType,
         path: pathlib.PurePath,
+        digest: tp.Optional[bytes] = None,
     ) -> None:
         self._root = root_attribute
         self._path = path
-        self._hash = hashtools.compute_conf_hash(root_attribute)
+        self._hash: tp.Optional[int] = None
+        self._digest = digest
 
     @property
     def allowed_extensions(self) -> tp.FrozenSet[str]:
@@ -404,6 +604,8 @@ class JsonConfig(FileConfigType):
 
     @property
     def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
         return self._hash
 
     @classmethod
@@ -419,16 +621,19 @@ class JsonConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "JsonConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        with open(str(path), encoding=encoding) as file:
-            content = file.read()
-            json_data = cls._load_json_data(content, path)
+        raw = cls._read_raw(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        json_data = cls._load_json_data(cls._decode(raw, encoding), path)
 
         return cls(
-            root_attribute=cls._process_data(json_data),
+            root_attribute=cls._process_data(json_data, previous=cls._previous_root(previous), lazy=lazy),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @classmethod
@@ -437,44 +642,59 @@ class JsonConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "JsonConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        async with aiofiles.open(str(path), mode="r", encoding=encoding) as file:
-            content = await file.read()
-            json_data = cls._load_json_data(content, path)
+        raw = await cls._read_raw_async(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        json_data = cls._load_json_data(cls._decode(raw, encoding), path)
 
         return cls(
             root_attribute=(
-                cls._process_data(json_data) if json_data is not None else attributes.JsonAttribute(value={})
+                cls._process_data(json_data, previous=cls._previous_root(previous), lazy=lazy)
+                if json_data is not None
+                else attributes.JsonAttribute(value={})
             ),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @exceptions.handle_unknown_exception
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MetaConfigType):
             raise TypeError("MetaConfigType is comparable only to MetaConfigType")
-        return self._hash == other.hash
+        return self.hash == other.hash
 
     @classmethod
     @exceptions.handle_unknown_exception
-    def _process_data(cls, data: tp.Any) -> attributes.JsonAttribute:
+    def _process_data(
+        cls,
+        data: tp.Any,
+        previous: tp.Optional[attributes.AttributeType] = None,
+        lazy: bool = False,
+    ) -> attributes.AttributeType:
+        if lazy:
+            return attributes.LazyAttribute(value=data, convert=cls._convert_scalar)
         if isinstance(data, dict):
-            return attributes.JsonAttribute(value={k.lower(): cls._process_data(v) for k, v in data.items()})
+            return _share(
+                attributes.JsonAttribute,
+                {k.lower(): cls._process_data(v, _previous_child(previous, k.lower())) for k, v in data.items()},
+                previous,
+            )
         if isinstance(data, list):
-            return attributes.JsonAttribute(
-                value=[
-                    (
-                        cls._process_data(item)
-                        if not isinstance(item, dict)
-                        else attributes.JsonAttribute(value={k.lower(): cls._process_data(v) for k, v in item.items()})
-                    )
-                    for item in data
-                ]
+            return _share(
+                attributes.JsonAttribute,
+                [cls._process_data(item, _previous_child(previous, i)) for i, item in enumerate(data)],
+                previous,
             )
+        return _share(attributes.JsonAttribute, cls._convert_scalar(data), previous)
+
+    @staticmethod
+    def _convert_scalar(data: tp.Any) -> tp.Any:
         if isinstance(data, (bool, int, str, float, type(None))):
-            return attributes.JsonAttribute(value=data)
+            return data
         raise exceptions.BrokenConfigSchemaError(f"Unsupported data type: {type(data)}")  # pragma: no cover
 
 
@@ -486,17 +706,19 @@ class TomlConfig(FileConfigType):
     """
 
     _allowed_extensions: tp.Final[frozenset] = frozenset({".toml"})
-    _root: tp.Final[attributes.TomlAttribute]
+    _root: tp.Final[attributes.AttributeType]
     _path: tp.Final[pathlib.PurePath]
 
     def __init__(
         self: "TomlConfig",
-        root_attribute: attributes.TomlAttribute,
+        root_attribute: attributes.AttributeType,
         path: pathlib.PurePath,
+        digest: tp.Optional[bytes] = None,
     ) -> None:
         self._root = root_attribute
         self._path = path
-        self._hash = hashtools.compute_conf_hash(root_attribute)
+        self._hash: tp.Optional[int] = None
+        self._digest = digest
 
     @property
     def allowed_extensions(self) -> tp.FrozenSet[str]:
@@ -504,6 +726,8 @@ class TomlConfig(FileConfigType):
 
     @property
     def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
         return self._hash
 
     @classmethod
@@ -526,16 +750,19 @@ class TomlConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "TomlConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        with open(str(path), "r", encoding=encoding) as file:
-            content = file.read()
-            toml_data = cls._load_toml_data(content, path)
+        raw = cls._read_raw(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        toml_data = cls._load_toml_data(cls._decode(raw, encoding), path)
 
         return cls(
-            root_attribute=cls._process_data(toml_data),
+            root_attribute=cls._process_data(toml_data, previous=cls._previous_root(previous), lazy=lazy),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @classmethod
@@ -544,42 +771,55 @@ class TomlConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "TomlConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        async with aiofiles.open(str(path), "r", encoding=encoding) as file:
-            content = await file.read()
-            toml_data = cls._load_toml_data(content, path)
+        raw = await cls._read_raw_async(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        toml_data = cls._load_toml_data(cls._decode(raw, encoding), path)
 
         return cls(
-            root_attribute=cls._process_data(toml_data),
+            root_attribute=cls._process_data(toml_data, previous=cls._previous_root(previous), lazy=lazy),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @exceptions.handle_unknown_exception
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MetaConfigType):
             raise TypeError("MetaConfigType is comparable only to MetaConfigType")
-        return self._hash == other.hash
+        return self.hash == other.hash
 
     @classmethod
     @exceptions.handle_unknown_exception
-    def _process_data(cls, data: tp.Any) -> attributes.TomlAttribute:
+    def _process_data(
+        cls,
+        data: tp.Any,
+        previous: tp.Optional[attributes.AttributeType] = None,
+        lazy: bool = False,
+    ) -> attributes.AttributeType:
+        if lazy:
+            return attributes.LazyAttribute(value=data, convert=cls._convert_scalar)
         if isinstance(data, dict):
-            return attributes.TomlAttribute(value={k.lower(): cls._process_data(v) for k, v in data.items()})
+            return _share(
+                attributes.TomlAttribute,
+                {k.lower(): cls._process_data(v, _previous_child(previous, k.lower())) for k, v in data.items()},
+                previous,
+            )
         if isinstance(data, list):
-            return attributes.TomlAttribute(
-                value=[
-                    (
-                        cls._process_data(item)
-                        if not isinstance(item, dict)
-                        else attributes.TomlAttribute(value={k.lower(): cls._process_data(v) for k, v in item.items()})
-                    )
-                    for item in data
-                ]
+            return _share(
+                attributes.TomlAttribute,
+                [cls._process_data(item, _previous_child(previous, i)) for i, item in enumerate(data)],
+                previous,
             )
+        return _share(attributes.TomlAttribute, cls._convert_scalar(data), previous)
+
+    @staticmethod
+    def _convert_scalar(data: tp.Any) -> tp.Any:
         if isinstance(data, (bool, int, str, float, datetime.date, datetime.datetime)):
-            return attributes.TomlAttribute(value=data)
+            return data
         raise exceptions.BrokenConfigSchemaError(f"Unsupported data type: {type(data)}")  # pragma: no cover
 
 
@@ -591,17 +831,19 @@ class IniConfig(FileConfigType):
     """
 
     _allowed_extensions: tp.Final[frozenset] = frozenset({".ini"})
-    _root: tp.Final[attributes.IniAttribute]
+    _root: tp.Final[attributes.AttributeType]
     _path: tp.Final[pathlib.PurePath]
 
     def __init__(
         self: "IniConfig",
-        root_attribute: attributes.IniAttribute,
+        root_attribute: attributes.AttributeType,
         path: pathlib.PurePath,
+        digest: tp.Optional[bytes] = None,
     ) -> None:
         self._root = root_attribute
         self._path = path
-        self._hash = hashtools.compute_conf_hash(root_attribute)
+        self._hash: tp.Optional[int] = None
+        self._digest = digest
 
     @property
     def allowed_extensions(self) -> tp.FrozenSet[str]:
@@ -609,6 +851,8 @@ class IniConfig(FileConfigType):
 
     @property
     def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
         return self._hash
 
     @classmethod
@@ -636,16 +880,19 @@ class IniConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "IniConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        with open(str(path), mode="r", encoding=encoding) as file:
-            content = file.read()
-            ini_data = cls._load_ini_data(content, path)
+        raw = cls._read_raw(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        ini_data = cls._load_ini_data(cls._decode(raw, encoding), path)
 
         return cls(
-            root_attribute=cls._process_data(ini_data),
+            root_attribute=cls._process_data(ini_data, previous=cls._previous_root(previous), lazy=lazy),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @classmethod
@@ -654,31 +901,49 @@ class IniConfig(FileConfigType):
         cls,
         path: tp.Union[str, pathlib.PurePath],
         encoding: str,
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "IniConfig":
-        if not os.path.isfile(str(path)):
-            raise exceptions.ConfigNotFoundError(f"Config file not found: {path}")
-        async with aiofiles.open(str(path), mode="r", encoding=encoding) as file:
-            content = await file.read()
-            ini_data = cls._load_ini_data(content, path)
+        raw = await cls._read_raw_async(path)
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        ini_data = cls._load_ini_data(cls._decode(raw, encoding), path)
 
         return cls(
-            root_attribute=cls._process_data(ini_data),
+            root_attribute=cls._process_data(ini_data, previous=cls._previous_root(previous), lazy=lazy),
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @exceptions.handle_unknown_exception
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MetaConfigType):
             raise TypeError("MetaConfigType is comparable only to MetaConfigType")
-        return self._hash == other.hash
+        return self.hash == other.hash
 
     @classmethod
     @exceptions.handle_unknown_exception
-    def _process_data(cls, data: tp.Any) -> attributes.IniAttribute:
+    def _process_data(
+        cls,
+        data: tp.Any,
+        previous: tp.Optional[attributes.AttributeType] = None,
+        lazy: bool = False,
+    ) -> attributes.AttributeType:
+        if lazy:
+            return attributes.LazyAttribute(value=data, convert=cls._convert_scalar)
         if isinstance(data, dict):
-            return attributes.IniAttribute(value={k.lower(): cls._process_data(v) for k, v in data.items()})
+            return _share(
+                attributes.IniAttribute,
+                {k.lower(): cls._process_data(v, _previous_child(previous, k.lower())) for k, v in data.items()},
+                previous,
+            )
+        return _share(attributes.IniAttribute, cls._convert_scalar(data), previous)
+
+    @staticmethod
+    def _convert_scalar(data: tp.Any) -> tp.Any:
         if isinstance(data, str):
-            return attributes.IniAttribute(value=_types.map_primitive(data))
+            return _types.map_primitive(data)
         raise exceptions.BrokenConfigSchemaError(f"Unsupported data type: {type(data)}")  # pragma: no cover
 
 
@@ -688,11 +953,11 @@ class EnvConfig(MetaConfigType):
     Uses os.environ to get environment variables.
     """
 
-    _root: tp.Final[attributes.EnvAttribute]
+    _root: tp.Final[attributes.AttributeType]
 
-    def __init__(self: "EnvConfig", root_attribute: attributes.EnvAttribute) -> None:
+    def __init__(self: "EnvConfig", root_attribute: attributes.AttributeType) -> None:
         self._root = root_attribute
-        self._hash = hashtools.compute_conf_hash(root_attribute)
+        self._hash: tp.Optional[int] = None
 
     def __repr__(self) -> str:
         return repr(self._root)
@@ -701,7 +966,7 @@ class EnvConfig(MetaConfigType):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MetaConfigType):
             raise TypeError("MetaConfigType is comparable only to MetaConfigType")
-        return self._hash == other.hash
+        return self.hash == other.hash
 
     @classmethod
     @exceptions.handle_unknown_exception
@@ -725,13 +990,25 @@ class EnvConfig(MetaConfigType):
 
     @property
     def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
         return self._hash
 
     @classmethod
     @exceptions.handle_unknown_exception
-    def _process_data(cls, data: tp.Dict[str, str]) -> attributes.EnvAttribute:
-        processed_data = {k.lower(): attributes.EnvAttribute(value=_types.map_primitive(v)) for k, v in data.items()}
-        return attributes.EnvAttribute(value=processed_data)
+    def _process_data(
+        cls,
+        data: tp.Dict[str, str],
+        previous: tp.Optional[attributes.AttributeType] = None,
+        lazy: bool = False,
+    ) -> attributes.AttributeType:
+        if lazy:
+            return attributes.LazyAttribute(value=data, convert=_types.map_primitive)
+        processed_data = {
+            k.lower(): _share(attributes.EnvAttribute, _types.map_primitive(v), _previous_child(previous, k.lower()))
+            for k, v in data.items()
+        }
+        return _share(attributes.EnvAttribute, processed_data, previous)
 
 
 class DotenvConfig(FileConfigType, EnvConfig):
@@ -745,18 +1022,20 @@ class DotenvConfig(FileConfigType, EnvConfig):
 
     def __init__(
         self: "DotenvConfig",
-        root_attribute: attributes.EnvAttribute,
+        root_attribute: attributes.AttributeType,
         path: pathlib.PurePath,
+        digest: tp.Optional[bytes] = None,
     ) -> None:
         self._root = root_attribute  # type: ignore
         self._path = path
-        self._hash = hashtools.compute_conf_hash(root_attribute)
+        self._hash: tp.Optional[int] = None
+        self._digest = digest
 
     @exceptions.handle_unknown_exception
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MetaConfigType):
             raise TypeError("MetaConfigType is comparable only to MetaConfigType")
-        return self._hash == other.hash
+        return self.hash == other.hash
 
     @property
     def allowed_extensions(self) -> tp.FrozenSet[str]:
@@ -764,6 +1043,8 @@ class DotenvConfig(FileConfigType, EnvConfig):
 
     @property
     def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
         return self._hash
 
     @classmethod
@@ -772,13 +1053,21 @@ class DotenvConfig(FileConfigType, EnvConfig):
         cls,
         path: tp.Union[str, pathlib.PurePath] = ".env",
         encoding: str = "utf-8",
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> FileConfigType:
-        dotenv_values = dotenv.dotenv_values(dotenv_path=path, encoding=encoding)
+        # Missing dotenv file is treated as an empty one (python-dotenv behavior).
+        raw = cls._read_raw(path) if os.path.isfile(str(path)) else b""
+        digest = cls._compute_digest(raw, encoding)
+        if isinstance(previous, cls) and previous.digest == digest:
+            return previous
+        dotenv_values = dotenv.dotenv_values(stream=io.StringIO(cls._decode(raw, encoding)))
         processed_values = {key.lower(): value for key, value in dotenv_values.items() if value is not None}
-        root_attribute = cls._process_data(processed_values)
+        root_attribute = cls._process_data(processed_values, previous=cls._previous_root(previous), lazy=lazy)
         return cls(
             root_attribute=root_attribute,
             path=path if isinstance(path, pathlib.PurePath) else pathlib.PurePath(path),
+            digest=digest,
         )
 
     @classmethod
@@ -787,13 +1076,97 @@ class DotenvConfig(FileConfigType, EnvConfig):
         cls,
         path: tp.Union[str, pathlib.PurePath] = ".env",
         encoding: str = "utf-8",
+        previous: tp.Optional[FileConfigType] = None,
+        lazy: bool = False,
     ) -> "FileConfigType":
         return cls.load_from_path(
             path=path,
             encoding=encoding,
+            previous=previous,
+            lazy=lazy,
         )
 
 
+class LayeredConfig(MetaConfigType):
+    """
+    Config merged from an ordered list of configs (layers). Later layers override earlier ones.
+    With the deep merge, mappings present in both layers are merged recursively and other values
+    (scalars, lists, sets) are replaced as a whole. Without it, only top-level keys are merged.
+    Nodes of the layers are not copied: the merged tree references them and allocates only the merged mappings.
+    """
+
+    _root: tp.Final[attributes.AttributeType]
+
+    def __init__(self: "LayeredConfig", root_attribute: attributes.AttributeType) -> None:
+        self._root = root_attribute
+        self._hash: tp.Optional[int] = None
+
+    def __repr__(self) -> str:
+        return repr(self._root)
+
+    @exceptions.handle_unknown_exception
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MetaConfigType):
+            raise TypeError("MetaConfigType is comparable only to MetaConfigType")
+        return self.hash == other.hash
+
+    @property
+    def hash(self) -> int:
+        if self._hash is None:
+            self._hash = hashtools.compute_conf_hash(self._root)
+        return self._hash
+
+    @classmethod
+    @exceptions.handle_unknown_exception
+    def merge(
+        cls,
+        base: MetaConfigType,
+        overlay: MetaConfigType,
+        deep_merge: bool = True,
+        previous: tp.Optional["LayeredConfig"] = None,
+    ) -> "LayeredConfig":
+        """
+        Merges two configs.
+        :param base: config with lower priority.
+        :param overlay: config with higher priority.
+        :param deep_merge: if True, nested mappings are merged recursively; otherwise top-level keys are replaced.
+        :param previous: previous result of the same merge. Its unchanged merged mappings are reused.
+        """
+
+        return cls(
+            root_attribute=_merge(
+                base._root,
+                overlay._root,
+                previous=previous._root if previous is not None else None,
+                deep_merge=deep_merge,
+            )
+        )
+
+
+def _merge(
+    base: attributes.AttributeType,
+    overlay: attributes.AttributeType,
+    previous: tp.Optional[attributes.AttributeType],
+    deep_merge: bool,
+) -> attributes.AttributeType:
+    """
+    Merges the overlay mapping into the base one, the overlay wins. Non-mapping overlay values replace base ones.
+    """
+
+    base_value = object.__getattribute__(base, "_AttributeType__value")
+    overlay_value = object.__getattribute__(overlay, "_AttributeType__value")
+    if not isinstance(base_value, attributes.AttributeMap) or not isinstance(overlay_value, attributes.AttributeMap):
+        return overlay
+    merged = dict(base_value)
+    for key, child in overlay_value.items():
+        base_child = base_value.get(key)
+        if base_child is not None and deep_merge:
+            merged[key] = _merge(base_child, child, _previous_child(previous, key), deep_merge=deep_merge)
+        else:
+            merged[key] = child
+    return _share(type(overlay), merged, previous)
+
+
 # Default (supported natively) config types. Extend this tuple to add custom config types.
 # Do not try to override this variable. It is constant.
 BASE_FILE_CONFIG_TYPES: tp.Final[tp.Tuple[tp.Type[FileConfigType], ...]] = (
@@ -1,7 +1,10 @@
 import typing as tp
+from collections.abc import Mapping
 from hashlib import sha256
 
-from . import attributes
+
+if tp.TYPE_CHECKING:  # pragma: no cover
+    from . import attributes
 
 
 def _hash_with_type(value: tp.Any) -> str:
@@ -30,40 +33,56 @@ HASHED_STRUCTURES: tp.Final[dict[str, int]] = {
 }
 
 
-def compute_conf_hash(attribute: attributes.AttributeType, hash_sum: int = 0) -> int:
+def compute_node_hash(value: tp.Any) -> int:
     """
-    Compute the hash of the given attribute.
-    The hash is computed by hashing the type and value of the attribute.
-    Works recursively for nested attributes.
+    Compute the subtree hash of an attribute from its value.
+    Nested attributes are not traversed: their own subtree hashes (computed when they were created) are reused,
+    so the whole tree is hashed in the same pass that builds it (Merkle tree).
+    The hash is computed by hashing the type and value, so `1`, `1.0` and `True` are different.
     """
 
-    # Name mangling to access the private value of the attribute.
-    # Reason: AttributeType overrides all magic methods and provide abstraction for the value.
-    # User do not have direct access to the value of the attribute.
-    value = attribute.__getattribute__("_AttributeType__value")
-    if isinstance(value, dict):
-        for key in value:
-            val_sum = compute_conf_hash(value[key], 0)
-            val_sum = _hash_to_int(_hash_with_type(val_sum))
+    if isinstance(value, Mapping):
+        hash_sum = 0
+        for key, child in value.items():
+            val_sum = _hash_to_int(_hash_with_type(get_subtree_hash(child)))
             key_sum = _hash_to_int(_hash_with_type(key))
-            total_sum = _hash_to_int(_hash_with_type(key_sum + val_sum))
-            hash_sum += total_sum
-    elif isinstance(value, set):
-        set_sum = 0
-        for elem in value:
-            set_sum += _hash_to_int(_hash_with_type(elem.__getattribute__("_AttributeType__value")))
-        set_sum += HASHED_STRUCTURES["set"]
-        hash_sum += _hash_to_int(_hash_with_type(set_sum))
-    elif isinstance(value, list):
+            hash_sum += _hash_to_int(_hash_with_type(key_sum + val_sum))
+        return hash_sum
+    if isinstance(value, set):
+        set_sum = sum(get_subtree_hash(elem) for elem in value) + HASHED_STRUCTURES["set"]
+        return _hash_to_int(_hash_with_type(set_sum))
+    if isinstance(value, list):
         list_sum = 0
         for elem in value:
-            list_sum += compute_conf_hash(elem, 0)
-            list_sum = _hash_to_int(_hash_with_type(list_sum))
-        list_sum += HASHED_STRUCTURES["list"]
-        hash_sum += _hash_to_int(_hash_with_type(list_sum))
-    else:
-        hash_sum += _hash_to_int(_hash_with_type(value))
-    return hash_sum
+            list_sum = _hash_to_int(_hash_with_type(list_sum + get_subtree_hash(elem)))
+        return _hash_to_int(_hash_with_type(list_sum + HASHED_STRUCTURES["list"]))
+    return _hash_to_int(_hash_with_type(value))
+
+
+def get_subtree_hash(attribute: tp.Union["attributes.AttributeType", tp.Any]) -> int:
+    """
+    Return the subtree hash stored on the attribute.
+    Equal hashes mean equal subtrees, so two trees can be compared without traversing unchanged branches.
+    Plain values (not attributes) are hashed on the fly.
+    """
+
+    # Name mangling to access the private hash of the attribute.
+    # Reason: AttributeType overrides all magic methods and provide abstraction for the value.
+    # User do not have direct access to the internals of the attribute.
+    try:
+        return object.__getattribute__(attribute, "_AttributeType__subtree_hash")
+    except AttributeError:
+        return compute_node_hash(attribute)
+
+
+def compute_conf_hash(attribute: "attributes.AttributeType", hash_sum: int = 0) -> int:
+    """
+    Compute the hash of the given attribute.
+    The hash is computed by hashing the type and value of the attribute.
+    Returns the subtree hash stored on the attribute, nested attributes are not traversed again.
+    """
+
+    return hash_sum + get_subtree_hash(attribute)
 
 
 # Sault the root attributes to distinguish between built-in attributes and config attributes.
@@ -1,10 +1,31 @@
 import abc
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
 import functools
+import logging
 import pathlib
+import threading
+import time
 import typing as tp
 
-from . import attributes, config_builder, config_resolver, config_types, exceptions, hashtools
+from . import (
+    attributes,
+    changesets,
+    compiled,
+    concurrency,
+    config_builder,
+    config_resolver,
+    config_types,
+    exceptions,
+    hashtools,
+    snapshots,
+    watchers,
+)
+
+
+_logger = logging.getLogger(__name__)
 
 
 class MetaTree(metaclass=abc.ABCMeta):  # pragma: no cover
@@ -108,16 +129,22 @@ class MetaTrigger(metaclass=abc.ABCMeta):  # pragma: no cover
     Metaclass for sync triggers.
     Trigger is an object that calls when configuration changes.
     Check `RxConf.include_config` for more information.
+    If `accepts_changes` is True, the observer also passes the `changes` keyword argument:
+    the ChangeSet computed once per reload and shared by all triggers.
     """
 
+    accepts_changes: tp.ClassVar[bool] = False
+
     @abc.abstractmethod
     def __call__(
         self: "MetaTrigger",
         old_conf: MetaConf,
         actual_conf: MetaConf,
+        changes: tp.Optional[changesets.ChangeSet] = None,
     ) -> None:
         """
         Method that calls when configuration changes.
+        :param changes: diff of the configurations. Passed only if `accepts_changes` is True.
         """
 
         raise NotImplementedError()
@@ -128,21 +155,51 @@ class MetaAsyncTrigger(metaclass=abc.ABCMeta):  # pragma: no cover
     Metaclass for async triggers.
     Trigger is a object that calls when configuration changes.
     Check `AsyncRxConf.include_config` for more information.
+    If `accepts_changes` is True, the observer also passes the `changes` keyword argument:
+    the ChangeSet computed once per reload and shared by all triggers.
     """
 
+    accepts_changes: tp.ClassVar[bool] = False
+
     @abc.abstractmethod
     async def __call__(
         self: "MetaAsyncTrigger",
         old_conf: MetaConf,
         actual_conf: MetaConf,
+        changes: tp.Optional[changesets.ChangeSet] = None,
     ) -> None:
         """
         Method that calls when configuration changes.
+        :param changes: diff of the configurations. Passed only if `accepts_changes` is True.
         """
 
         raise NotImplementedError()
 
 
+def _bind_trigger(
+    trigger: tp.Union[MetaTrigger, MetaAsyncTrigger],
+    old_conf: MetaConf,
+    actual_conf: MetaConf,
+    changes: tp.Optional[changesets.ChangeSet],
+) -> tp.Callable[[], tp.Any]:
+    """
+    Binds the trigger call arguments. `changes` is passed only to triggers which accept it.
+    """
+
+    call: tp.Callable[..., tp.Any] = trigger
+    if trigger.accepts_changes and changes is not None:
+        return functools.partial(call, old_conf=old_conf, actual_conf=actual_conf, changes=changes)
+    return functools.partial(call, old_conf=old_conf, actual_conf=actual_conf)
+
+
+# (trigger, callee, bound call): the trigger is the ordering lane, the callee is the trigger actually called.
+_TriggerCall = tp.Tuple[
+    tp.Union[MetaTrigger, MetaAsyncTrigger],
+    tp.Union[MetaTrigger, MetaAsyncTrigger],
+    tp.Callable[[], tp.Any],
+]
+
+
 class SimpleTrigger(MetaTrigger):
     """
     The base async trigger.
@@ -170,6 +227,7 @@ class SimpleTrigger(MetaTrigger):
         self: "SimpleTrigger",
         old_conf: MetaConf,
         actual_conf: MetaConf,
+        changes: tp.Optional[changesets.ChangeSet] = None,
     ) -> None:
         """
         Calls the provided function with provided arguments.
@@ -213,6 +271,7 @@ class SimpleAsyncTrigger(MetaAsyncTrigger):
         self: "SimpleAsyncTrigger",
         old_conf: MetaConf,
         actual_conf: MetaConf,
+        changes: tp.Optional[changesets.ChangeSet] = None,
     ) -> None:
         """
         Calls the provided coroutine with provided arguments.
@@ -231,11 +290,40 @@ class SimpleAsyncTrigger(MetaAsyncTrigger):
         return f"{self.__class__.__name__}(coro={self._coro!r}, args={self._args!r}, kwargs={self._kwargs!r})"
 
 
+def _missing_attributes(
+    paths: tp.Iterable[str],
+    old_conf: MetaConf,
+    actual_conf: MetaConf,
+) -> tp.List[str]:
+    """
+    Returns the attribute paths which exist in neither of the configurations: typos in OnChange triggers.
+    Paths which are added or removed by a reload exist in one of them and are changes.
+    """
+
+    if not isinstance(old_conf, Conf) or not isinstance(actual_conf, Conf):
+        return []
+    return [
+        path
+        for path in paths
+        if lookup(old_conf, path, _MISSING) is _MISSING and lookup(actual_conf, path, _MISSING) is _MISSING
+    ]
+
+
+def _literal_attributes(patterns: tp.Iterable[str]) -> tp.Tuple[str, ...]:
+    return tuple(
+        pattern
+        for pattern in patterns
+        if not {changesets.WILDCARD, changesets.GLOBSTAR}.intersection(pattern.split("."))
+    )
+
+
 class OnChangeTrigger(MetaTrigger):
     """ "
     Trigger that calls the provided function when the chosen config condition is met.
     """
 
+    accepts_changes: tp.ClassVar[bool] = True
+
     def __init__(
         self: "OnChangeTrigger",
         trigger: MetaTrigger,
@@ -258,33 +346,42 @@ class OnChangeTrigger(MetaTrigger):
         If any of them is changed, the trigger will be called.
         Example: any_attributes=("a", "b.c.d", "e.f") - trigger will be called if
         any (>= 1) of attributes (a, d or f) are changed.
+        Attributes are case-insensitive and may contain wildcards: `*` matches exactly one segment,
+        `**` matches any number of segments. Example: any_attributes=("services.*.port", "db.**").
         """
 
         if (not all_attributes and not any_attributes) or (all_attributes and any_attributes):
             raise exceptions.RxConfError("You must provide either `all_attributes` or `any_attributes`.")
         self._trigger = trigger
-        self._all_of_attributes: tp.Tuple[str, ...] = all_attributes if all_attributes is not None else ()
-        self._any_of_attributes: tp.Tuple[str, ...] = any_attributes if any_attributes is not None else ()
+        self._all_of_attributes: tp.Tuple[str, ...] = tuple(attr.lower() for attr in all_attributes or ())
+        self._any_of_attributes: tp.Tuple[str, ...] = tuple(attr.lower() for attr in any_attributes or ())
+        self._trie: changesets.PathTrie[int] = changesets.PathTrie()
+        for number, pattern in enumerate(self._all_of_attributes or self._any_of_attributes):
+            self._trie.add(pattern, number)
+        self._literal_attributes = _literal_attributes(self._all_of_attributes or self._any_of_attributes)
 
     def __call__(
         self: "OnChangeTrigger",
         old_conf: MetaConf,
         actual_conf: MetaConf,
+        changes: tp.Optional[changesets.ChangeSet] = None,
     ) -> None:
         """
         Calls the trigger if chosen condition (all_attributes or any_attributes) is met.
+        An attribute is changed if it (or anything nested in it) is added, removed or modified.
+        Raises `InvalidAttributeError` if an attribute without wildcards exists in neither configuration.
+        :param changes: diff computed by the observer. Computed from the configurations if not provided.
         """
 
-        if any(
-            (
-                self._is_any_of_attributes_changed(old_conf=old_conf, actual_conf=actual_conf),
-                self._is_all_attributes_changed(old_conf=old_conf, actual_conf=actual_conf),
-            )
-        ):
-            self._trigger(
-                old_conf=old_conf,
-                actual_conf=actual_conf,
-            )
+        if changes is None:
+            changes = diff(old_conf, actual_conf)
+        if not changes:
+            return
+        missing = _missing_attributes(self._literal_attributes, old_conf=old_conf, actual_conf=actual_conf)
+        if missing:
+            raise exceptions.InvalidAttributeError(f"Attribute '{missing[0]}' not found in configuration.")
+        if self._is_matched(self._trie.match(changes.paths)):
+            _bind_trigger(self._trigger, old_conf=old_conf, actual_conf=actual_conf, changes=changes)()
 
     @property
     def all_of(self) -> tp.Tuple[str, ...]:
@@ -302,82 +399,26 @@ class OnChangeTrigger(MetaTrigger):
 
         return self._any_of_attributes
 
-    def _is_any_of_attributes_changed(
-        self: "OnChangeTrigger",
-        old_conf: MetaConf,
-        actual_conf: MetaConf,
-    ) -> bool:
-        """
-        Checks if any of the attributes from `any_attributes` is changed.
-        """
-
-        if old_conf == actual_conf:
-            return False
-        return (
-            any(
-                self._is_attribute_changed(old_conf=old_conf, actual_conf=actual_conf, attribute_path=attr)
-                for attr in self._any_of_attributes
-            )
-            if self._any_of_attributes
-            else False
-        )
-
-    def _is_all_attributes_changed(
-        self: "OnChangeTrigger",
-        old_conf: MetaConf,
-        actual_conf: MetaConf,
-    ) -> bool:
+    @property
+    def trigger(self) -> MetaTrigger:
         """
-        Checks if all of the attributes from `all_attributes` are changed.
+        Returns the trigger that is called when the condition is met.
         """
 
-        if old_conf == actual_conf:
-            return False
-        return (
-            all(
-                self._is_attribute_changed(old_conf=old_conf, actual_conf=actual_conf, attribute_path=attr)
-                for attr in self._all_of_attributes
-            )
-            if self._all_of_attributes
-            else False
-        )
+        return self._trigger
 
-    def _is_attribute_changed(
+    def _is_matched(
         self: "OnChangeTrigger",
-        old_conf: MetaConf,
-        actual_conf: MetaConf,
-        attribute_path: str,
+        matched: tp.AbstractSet[int],
     ) -> bool:
         """
-        Checks if the attribute is changed.
-        Works recursively for nested attributes.
-        Compare AttributeType objects.
+        Checks the condition by the numbers of the attribute patterns that matched the changed paths.
+        With `any_attributes` one match is enough, with `all_attributes` every pattern must match.
         """
 
-        def get_nested_attr(conf: MetaConf, path: str) -> tp.Union[attributes.AttributeType, MetaConf]:
-            """
-            Returns the target attribute from the configuration.
-            :param conf: configuration object.
-            :param path: path to the attribute in the configuration. Example: "a.b.c".
-            """
-
-            value: tp.Union[attributes.AttributeType, MetaConf] = conf  # type: ignore
-            for attr in path.lower().split("."):
-                value = getattr(value, attr)
-            return value
-
-        try:
-            old_value = get_nested_attr(old_conf, attribute_path)
-            new_value = get_nested_attr(actual_conf, attribute_path)
-            return all(
-                (
-                    isinstance(old_value, attributes.AttributeType),
-                    isinstance(new_value, attributes.AttributeType),
-                    old_value != new_value,
-                )
-            )
-        except AttributeError as e:
-            raise exceptions.InvalidAttributeError(f"Attribute '{attribute_path}' not found in configuration.") from e
+        if self._any_of_attributes:
+            return bool(matched)
+        return len(matched) == len(self._all_of_attributes)
 
 
 class OnChangeAsyncTrigger(MetaAsyncTrigger):
@@ -385,6 +426,8 @@ class OnChangeAsyncTrigger(MetaAsyncTrigger):
     Trigger that calls the provided function / coroutine when the chosen config condition is met.
     """
 
+    accepts_changes: tp.ClassVar[bool] = True
+
     def __init__(
         self: "OnChangeAsyncTrigger",
         trigger: MetaAsyncTrigger,
@@ -407,33 +450,42 @@ class OnChangeAsyncTrigger(MetaAsyncTrigger):
         If any of them is changed, the trigger will be called.
         Example: any_attributes=("a", "b.c.d", "e.f") - trigger will be called if
         any (>= 1) of attributes (a, d or f) are changed.
+        Attributes are case-insensitive and may contain wildcards: `*` matches exactly one segment,
+        `**` matches any number of segments. Example: any_attributes=("services.*.port", "db.**").
         """
 
         if (not all_attributes and not any_attributes) or (all_attributes and any_attributes):
             raise exceptions.RxConfError("You must provide either `all_attributes` or `any_attributes`.")
         self._trigger = trigger
-        self._all_of_attributes: tp.Tuple[str, ...] = all_attributes if all_attributes is not None else ()
-        self._any_of_attributes: tp.Tuple[str, ...] = any_attributes if any_attributes is not None else ()
+        self._all_of_attributes: tp.Tuple[str, ...] = tuple(attr.lower() for attr in all_attributes or ())
+        self._any_of_attributes: tp.Tuple[str, ...] = tuple(attr.lower() for attr in any_attributes or ())
+        self._trie: changesets.PathTrie[int] = changesets.PathTrie()
+        for number, pattern in enumerate(self._all_of_attributes or self._any_of_attributes):
+            self._trie.add(pattern, number)
+        self._literal_attributes = _literal_attributes(self._all_of_attributes or self._any_of_attributes)
 
     async def __call__(
         self: "OnChangeAsyncTrigger",
         old_conf: MetaConf,
         actual_conf: MetaConf,
+        changes: tp.Optional[changesets.ChangeSet] = None,
     ) -> None:
         """
         Calls the trigger if chosen condition (all_attributes or any_attributes) is met.
+        An attribute is changed if it (or anything nested in it) is added, removed or modified.
+        Raises `InvalidAttributeError` if an attribute without wildcards exists in neither configuration.
+        :param changes: diff computed by the observer. Computed from the configurations if not provided.
         """
 
-        if any(
-            (
-                self._is_any_of_attributes_changed(old_conf=old_conf, actual_conf=actual_conf),
-                self._is_all_attributes_changed(old_conf=old_conf, actual_conf=actual_conf),
-            )
-        ):
-            await self._trigger(
-                old_conf=old_conf,
-                actual_conf=actual_conf,
-            )
+        if changes is None:
+            changes = diff(old_conf, actual_conf)
+        if not changes:
+            return
+        missing = _missing_attributes(self._literal_attributes, old_conf=old_conf, actual_conf=actual_conf)
+        if missing:
+            raise exceptions.InvalidAttributeError(f"Attribute '{missing[0]}' not found in configuration.")
+        if self._is_matched(self._trie.match(changes.paths)):
+            await _bind_trigger(self._trigger, old_conf=old_conf, actual_conf=actual_conf, changes=changes)()
 
     @property
     def all_of(self) -> tp.Tuple[str, ...]:
@@ -451,82 +503,159 @@ class OnChangeAsyncTrigger(MetaAsyncTrigger):
 
         return self._any_of_attributes
 
-    def _is_any_of_attributes_changed(
+    @property
+    def trigger(self) -> MetaAsyncTrigger:
+        """
+        Returns the trigger that is called when the condition is met.
+        """
+
+        return self._trigger
+
+    def _is_matched(
         self: "OnChangeAsyncTrigger",
-        old_conf: MetaConf,
-        actual_conf: MetaConf,
+        matched: tp.AbstractSet[int],
     ) -> bool:
         """
-        Checks if any of the attributes from `any_attributes` is changed.
+        Checks the condition by the numbers of the attribute patterns that matched the changed paths.
+        With `any_attributes` one match is enough, with `all_attributes` every pattern must match.
         """
 
-        if old_conf == actual_conf:
-            return False
-        return (
-            any(
-                self._is_attribute_changed(old_conf=old_conf, actual_conf=actual_conf, attribute_path=attr)
-                for attr in self._any_of_attributes
-            )
-            if self._any_of_attributes
-            else False
-        )
+        if self._any_of_attributes:
+            return bool(matched)
+        return len(matched) == len(self._all_of_attributes)
 
-    def _is_all_attributes_changed(
-        self: "OnChangeAsyncTrigger",
+
+class _TriggerIndex:
+    """
+    Registry of the triggers of one decorated function.
+    Attribute patterns of all OnChange triggers are compiled into a single path trie, so a reload walks only
+    the trie branches under the changed paths and selects only the matching triggers:
+    the dispatch cost depends on the number of changed paths, not on the number of triggers and their attributes.
+    """
+
+    def __init__(self, triggers: tp.Iterable[tp.Union[MetaTrigger, MetaAsyncTrigger]]) -> None:
+        self._triggers = list(triggers)
+        self._trie: changesets.PathTrie[tp.Tuple[int, int]] = changesets.PathTrie()
+        for position, trigger in enumerate(self._triggers):
+            if isinstance(trigger, (OnChangeTrigger, OnChangeAsyncTrigger)):
+                for number, pattern in enumerate(trigger.all_of or trigger.any_of):
+                    self._trie.add(pattern, (position, number))
+        self._accepts_changes = any(trigger.accepts_changes for trigger in self._triggers)
+        self._literal_attributes = {
+            path
+            for trigger in self._triggers
+            if isinstance(trigger, (OnChangeTrigger, OnChangeAsyncTrigger))
+            for path in trigger._literal_attributes
+        }
+        # Configuration which has all the literal attributes. The old configuration of the next reload is usually
+        # the actual one of this reload, so attributes are looked up only when the configuration loses some of them.
+        self._complete_conf: tp.Optional[MetaConf] = None
+
+    def __bool__(self) -> bool:
+        return bool(self._triggers)
+
+    def _missing_attributes(
+        self,
         old_conf: MetaConf,
         actual_conf: MetaConf,
-    ) -> bool:
+    ) -> tp.Set[str]:
         """
-        Checks if all the attributes from `all_attributes` are changed.
+        Returns the literal attributes of the OnChange triggers which exist in neither configuration.
         """
 
-        if old_conf == actual_conf:
-            return False
-        return (
-            all(
-                self._is_attribute_changed(old_conf=old_conf, actual_conf=actual_conf, attribute_path=attr)
-                for attr in self._all_of_attributes
-            )
-            if self._all_of_attributes
-            else False
-        )
+        complete = self._complete_conf
+        if not self._literal_attributes or old_conf is complete or actual_conf is complete:
+            return set()
+        missing = _missing_attributes(self._literal_attributes, old_conf=actual_conf, actual_conf=actual_conf)
+        if not missing:
+            self._complete_conf = actual_conf
+            return set()
+        return set(_missing_attributes(missing, old_conf=old_conf, actual_conf=old_conf))
 
-    def _is_attribute_changed(
-        self: "OnChangeAsyncTrigger",
+    def dispatch(
+        self,
         old_conf: MetaConf,
         actual_conf: MetaConf,
-        attribute_path: str,
-    ) -> bool:
+    ) -> tp.List[_TriggerCall]:
+        """
+        Returns bound calls of the triggers to execute in the registration order as (trigger, callee, call) tuples.
+        For matched OnChange triggers the callee is the wrapped trigger, so the condition is not checked twice.
+        OnChange triggers with attributes which exist in neither configuration are called as is
+        and raise `InvalidAttributeError`.
+        The diff is computed once, only if any of the triggers accepts it.
+        """
+
+        changes = diff(old_conf, actual_conf) if self._accepts_changes else None
+        matched: tp.Dict[int, tp.Set[int]] = {}
+        if changes is not None:
+            for position, number in self._trie.match(changes.paths):
+                matched.setdefault(position, set()).add(number)
+        missing = self._missing_attributes(old_conf=old_conf, actual_conf=actual_conf)
+        calls = []
+        for position, trigger in enumerate(self._triggers):
+            callee: tp.Union[MetaTrigger, MetaAsyncTrigger] = trigger
+            if isinstance(trigger, (OnChangeTrigger, OnChangeAsyncTrigger)) and not (
+                missing and missing.intersection(trigger._literal_attributes)
+            ):
+                if not trigger._is_matched(matched.get(position, set())):
+                    continue
+                callee = trigger.trigger
+            call = _bind_trigger(callee, old_conf=old_conf, actual_conf=actual_conf, changes=changes)
+            calls.append((trigger, callee, call))
+        return calls
+
+
+class _PendingTriggers:
+    """
+    Trigger calls waiting to be submitted to background executors.
+    Calls are queued under the lock which publishes the snapshot, so they keep the order of changes, and are
+    submitted after the caller has left the lock and the reload: a full executor blocks only this caller,
+    and triggers which call decorated functions of the same observer see the published snapshot.
+    One caller submits at a time, the others leave their calls to it instead of waiting.
+    Otherwise, a trigger calling a decorated function from a worker could wait for a caller which waits for the worker.
+    """
+
+    def __init__(self) -> None:
+        self._calls: tp.Deque[_TriggerCall] = collections.deque()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self._calls)
+
+    def extend(self, calls: tp.Iterable[_TriggerCall]) -> None:
+        self._calls.extend(calls)
+
+    def submit(self, submit: tp.Callable[[_TriggerCall], None]) -> None:
         """
-        Checks if the attribute is changed.
-        Works recursively for nested attributes.
-        Compare AttributeType objects.
+        Submits the queued calls one by one, unless another caller is already submitting them.
         """
 
-        def get_nested_attr(conf: MetaConf, path: str) -> tp.Union[attributes.AttributeType, MetaConf]:
-            """
-            Returns the target attribute from the configuration.
-            :param conf: configuration object.
-            :param path: path to the attribute in the configuration. Example: "a.b.c".
-            """
+        # Calls queued right before the other caller releases the lock are picked up by the next iteration.
+        while self._calls:
+            if not self._lock.acquire(blocking=False):
+                return
+            try:
+                while self._calls:
+                    submit(self._calls.popleft())
+            finally:
+                self._lock.release()
 
-            value: tp.Union[attributes.AttributeType, MetaConf] = conf
-            for attr in path.lower().split("."):
-                value = getattr(value, attr)
-            return value
+    async def asubmit(self, submit: tp.Callable[[_TriggerCall], tp.Awaitable[None]]) -> None:
+        """
+        Asynchronous version of `submit`.
+        """
 
-        try:
-            old_value = get_nested_attr(old_conf, attribute_path)
-            new_value = get_nested_attr(actual_conf, attribute_path)
-            return all(
-                (
-                    isinstance(old_value, attributes.AttributeType),
-                    isinstance(new_value, attributes.AttributeType),
-                    old_value != new_value,
-                )
-            )
-        except AttributeError as e:
-            raise exceptions.InvalidAttributeError(f"Attribute '{attribute_path}' not found in configuration.") from e
+        while self._calls:
+            if not self._lock.acquire(blocking=False):
+                return
+            try:
+                while self._calls:
+                    await submit(self._calls.popleft())
+            finally:
+                self._lock.release()
+
+
+_MISSING: tp.Final[tp.Any] = object()
 
 
 @exceptions.handle_unknown_exception
@@ -537,6 +666,12 @@ class Conf(MetaConf):
     If you want to use reactive configuration, use RxConf instead, it will inject the configuration into the function.
     """
 
+    # Class-level defaults: instance attributes of Conf are looked up before configuration keys.
+    _unbox_leaves: bool = False
+    _unboxed_view: tp.Optional["Conf"] = None
+    _compiled_root: tp.Optional[compiled.CompiledNode] = None
+    _compiled_view: tp.Optional["Conf"] = None
+
     def __init__(self, config: config_types.MetaConfigType) -> None:
         """
         Do not call this method directly. Use classmethods instead.
@@ -552,21 +687,33 @@ class Conf(MetaConf):
         config_path: tp.Union[str, pathlib.PurePath],
         encoding: str = "utf-8",
         file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        previous: tp.Optional["Conf"] = None,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
     ) -> "Conf":
         """
         Classmethod for creating frozen configuration from file.
         :param config_path: path to the configuration file on the local filesystem.
         :param encoding: encoding of the configuration file. Example: "utf-8" (default), "cp1250", "iso-8859-2" etc.
-        """
-
-        return cls(
-            config=config_builder.FileConfigTypeBuilder(
-                config_resolver=file_config_resolver,
-            ).build(
-                path=config_path,
-                encoding=encoding,
-            )
+        :param previous: previously loaded configuration. It is returned as is if the file content has not changed,
+        so neither parsing nor tree hashing happens.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
+        """
+
+        previous_structure = previous._MetaTree__structure if previous is not None else None  # type: ignore
+        structure = config_builder.FileConfigTypeBuilder(
+            config_resolver=file_config_resolver,
+            cache=snapshots.SnapshotCache(cache_dir) if cache_dir is not None else None,
+            lazy=lazy,
+        ).build(
+            path=config_path,
+            encoding=encoding,
+            previous=previous_structure,
         )
+        if previous is not None and structure is previous_structure:
+            return previous
+        return cls(config=structure)
 
     @classmethod
     async def from_file_async(
@@ -574,21 +721,33 @@ class Conf(MetaConf):
         config_path: tp.Union[str, pathlib.PurePath],
         encoding: str = "utf-8",
         file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        previous: tp.Optional["Conf"] = None,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
     ) -> "Conf":
         """
         Classmethod for creating frozen configuration from file asynchronously.
         :param config_path: path to the configuration file on the local filesystem.
         :param encoding: encoding of the configuration file. Example: "utf-8" (default), "cp1250", "iso-8859-2" etc.
-        """
-
-        return cls(
-            config=await config_builder.FileConfigTypeBuilder(
-                config_resolver=file_config_resolver,
-            ).build_async(
-                path=config_path,
-                encoding=encoding,
-            )
+        :param previous: previously loaded configuration. It is returned as is if the file content has not changed,
+        so neither parsing nor tree hashing happens.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
+        """
+
+        previous_structure = previous._MetaTree__structure if previous is not None else None  # type: ignore
+        structure = await config_builder.FileConfigTypeBuilder(
+            config_resolver=file_config_resolver,
+            cache=snapshots.SnapshotCache(cache_dir) if cache_dir is not None else None,
+            lazy=lazy,
+        ).build_async(
+            path=config_path,
+            encoding=encoding,
+            previous=previous_structure,
         )
+        if previous is not None and structure is previous_structure:
+            return previous
+        return cls(config=structure)
 
     @classmethod
     def from_env(
@@ -626,6 +785,15 @@ class Conf(MetaConf):
 
         return cls(config=config_types.VaultConfig.load_from_vault(token=token, ip=ip, path=path))
 
+    def __contains__(self, path: object) -> bool:
+        """
+        Checks if the attribute at the dotted path exists. Example: `"db.pool.size" in conf`.
+        """
+
+        if not isinstance(path, str):
+            return False
+        return self._MetaTree__structure.lookup(path, _MISSING) is not _MISSING  # type: ignore
+
     def __eq__(self, other: object) -> bool:
         """
         Compares two configurations. other must be an instance of Conf.
@@ -633,7 +801,12 @@ class Conf(MetaConf):
 
         if not isinstance(other, Conf):
             raise TypeError("Conf is comparable only to Conf")
-        return self._MetaTree__structure == other._MetaTree__structure  # type: ignore
+        structure, other_structure = self._MetaTree__structure, other._MetaTree__structure  # type: ignore
+        if structure is other_structure:
+            return True
+        if structure.digest is not None and structure.digest == other_structure.digest:
+            return True
+        return structure == other_structure
 
     def __ne__(self, other: object) -> bool:
         """
@@ -647,7 +820,14 @@ class Conf(MetaConf):
         Returns the dummy (root) attribute of the configuration. Entry point to the configuration.
         """
 
-        return getattr(self._MetaTree__structure, f"{hashtools.ATTR_SAULT}{item.lower()}")
+        if self._compiled_root is not None:
+            self.__dict__[item] = attribute = getattr(self._compiled_root, item)
+            return attribute
+        attribute = getattr(self._MetaTree__structure, f"{hashtools.ATTR_SAULT}{item.lower()}")
+        if self._unbox_leaves:
+            # The structure is immutable: cached children are read as plain instance attributes next time.
+            self.__dict__[item] = attribute = attributes.unbox(attribute)
+        return attribute
 
     def __repr__(self) -> str:
         """
@@ -657,11 +837,128 @@ class Conf(MetaConf):
         return repr(self._MetaTree__structure)
 
 
+def diff(old_conf: MetaConf, actual_conf: MetaConf) -> changesets.ChangeSet:
+    """
+    Returns the structural diff from the old configuration to the actual one:
+    dotted paths of added, removed and changed attributes. Check `changesets.ChangeSet`.
+    Observers compute it once per reload and pass it to triggers which accept it.
+    A function and not a `Conf` method, so it never shadows configuration keys.
+    :param old_conf: previous configuration.
+    :param actual_conf: newer configuration to compare with.
+    """
+
+    if not isinstance(old_conf, Conf) or not isinstance(actual_conf, Conf):
+        raise TypeError("Conf is comparable only to Conf")
+    return changesets.diff(
+        old_conf._MetaTree__structure._root,  # type: ignore
+        actual_conf._MetaTree__structure._root,  # type: ignore
+    )
+
+
+def compiled_view(conf: Conf) -> Conf:
+    """
+    Returns the view of the configuration compiled into generated classes with `__slots__`, one per distinct
+    mapping shape (check `compiled.CompiledNode`), so `conf.db.port` is a chain of C-level slot reads.
+    Use it for code which reads the configuration in tight loops. Leaves are native Python values,
+    lists are tuples. The whole tree is compiled once per configuration snapshot (lazy trees are materialized),
+    classes are shared by snapshots with the same keys.
+    A function and not a `Conf` method, so it never shadows configuration keys.
+    :param conf: configuration to compile.
+    """
+
+    if conf._compiled_root is not None:
+        return conf
+    view = conf._compiled_view
+    if view is None:
+        structure = conf._MetaTree__structure  # type: ignore[attr-defined]
+        root = compiled.compile_attribute(structure._root)
+        if not isinstance(root, compiled.CompiledNode):
+            raise exceptions.RxConfError("Only mapping configurations can be compiled.")
+        view = type(conf)(config=structure)
+        view._compiled_root = root
+        conf._compiled_view = view
+    return view
+
+
+def unboxed_view(conf: Conf) -> Conf:
+    """
+    Returns the view of the configuration which returns leaves as native Python values (int, str, float, etc.)
+    instead of `AttributeType` wrappers, so `conf.limits.rps * 2` costs a plain int operation.
+    Mappings and lists are still returned as views (check `attributes.UnboxedAttribute`).
+    The view shares the configuration structure and is created once, so it's cheap to call on every access.
+    A function and not a `Conf` method, so it never shadows configuration keys.
+    :param conf: configuration to view.
+    """
+
+    if conf._unbox_leaves:
+        return conf
+    view = conf._unboxed_view
+    if view is None:
+        view = type(conf)(config=conf._MetaTree__structure)  # type: ignore
+        view._unbox_leaves = True
+        conf._unboxed_view = view
+    return view
+
+
+def lookup(conf: Conf, path: str, default: tp.Any = None) -> tp.Any:
+    """
+    Returns the attribute of the configuration at the dotted path or the default value if there is no such attribute.
+    Equivalent to `conf.a.b.c` for "a.b.c", but resolved paths are memoized by the configuration snapshot,
+    so hot code resolves deep keys with a single dict lookup. Example: `rxconf.lookup(conf, "db.replicas.0.host")`.
+    A function and not a `Conf` method, so it never shadows configuration keys.
+    :param conf: configuration to read.
+    :param path: dotted path to the attribute. Case-insensitive. Integer segments index lists.
+    :param default: value returned if the path doesn't exist.
+    """
+
+    if conf._compiled_root is not None:
+        return compiled.lookup(conf._compiled_root, path, default)
+    attribute = conf._MetaTree__structure.lookup(path, default)  # type: ignore
+    if conf._unbox_leaves and attribute is not default:
+        return attributes.unbox(attribute)
+    return attribute
+
+
+def lookup_many(conf: Conf, paths: tp.Iterable[str], default: tp.Any = None) -> tp.List[tp.Any]:
+    """
+    Bulk version of `lookup`: returns attributes of the configuration at the dotted paths in the same order.
+    :param conf: configuration to read.
+    :param paths: dotted paths to the attributes.
+    :param default: value returned for paths which don't exist.
+    """
+
+    if conf._compiled_root is not None:
+        return [compiled.lookup(conf._compiled_root, path, default) for path in paths]
+    structure_lookup = conf._MetaTree__structure.lookup  # type: ignore
+    found = [structure_lookup(path, default) for path in paths]
+    if conf._unbox_leaves:
+        return [attribute if attribute is default else attributes.unbox(attribute) for attribute in found]
+    return found
+
+
+# Files modified less than this window before the load are never cached: filesystem timestamps are coarse
+# (jiffies on Linux, 2 seconds on FAT), so a same-sized write within the same tick would keep the same validator.
+_RACY_WINDOW_NS: tp.Final[int] = 2_000_000_000
+
+# Symlink to the current data directory of a Kubernetes ConfigMap (or Secret) volume. Swapped atomically on update.
+_CONFIG_MAP_DATA: tp.Final[str] = "..data"
+_SWAP_RETRIES: tp.Final[int] = 3
+
+
 class MetaConfFactory(metaclass=abc.ABCMeta):
     """
     Configuration factory interface. Wrapper to create configuration object synchronously.
     """
 
+    @property
+    def nonblocking(self: "MetaConfFactory") -> bool:
+        """
+        True if `create_conf` only returns the published configuration: cheap, thread-safe and never blocks.
+        Lets observers check for changes without taking any locks.
+        """
+
+        return False
+
     @abc.abstractmethod
     def create_conf(
         self: "MetaConfFactory",
@@ -672,12 +969,27 @@ class MetaConfFactory(metaclass=abc.ABCMeta):
 
         raise NotImplementedError()
 
+    def close(self: "MetaConfFactory") -> None:
+        """
+        Releases resources owned by the factory (threads, watchers, etc.). Does nothing by default.
+        """
+
+        return
+
 
 class MetaAsyncConfFactory(metaclass=abc.ABCMeta):
     """
     Configuration factory interface. Wrapper to create configuration object asynchronously.
     """
 
+    @property
+    def nonblocking(self: "MetaAsyncConfFactory") -> bool:
+        """
+        Check `MetaConfFactory.nonblocking`.
+        """
+
+        return False
+
     @abc.abstractmethod
     async def create_conf(
         self: "MetaAsyncConfFactory",
@@ -688,6 +1000,13 @@ class MetaAsyncConfFactory(metaclass=abc.ABCMeta):
 
         raise NotImplementedError()
 
+    def close(self: "MetaAsyncConfFactory") -> None:
+        """
+        Releases resources owned by the factory (threads, watchers, etc.). Does nothing by default.
+        """
+
+        return
+
 
 class FileConfFactory(MetaConfFactory):
     """
@@ -700,29 +1019,167 @@ class FileConfFactory(MetaConfFactory):
         config_path: tp.Union[str, pathlib.PurePath],
         encoding: str,
         file_config_resolver: config_resolver.FileConfigResolver,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         :param config_path: path to the configuration file on the local filesystem.
         :param encoding: encoding of the configuration file. Example: "utf-8".
         :param file_config_resolver: file configuration resolver.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
         """
 
         self._config_path = config_path
         self._encoding = encoding
         self._file_config_resolver = file_config_resolver
+        self._cache_dir = cache_dir
+        self._lazy = lazy
+        # (validator, conf); validator is None if the file was racily modified and can't be trusted.
+        self._cache: tp.Optional[tp.Tuple[tp.Optional[watchers.FileValidator], Conf]] = None
 
     def create_conf(
         self: "FileConfFactory",
     ) -> Conf:
         """
         Creates actual configuration object from file.
+        Returns the previously created object as is if the file validator has not changed since the last load
+        or if the file was touched, but its content is the same (checked by the raw content digest).
         """
 
-        return Conf.from_file(
+        started_at = time.time_ns()
+        validator = watchers.stat_file(self._config_path)
+        cache = self._cache
+        if validator is not None and cache is not None and cache[0] == validator:
+            return cache[1]
+        conf = Conf.from_file(
             config_path=self._config_path,
             encoding=self._encoding,
             file_config_resolver=self._file_config_resolver,
+            previous=cache[1] if cache is not None else None,
+            cache_dir=self._cache_dir,
+            lazy=self._lazy,
+        )
+        trusted = validator is not None and validator[0] < started_at - _RACY_WINDOW_NS
+        self._cache = (validator if trusted else None, conf)
+        return conf
+
+
+class WatchedFileConfFactory(MetaConfFactory):
+    """
+    Configuration factory for file-based configurations which never touches the filesystem on `create_conf`.
+    A background watcher (inotify on Linux, polling otherwise) reloads the file once per edit
+    and atomically publishes the new snapshot. `create_conf` just returns the last published one.
+    """
+
+    nonblocking: tp.ClassVar[bool] = True
+
+    def __init__(
+        self: "WatchedFileConfFactory",
+        config_path: tp.Union[str, pathlib.PurePath],
+        encoding: str,
+        file_config_resolver: config_resolver.FileConfigResolver,
+        poll_interval: float = 1.0,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
+    ) -> None:
+        """
+        :param config_path: path to the configuration file on the local filesystem.
+        :param encoding: encoding of the configuration file. Example: "utf-8".
+        :param file_config_resolver: file configuration resolver.
+        :param poll_interval: interval between two checks in seconds. Used only if inotify is not available.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
+        """
+
+        self._factory = FileConfFactory(
+            config_path=config_path,
+            encoding=encoding,
+            file_config_resolver=file_config_resolver,
+            cache_dir=cache_dir,
+            lazy=lazy,
+        )
+        self._reload_lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._reload_scheduled = False
+        self._reload_requested = False
+        self._watcher = watchers.create_watcher(
+            path=config_path,
+            callback=self._schedule_reload,
+            poll_interval=poll_interval,
         )
+        # Watcher is started before the initial load, so no edit between them is missed.
+        self._watcher.start()
+        try:
+            self._snapshot: tp.Tuple[int, Conf] = (0, self._factory.create_conf())
+        except BaseException:
+            self._watcher.stop()
+            raise
+
+    @property
+    def version(self: "WatchedFileConfFactory") -> int:
+        """
+        Version of the published snapshot. Increments every time the changed configuration is published.
+        """
+
+        return self._snapshot[0]
+
+    def create_conf(
+        self: "WatchedFileConfFactory",
+    ) -> Conf:
+        """
+        Returns the last published configuration object. Does not touch the filesystem.
+        """
+
+        return self._snapshot[1]
+
+    def reload(self: "WatchedFileConfFactory") -> None:
+        """
+        Reloads the file and publishes the new snapshot if the configuration has changed.
+        Scheduled by the watcher in `concurrency.get_reload_executor`. If the file is broken or temporarily missing
+        (in the middle of the edit), the previous snapshot stays published until the next successful reload.
+        """
+
+        with self._reload_lock:
+            try:
+                conf = self._factory.create_conf()
+            except exceptions.RxConfError:
+                return
+            version, current = self._snapshot
+            if conf is not current and conf != current:
+                self._snapshot = (version + 1, conf)
+
+    def close(self: "WatchedFileConfFactory") -> None:
+        """
+        Stops the watcher.
+        """
+
+        self._watcher.stop()
+
+    def _schedule_reload(self: "WatchedFileConfFactory") -> None:
+        """
+        Called by the watcher thread shared by all watched files, so the file is parsed in the reload pool.
+        Coalesces bursts of events: at most one reload is running and at most one more is scheduled after it.
+        """
+
+        with self._schedule_lock:
+            if self._reload_scheduled:
+                self._reload_requested = True
+                return
+            self._reload_scheduled = True
+        concurrency.get_reload_executor().submit(self._reload_loop)
+
+    def _reload_loop(self: "WatchedFileConfFactory") -> None:
+        while True:
+            try:
+                self.reload()
+            except Exception:
+                _logger.exception("Failed to reload the watched configuration.")
+            with self._schedule_lock:
+                if not self._reload_requested:
+                    self._reload_scheduled = False
+                    return
+                self._reload_requested = False
 
 
 class AsyncFileConfFactory(MetaAsyncConfFactory):
@@ -736,29 +1193,237 @@ class AsyncFileConfFactory(MetaAsyncConfFactory):
         config_path: tp.Union[str, pathlib.PurePath],
         encoding: str,
         file_config_resolver: config_resolver.FileConfigResolver,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
     ) -> None:
         """
         :param config_path: path to the configuration file on the local filesystem.
         :param encoding: encoding of the configuration file. Example: "utf-8".
         :param file_config_resolver: file configuration resolver.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
         """
 
         self._config_path = config_path
         self._encoding = encoding
         self._file_config_resolver = file_config_resolver
+        self._cache_dir = cache_dir
+        self._lazy = lazy
+        # (validator, conf); validator is None if the file was racily modified and can't be trusted.
+        self._cache: tp.Optional[tp.Tuple[tp.Optional[watchers.FileValidator], Conf]] = None
 
     async def create_conf(
         self: "AsyncFileConfFactory",
     ) -> Conf:
         """
         Creates actual configuration object from file asynchronously.
+        Returns the previously created object as is if the file validator has not changed since the last load
+        or if the file was touched, but its content is the same (checked by the raw content digest).
         """
 
-        return await Conf.from_file_async(
+        started_at = time.time_ns()
+        validator = watchers.stat_file(self._config_path)
+        cache = self._cache
+        if validator is not None and cache is not None and cache[0] == validator:
+            return cache[1]
+        conf = await Conf.from_file_async(
             config_path=self._config_path,
             encoding=self._encoding,
             file_config_resolver=self._file_config_resolver,
+            previous=cache[1] if cache is not None else None,
+            cache_dir=self._cache_dir,
+            lazy=self._lazy,
+        )
+        trusted = validator is not None and validator[0] < started_at - _RACY_WINDOW_NS
+        self._cache = (validator if trusted else None, conf)
+        return conf
+
+
+class AsyncWatchedFileConfFactory(MetaAsyncConfFactory):
+    """
+    Event-loop-native watched configuration factory for file-based configurations.
+    On Linux, the file is subscribed to the process-wide `watchers.WatchRegistry` (one inotify instance
+    and one thread for all watched files), which hands the events over to the event loop owning the reloads.
+    There is no thread-pool hop per call: the file is reloaded via `AsyncFileConfFactory`
+    only when an event arrives, and `create_conf` returns the published snapshot.
+    The factory may be used from several event loops (e.g. the application loop and the loop bridge
+    of sync functions): the first one reloads the file, the others wait for changes on their own events.
+    On other platforms it falls back to `AsyncFileConfFactory` behavior.
+    """
+
+    def __init__(
+        self: "AsyncWatchedFileConfFactory",
+        config_path: tp.Union[str, pathlib.PurePath],
+        encoding: str,
+        file_config_resolver: config_resolver.FileConfigResolver,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
+    ) -> None:
+        """
+        :param config_path: path to the configuration file on the local filesystem.
+        :param encoding: encoding of the configuration file. Example: "utf-8".
+        :param file_config_resolver: file configuration resolver.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
+        """
+
+        self._config_path = config_path
+        self._factory = AsyncFileConfFactory(
+            config_path=config_path,
+            encoding=encoding,
+            file_config_resolver=file_config_resolver,
+            cache_dir=cache_dir,
+            lazy=lazy,
         )
+        self._snapshot: tp.Optional[tp.Tuple[int, Conf]] = None
+        self._subscription: tp.Optional[int] = None
+        # Loop which reloads the file. Rebound by `create_conf` if it's closed.
+        self._loop: tp.Optional[asyncio.AbstractEventLoop] = None
+        self._reload_task: tp.Optional[asyncio.Task] = None
+        self._reload_requested = False
+        # Guards the owner loop, the snapshot swap and the change events of the waiting loops.
+        self._lock = threading.Lock()
+        self._changed: tp.Dict[asyncio.AbstractEventLoop, asyncio.Event] = {}
+
+    @property
+    def version(self: "AsyncWatchedFileConfFactory") -> int:
+        """
+        Version of the published snapshot. Increments every time the changed configuration is published.
+        """
+
+        return self._snapshot[0] if self._snapshot is not None else 0
+
+    async def create_conf(
+        self: "AsyncWatchedFileConfFactory",
+    ) -> Conf:
+        """
+        Returns the last published configuration object.
+        The first call subscribes to the file in the running event loop and loads the configuration.
+        """
+
+        if self._loop is None or self._loop.is_closed():
+            await self._start()
+        snapshot = self._snapshot
+        if self._subscription is None or snapshot is None:
+            return await self._factory.create_conf()
+        return snapshot[1]
+
+    async def wait_for_change(self: "AsyncWatchedFileConfFactory") -> Conf:
+        """
+        Waits until the next changed configuration is published and returns it.
+        Works only if the file is watched with inotify.
+        """
+
+        await self.create_conf()
+        if self._subscription is None:
+            raise exceptions.RxConfError("File is not watched: inotify is not available.")
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            changed = self._changed.get(loop)
+            if changed is None:
+                changed = self._changed[loop] = asyncio.Event()
+        await changed.wait()
+        return await self.create_conf()
+
+    async def reload(self: "AsyncWatchedFileConfFactory") -> None:
+        """
+        Reloads the file and publishes the new snapshot if the configuration has changed.
+        Wakes up all waiters of `wait_for_change` in all event loops. If the file is broken or temporarily missing
+        (in the middle of the edit), the previous snapshot stays published until the next successful reload.
+        """
+
+        try:
+            conf = await self._factory.create_conf()
+        except exceptions.RxConfError:
+            return
+        while True:
+            snapshot = self._snapshot
+            if snapshot is None:  # pragma: no cover
+                return
+            version, current = snapshot
+            if conf is current or conf == current:
+                return
+            with self._lock:
+                if self._snapshot is snapshot:
+                    self._snapshot = (version + 1, conf)
+                    changed, self._changed = self._changed, {}
+                    break
+        for loop, event in changed.items():
+            if not loop.is_closed():
+                with contextlib.suppress(RuntimeError):  # The loop is closed concurrently.
+                    loop.call_soon_threadsafe(event.set)
+
+    def close(self: "AsyncWatchedFileConfFactory") -> None:
+        """
+        Unsubscribes from the file. Must be called from the thread of the event loop which owns the reloads.
+        """
+
+        if self._subscription is not None:
+            watchers.get_watch_registry().unsubscribe(self._subscription)
+            self._subscription = None
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+
+    async def _start(self: "AsyncWatchedFileConfFactory") -> None:
+        """
+        Makes the running event loop the owner of the reloads: subscribes to the file (once) and loads the snapshot.
+        If the previous owner is closed (for example, after `asyncio.run`), the factory is rebound
+        and catches up with the changes made while no loop was bound.
+        """
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not None and not self._loop.is_closed():
+                return
+            self._loop = loop
+            self._reload_task, self._reload_requested = None, False
+        if not watchers.inotify_available():
+            return
+        if self._subscription is None:
+            self._subscription = watchers.get_watch_registry().subscribe(
+                path=self._config_path,
+                callback=self._post_change,
+            )
+        try:
+            if self._snapshot is None:
+                self._snapshot = (0, await self._factory.create_conf())
+            else:
+                await self.reload()
+        except BaseException:
+            self.close()
+            with self._lock:
+                self._loop = None
+            raise
+
+    def _post_change(self: "AsyncWatchedFileConfFactory") -> None:
+        """
+        Called by the registry thread. Hands the event over to the owner loop. Events which arrive
+        while the loop is closed are dropped: the next `create_conf` rebinds the factory and reloads the file.
+        """
+
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            with contextlib.suppress(RuntimeError):  # The loop is closed concurrently.
+                loop.call_soon_threadsafe(self._on_change)
+
+    def _on_change(self: "AsyncWatchedFileConfFactory") -> None:
+        """
+        Called in the event loop when the file may have changed. Coalesces bursts of events:
+        at most one reload is running and at most one more is scheduled after it.
+        """
+
+        if self._subscription is None:
+            return
+        if self._reload_task is not None and not self._reload_task.done():
+            self._reload_requested = True
+            return
+        self._reload_task = asyncio.ensure_future(self._reload_loop())
+
+    async def _reload_loop(self: "AsyncWatchedFileConfFactory") -> None:
+        self._reload_requested = True
+        while self._reload_requested:
+            self._reload_requested = False
+            await self.reload()
 
 
 class EnvConfFactory(MetaConfFactory):
@@ -820,21 +1485,733 @@ class VaultConfFactory(MetaConfFactory):
         )
 
 
-class MetaRxConf(metaclass=abc.ABCMeta):
+class BackgroundConfFactory(MetaConfFactory):
     """
-    Interface for reactive configurations.
+    Wrapper for any synchronous configuration factory (file, environment, Vault or custom one).
+    A daemon thread reloads the wrapped factory on an adaptive schedule: the interval grows
+    while the configuration is stable and drops to the minimum right after a change.
+    New configuration is built completely off the request path and published with one reference swap,
+    so readers never block on I/O and never see a half-built tree.
     """
 
-    @classmethod
-    @abc.abstractmethod
-    def from_file(
-        cls: tp.Type["MetaRxConf"],
-        config_path: tp.Union[str, pathlib.PurePath],
-        encoding: str,
-        file_config_resolver: config_resolver.FileConfigResolver,
-    ) -> "MetaRxConf":
-        """
-        Classmethod for creating reactive configuration from file.
+    nonblocking: tp.ClassVar[bool] = True
+
+    def __init__(
+        self: "BackgroundConfFactory",
+        factory: MetaConfFactory,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+    ) -> None:
+        """
+        :param factory: configuration factory to reload in the background.
+        :param min_interval: interval between two reloads right after a change, in seconds.
+        :param max_interval: upper bound of the interval while the configuration is stable, in seconds.
+        :param backoff: multiplier applied to the interval after every reload without changes.
+        """
+
+        if not 0 < min_interval <= max_interval or backoff < 1:
+            raise exceptions.RxConfError("Expected 0 < min_interval <= max_interval and backoff >= 1.")
+        self._factory = factory
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._snapshot: tp.Tuple[int, MetaConf] = (0, factory.create_conf())
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rxconf-refresher", daemon=True)
+        self._thread.start()
+
+    @property
+    def version(self: "BackgroundConfFactory") -> int:
+        """
+        Version of the published snapshot. Increments every time the changed configuration is published.
+        """
+
+        return self._snapshot[0]
+
+    def create_conf(
+        self: "BackgroundConfFactory",
+    ) -> MetaConf:
+        """
+        Returns the last published configuration object. Never blocks on I/O.
+        """
+
+        return self._snapshot[1]
+
+    def refresh(self: "BackgroundConfFactory") -> bool:
+        """
+        Reloads the wrapped factory once and publishes the new snapshot if the configuration has changed.
+        Returns True if a new snapshot was published. Failed reloads keep the previous snapshot published.
+        """
+
+        try:
+            conf = self._factory.create_conf()
+        except Exception:
+            # Custom factories may raise anything: the refresher thread must survive and keep backing off.
+            _logger.exception("Failed to reload the configuration in the background.")
+            return False
+        version, current = self._snapshot
+        if conf is current or conf == current:
+            return False
+        self._snapshot = (version + 1, conf)
+        return True
+
+    def close(self: "BackgroundConfFactory") -> None:
+        """
+        Stops the refresher thread and closes the wrapped factory.
+        """
+
+        self._stop_event.set()
+        self._thread.join()
+        self._factory.close()
+
+    def _run(self: "BackgroundConfFactory") -> None:
+        interval = self._min_interval
+        while not self._stop_event.wait(interval):
+            interval = self._min_interval if self.refresh() else min(interval * self._backoff, self._max_interval)
+
+
+class _DebounceState:
+    """
+    State machine shared by debounced factories. A changed result (configuration or error)
+    becomes the stable one only after the wrapped factory has kept returning it for the whole window.
+    """
+
+    def __init__(self, window: float) -> None:
+        if window < 0:
+            raise exceptions.RxConfError("Debounce window must be non-negative.")
+        self._window = window
+        self._stable: tp.Optional[MetaConf] = None
+        self._pending = False
+        self._candidate: tp.Union[MetaConf, exceptions.RxConfError, None] = None
+        self._candidate_since = 0.0
+
+    def settle(self, result: tp.Union[MetaConf, exceptions.RxConfError]) -> MetaConf:
+        """
+        Returns the stable configuration for the latest result of the wrapped factory.
+        Raises the error only if the source stays broken longer than the window.
+        """
+
+        if self._stable is None:
+            if isinstance(result, exceptions.RxConfError):
+                raise result
+            self._stable = result
+            return result
+        if self._is_same(result, self._stable):
+            # The burst has reverted the source to the stable state.
+            self._pending = False
+            return self._stable
+        now = time.monotonic()
+        if not self._pending or not self._is_same(result, self._candidate):
+            self._pending, self._candidate, self._candidate_since = True, result, now
+        if now - self._candidate_since < self._window:
+            return self._stable
+        if isinstance(result, exceptions.RxConfError):
+            raise result
+        self._pending, self._stable = False, result
+        return result
+
+    @staticmethod
+    def _is_same(
+        result: tp.Union[MetaConf, exceptions.RxConfError, None],
+        other: tp.Union[MetaConf, exceptions.RxConfError, None],
+    ) -> bool:
+        if isinstance(result, MetaConf) and isinstance(other, MetaConf):
+            return result is other or result == other
+        return isinstance(result, exceptions.RxConfError) and isinstance(other, exceptions.RxConfError)
+
+
+class DebouncedConfFactory(MetaConfFactory):
+    """
+    Wrapper for any synchronous configuration factory. Collapses bursts of changes (truncate, write, rename)
+    into one: a changed configuration is returned only after the wrapped factory has kept returning it
+    for `window` seconds. Until then, the previous configuration is returned, so transient empty or broken
+    states are never published and triggers fire once per logical edit, comparing the configuration
+    before the burst with the one after it.
+    """
+
+    def __init__(self: "DebouncedConfFactory", factory: MetaConfFactory, window: float) -> None:
+        """
+        :param factory: configuration factory to debounce.
+        :param window: time in seconds the changed configuration must stay the same before it's returned.
+        """
+
+        self._factory = factory
+        self._state = _DebounceState(window=window)
+        self._lock = threading.Lock()
+
+    def create_conf(
+        self: "DebouncedConfFactory",
+    ) -> MetaConf:
+        """
+        Reloads the wrapped factory and returns the stable configuration.
+        """
+
+        with self._lock:
+            try:
+                result: tp.Union[MetaConf, exceptions.RxConfError] = self._factory.create_conf()
+            except exceptions.RxConfError as exc:
+                result = exc
+            return self._state.settle(result)
+
+    def close(self: "DebouncedConfFactory") -> None:
+        """
+        Closes the wrapped factory.
+        """
+
+        self._factory.close()
+
+
+class AsyncDebouncedConfFactory(MetaAsyncConfFactory):
+    """
+    Asynchronous version of `DebouncedConfFactory`.
+    """
+
+    def __init__(self: "AsyncDebouncedConfFactory", factory: MetaAsyncConfFactory, window: float) -> None:
+        """
+        :param factory: configuration factory to debounce.
+        :param window: time in seconds the changed configuration must stay the same before it's returned.
+        """
+
+        self._factory = factory
+        self._state = _DebounceState(window=window)
+
+    async def create_conf(
+        self: "AsyncDebouncedConfFactory",
+    ) -> MetaConf:
+        """
+        Reloads the wrapped factory and returns the stable configuration.
+        """
+
+        try:
+            result: tp.Union[MetaConf, exceptions.RxConfError] = await self._factory.create_conf()
+        except exceptions.RxConfError as exc:
+            result = exc
+        return self._state.settle(result)
+
+    def close(self: "AsyncDebouncedConfFactory") -> None:
+        """
+        Closes the wrapped factory.
+        """
+
+        self._factory.close()
+
+
+def _unboxed(conf: MetaConf) -> MetaConf:
+    if not isinstance(conf, Conf):
+        raise exceptions.RxConfError("Only Conf leaves can be unboxed.")
+    return unboxed_view(conf)
+
+
+class UnboxedConfFactory(MetaConfFactory):
+    """
+    Wrapper for any synchronous configuration factory. Returns `unboxed_view` views of its configurations,
+    so decorated functions get leaves as native Python values instead of `AttributeType` wrappers.
+    """
+
+    def __init__(self: "UnboxedConfFactory", factory: MetaConfFactory) -> None:
+        """
+        :param factory: configuration factory to wrap.
+        """
+
+        self._factory = factory
+
+    @property
+    def nonblocking(self: "UnboxedConfFactory") -> bool:
+        """
+        Views are memoized by configurations, so the wrapper is as non-blocking as the wrapped factory.
+        """
+
+        return self._factory.nonblocking
+
+    def create_conf(
+        self: "UnboxedConfFactory",
+    ) -> MetaConf:
+        """
+        Returns the unboxed view of the configuration created by the wrapped factory.
+        """
+
+        return _unboxed(self._factory.create_conf())
+
+    def close(self: "UnboxedConfFactory") -> None:
+        """
+        Closes the wrapped factory.
+        """
+
+        self._factory.close()
+
+
+class AsyncUnboxedConfFactory(MetaAsyncConfFactory):
+    """
+    Asynchronous version of `UnboxedConfFactory`.
+    """
+
+    def __init__(self: "AsyncUnboxedConfFactory", factory: MetaAsyncConfFactory) -> None:
+        """
+        :param factory: configuration factory to wrap.
+        """
+
+        self._factory = factory
+
+    @property
+    def nonblocking(self: "AsyncUnboxedConfFactory") -> bool:
+        """
+        Check `UnboxedConfFactory.nonblocking`.
+        """
+
+        return self._factory.nonblocking
+
+    async def create_conf(
+        self: "AsyncUnboxedConfFactory",
+    ) -> MetaConf:
+        """
+        Returns the unboxed view of the configuration created by the wrapped factory.
+        """
+
+        return _unboxed(await self._factory.create_conf())
+
+    def close(self: "AsyncUnboxedConfFactory") -> None:
+        """
+        Closes the wrapped factory.
+        """
+
+        self._factory.close()
+
+
+class _LayerMerger:
+    """
+    Incremental merge shared by layered factories. Keeps the last layers and the merged prefixes
+    (layers[0], layers[0] + layers[1], ...), so a changed layer re-merges only itself and the layers above it.
+    Unchanged merged mappings are reused from the previous result.
+    """
+
+    def __init__(self, size: int, deep_merge: bool) -> None:
+        if size < 1:
+            raise exceptions.RxConfError("At least one layer must be provided.")
+        self._deep_merge = deep_merge
+        self._layers: tp.List[tp.Optional[MetaConf]] = [None] * size
+        self._merged: tp.List[tp.Optional[config_types.MetaConfigType]] = [None] * size
+        self._conf: tp.Optional[MetaConf] = None
+
+    def merge(self, layers: tp.List[MetaConf]) -> MetaConf:
+        """
+        Returns the configuration merged from the latest layers. The previous one is returned if nothing has changed.
+        """
+
+        start = len(layers)
+        for position, layer in enumerate(layers):
+            old_layer = self._layers[position]
+            if old_layer is not None and (layer is old_layer or layer == old_layer):
+                layers[position] = old_layer
+            elif start == len(layers):
+                start = position
+        if start == len(layers) and self._conf is not None:
+            return self._conf
+        merged = list(self._merged)
+        for position in range(start, len(layers)):
+            if not isinstance(layers[position], Conf):
+                raise exceptions.RxConfError("Only Conf layers can be merged.")
+            structure = layers[position]._MetaTree__structure  # type: ignore[attr-defined]
+            if position == 0:
+                merged[position] = structure
+                continue
+            previous = self._merged[position]
+            merged[position] = config_types.LayeredConfig.merge(
+                base=merged[position - 1],  # type: ignore[arg-type]
+                overlay=structure,
+                deep_merge=self._deep_merge,
+                previous=previous if isinstance(previous, config_types.LayeredConfig) else None,
+            )
+        result = merged[-1]
+        self._layers, self._merged = list(layers), merged
+        if self._conf is not None and result._root is self._conf._MetaTree__structure._root:  # type: ignore
+            # Overridden changes only: the merged tree is the same.
+            return self._conf
+        self._conf = layers[0] if len(layers) == 1 else Conf(result)  # type: ignore[arg-type]
+        return self._conf
+
+
+class LayeredConfFactory(MetaConfFactory):
+    """
+    Builds one configuration from an ordered list of layers, for example:
+    base.yaml < environment overlay file < .env file < prefixed environment variables.
+    Later layers override earlier ones (deep merge by default: nested mappings are merged, other values replaced).
+    Every layer keeps its own factory with its own change validation, only changed layers are re-merged,
+    and the result is a single `Conf` usable with `RxConf`, `AsyncRxConf` and all triggers.
+    """
+
+    def __init__(
+        self: "LayeredConfFactory",
+        factories: tp.Sequence[MetaConfFactory],
+        deep_merge: bool = True,
+    ) -> None:
+        """
+        :param factories: factories of the layers, from the lowest priority to the highest one.
+        :param deep_merge: if True, nested mappings are merged recursively; otherwise top-level keys are replaced.
+        """
+
+        self._factories = list(factories)
+        self._merger = _LayerMerger(size=len(self._factories), deep_merge=deep_merge)
+        self._lock = threading.Lock()
+
+    def create_conf(
+        self: "LayeredConfFactory",
+    ) -> MetaConf:
+        """
+        Reloads the layers and returns the merged configuration.
+        """
+
+        layers = [factory.create_conf() for factory in self._factories]
+        with self._lock:
+            return self._merger.merge(layers)
+
+    def close(self: "LayeredConfFactory") -> None:
+        """
+        Closes the factories of all layers.
+        """
+
+        for factory in self._factories:
+            factory.close()
+
+
+class AsyncLayeredConfFactory(MetaAsyncConfFactory):
+    """
+    Asynchronous version of `LayeredConfFactory`. Accepts both synchronous and asynchronous factories.
+    """
+
+    def __init__(
+        self: "AsyncLayeredConfFactory",
+        factories: tp.Sequence[tp.Union[MetaConfFactory, MetaAsyncConfFactory]],
+        deep_merge: bool = True,
+    ) -> None:
+        """
+        :param factories: factories of the layers, from the lowest priority to the highest one.
+        :param deep_merge: if True, nested mappings are merged recursively; otherwise top-level keys are replaced.
+        """
+
+        self._factories = list(factories)
+        self._merger = _LayerMerger(size=len(self._factories), deep_merge=deep_merge)
+
+    async def create_conf(
+        self: "AsyncLayeredConfFactory",
+    ) -> MetaConf:
+        """
+        Reloads the layers concurrently and returns the merged configuration.
+        """
+
+        layers = list(await asyncio.gather(*(self._create_layer(factory) for factory in self._factories)))
+        return self._merger.merge(layers)
+
+    def close(self: "AsyncLayeredConfFactory") -> None:
+        """
+        Closes the factories of all layers.
+        """
+
+        for factory in self._factories:
+            factory.close()
+
+    @staticmethod
+    async def _create_layer(factory: tp.Union[MetaConfFactory, MetaAsyncConfFactory]) -> MetaConf:
+        if isinstance(factory, MetaAsyncConfFactory):
+            return await factory.create_conf()
+        return factory.create_conf()
+
+
+class DirectoryConfFactory(MetaConfFactory):
+    """
+    Configuration factory for conf.d-like directories: every file matching the pattern is a layer,
+    layers are merged in the order of their relative paths (check `LayeredConfFactory`).
+    Every file is cached separately (stat validator and content digest), changed files are parsed
+    in a thread pool. Kubernetes ConfigMap volumes are supported: if the directory has the `..data` symlink,
+    all files are read from the directory it points to, so the swap of the symlink is one atomic reload
+    and intermediate states (some files old, some new) are never published.
+    """
+
+    def __init__(
+        self: "DirectoryConfFactory",
+        directory: tp.Union[str, pathlib.PurePath],
+        pattern: str = "*.yaml",
+        encoding: str = "utf-8",
+        file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        deep_merge: bool = True,
+        max_workers: tp.Optional[int] = None,
+    ) -> None:
+        """
+        :param directory: path to the directory on the local filesystem.
+        :param pattern: glob pattern of the configuration files relative to the directory. Example: "**/*.yaml".
+        :param encoding: encoding of the configuration files. Example: "utf-8".
+        :param file_config_resolver: file configuration resolver.
+        :param deep_merge: if True, nested mappings are merged recursively; otherwise top-level keys are replaced.
+        :param max_workers: number of threads parsing the changed files. Default of `ThreadPoolExecutor` if None.
+        """
+
+        self._directory = pathlib.Path(directory)
+        self._pattern = pattern
+        self._encoding = encoding
+        self._file_config_resolver = file_config_resolver
+        self._deep_merge = deep_merge
+        self._max_workers = max_workers
+        self._pool: tp.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # relative path -> (path, validator, conf); validator is None if the file was racily modified.
+        self._files: tp.Dict[str, tp.Tuple[pathlib.Path, tp.Optional[watchers.FileValidator], Conf]] = {}
+        self._names: tp.List[str] = []
+        self._merger = _LayerMerger(size=1, deep_merge=deep_merge)
+
+    def create_conf(
+        self: "DirectoryConfFactory",
+    ) -> MetaConf:
+        """
+        Reloads the changed files and returns the merged configuration.
+        If the ConfigMap is swapped during the reload, the reload is repeated for the new data directory.
+        """
+
+        with self._lock:
+            for _ in range(_SWAP_RETRIES):
+                base = self._resolve_base()
+                try:
+                    return self._load(base)
+                except exceptions.ConfigNotFoundError:
+                    if self._resolve_base() == base:
+                        raise
+            raise exceptions.RxConfError(f"Config directory is swapped too often: {self._directory}")
+
+    def close(self: "DirectoryConfFactory") -> None:
+        """
+        Stops the thread pool.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def _resolve_base(self: "DirectoryConfFactory") -> pathlib.Path:
+        """
+        Returns the directory to read the files from: the target of the ConfigMap `..data` symlink, if any.
+        """
+
+        data = self._directory / _CONFIG_MAP_DATA
+        if data.is_dir():
+            return data.resolve()
+        return self._directory
+
+    def _load(self: "DirectoryConfFactory", base: pathlib.Path) -> MetaConf:
+        if not base.is_dir():
+            raise exceptions.ConfigNotFoundError(f"Config directory not found: {self._directory}")
+        paths = {
+            path.relative_to(base).as_posix(): path
+            for path in base.glob(self._pattern)
+            if path.is_file() and not any(part.startswith("..") for part in path.relative_to(base).parts)
+        }
+        if not paths:
+            raise exceptions.ConfigNotFoundError(f"No config files matching `{self._pattern}` in {self._directory}")
+        names = sorted(paths)
+        started_at = time.time_ns()
+        validators = {name: watchers.stat_file(paths[name]) for name in names}
+        stale = [name for name in names if not self._is_cached(name, paths[name], validators[name])]
+        if len(stale) > 1:
+            if self._pool is None:
+                self._pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="rxconf-directory"
+                )
+            loaded = dict(self._pool.map(lambda name: (name, self._load_file(name, paths[name])), stale))
+        else:
+            loaded = {name: self._load_file(name, paths[name]) for name in stale}
+        files = {name: self._files[name] for name in names if name not in loaded}
+        for name, conf in loaded.items():
+            validator = validators[name]
+            trusted = validator is not None and validator[0] < started_at - _RACY_WINDOW_NS
+            files[name] = (paths[name], validator if trusted else None, conf)
+        if names != self._names:
+            self._merger = _LayerMerger(size=len(names), deep_merge=self._deep_merge)
+        self._files, self._names = files, names
+        return self._merger.merge([files[name][2] for name in names])
+
+    def _is_cached(
+        self: "DirectoryConfFactory",
+        name: str,
+        path: pathlib.Path,
+        validator: tp.Optional[watchers.FileValidator],
+    ) -> bool:
+        cached = self._files.get(name)
+        return validator is not None and cached is not None and cached[0] == path and cached[1] == validator
+
+    def _load_file(self: "DirectoryConfFactory", name: str, path: pathlib.Path) -> Conf:
+        """
+        Loads the file. The previous version (even from another ConfigMap generation) is returned as is
+        if the content is the same.
+        """
+
+        cached = self._files.get(name)
+        return Conf.from_file(
+            config_path=path,
+            encoding=self._encoding,
+            file_config_resolver=self._file_config_resolver,
+            previous=cached[2] if cached is not None else None,
+        )
+
+
+class SharedMemoryConfFactory(MetaConfFactory):
+    """
+    Configuration factory for worker processes: reads snapshots published by `SharedMemoryPublishingConfFactory`
+    (in the master process or a designated worker) from a shared memory segment.
+    Workers neither parse nor hash the configuration: checking for a new version is a single header read,
+    and the new snapshot is decoded lazily, attribute by attribute (check `snapshots.SnapshotReader`).
+    """
+
+    nonblocking: tp.ClassVar[bool] = True
+
+    def __init__(self: "SharedMemoryConfFactory", name: str) -> None:
+        """
+        :param name: name of the shared memory segment.
+        """
+
+        self._reader = snapshots.SnapshotReader(name=name)
+        self._conf: tp.Optional[Conf] = None
+
+    @property
+    def version(self: "SharedMemoryConfFactory") -> int:
+        """
+        Version of the last published snapshot.
+        """
+
+        return self._reader.version
+
+    def create_conf(
+        self: "SharedMemoryConfFactory",
+    ) -> Conf:
+        """
+        Returns the configuration of the last published snapshot. The same object is returned until the next one.
+        """
+
+        structure = self._reader.read()
+        conf = self._conf
+        if conf is not None and conf._MetaTree__structure is structure:  # type: ignore
+            return conf
+        conf = self._conf = Conf(config=structure)
+        return conf
+
+    def close(self: "SharedMemoryConfFactory") -> None:
+        """
+        Detaches from the shared memory segment.
+        """
+
+        self._reader.close()
+
+
+class SharedMemoryPublishingConfFactory(MetaConfFactory):
+    """
+    Wrapper for any synchronous configuration factory: the initial configuration and every changed one
+    it creates are serialized into a shared memory segment (check `snapshots.SnapshotPublisher`),
+    so pre-fork workers read them with `SharedMemoryConfFactory` instead of parsing and hashing the same source each.
+    """
+
+    def __init__(
+        self: "SharedMemoryPublishingConfFactory",
+        factory: MetaConfFactory,
+        name: str,
+        size: int = 16 * 1024 * 1024,
+    ) -> None:
+        """
+        :param factory: configuration factory to publish.
+        :param name: name of the shared memory segment. Created if it doesn't exist.
+        :param size: capacity of the segment in bytes.
+        """
+
+        self._factory = factory
+        self._publisher = snapshots.SnapshotPublisher(name=name, size=size)
+        self._lock = threading.Lock()
+        self._published: tp.Optional[MetaConf] = None
+        # Published right away, so workers forked after the wrapper is created find the configuration.
+        try:
+            self.create_conf()
+        except BaseException:
+            self._publisher.close()
+            raise
+
+    @property
+    def version(self: "SharedMemoryPublishingConfFactory") -> int:
+        """
+        Version of the last published snapshot.
+        """
+
+        return self._publisher.version
+
+    def create_conf(
+        self: "SharedMemoryPublishingConfFactory",
+    ) -> MetaConf:
+        """
+        Creates the configuration with the wrapped factory and publishes it if it has changed.
+        """
+
+        conf = self._factory.create_conf()
+        with self._lock:
+            published = self._published
+            if conf is not published and (published is None or conf != published):
+                self._publisher.publish(conf._MetaTree__structure)  # type: ignore
+            self._published = conf
+        return conf
+
+    def close(self: "SharedMemoryPublishingConfFactory") -> None:
+        """
+        Closes the wrapped factory and destroys the shared memory segment.
+        """
+
+        self._factory.close()
+        self._publisher.close()
+
+
+class ConfSnapshot(tp.NamedTuple):
+    """
+    Immutable state of the reactive configuration. Published by a single reference assignment,
+    so readers get a consistent (conf, version, refreshed_at) triple without taking any locks.
+    """
+
+    conf: tp.Optional[MetaConf]
+    version: int
+    refreshed_at: float
+
+    def is_fresh(self, refresh_interval: tp.Optional[float]) -> bool:
+        """
+        Checks if the configuration was refreshed less than `refresh_interval` seconds ago.
+        """
+
+        return (
+            refresh_interval is not None
+            and self.conf is not None
+            and time.monotonic() - self.refreshed_at < refresh_interval
+        )
+
+    def publish(self, conf: MetaConf, refreshed_at: float) -> "ConfSnapshot":
+        """
+        Returns the next snapshot. Version is incremented only if the configuration object is replaced.
+        """
+
+        return ConfSnapshot(
+            conf=conf,
+            version=self.version if conf is self.conf else self.version + 1,
+            refreshed_at=refreshed_at,
+        )
+
+
+_EMPTY_SNAPSHOT: tp.Final[ConfSnapshot] = ConfSnapshot(conf=None, version=0, refreshed_at=0.0)
+
+
+class MetaRxConf(metaclass=abc.ABCMeta):
+    """
+    Interface for reactive configurations.
+    """
+
+    @classmethod
+    @abc.abstractmethod
+    def from_file(
+        cls: tp.Type["MetaRxConf"],
+        config_path: tp.Union[str, pathlib.PurePath],
+        encoding: str,
+        file_config_resolver: config_resolver.FileConfigResolver,
+    ) -> "MetaRxConf":
+        """
+        Classmethod for creating reactive configuration from file.
         """
 
         raise NotImplementedError()
@@ -885,11 +2262,17 @@ class RxConf(MetaRxConf):
     Entry point for reactive configurations.
     It's not recommended to instantiate this class directly.
     Use classmethods `RxConf.from_file`, `RxConf.from_env` or `RxConf.from_vault` instead.
+    Thread-safe: the state is an immutable `ConfSnapshot` replaced atomically. Writers (reloads and
+    triggers) are serialized, readers take no locks, so read throughput scales with threads
+    (including free-threaded builds).
     """
 
-    _current_conf: tp.Optional[MetaConf] = None
-
-    def __init__(self, factory: MetaConfFactory, di_arg_name: str = "conf") -> None:
+    def __init__(
+        self,
+        factory: MetaConfFactory,
+        di_arg_name: str = "conf",
+        refresh_interval: tp.Optional[float] = None,
+    ) -> None:
         """
         :param factory: configuration factory.
         :param di_arg_name: name of the argument that will be injected into the function.
@@ -900,10 +2283,20 @@ class RxConf(MetaRxConf):
         def my_function(conf: MetaConf):  # <- conf == di_arg_name.
             pass
         ```
+        :param refresh_interval: freshness budget in seconds. If provided, the factory is consulted at most once
+        per interval, calls inside the window get the current configuration. By default, every call reloads.
         """
 
         self._factory = factory
         self._di_arg_name = di_arg_name
+        self._refresh_interval = refresh_interval
+        self._snapshot = _EMPTY_SNAPSHOT
+        # Concurrent callers share a single reload instead of parsing the same source once per caller.
+        self._flight: concurrency.SingleFlight[MetaConf] = concurrency.SingleFlight()
+        # Reentrant: triggers may call decorated functions of the same observer.
+        self._write_lock = threading.RLock()
+        self._trigger_executor: tp.Optional[concurrency.TriggerExecutor] = None
+        self._pending_triggers = _PendingTriggers()
 
     @classmethod
     def from_file(
@@ -911,6 +2304,11 @@ class RxConf(MetaRxConf):
         config_path: tp.Union[str, pathlib.PurePath],
         encoding: str = "utf-8",
         file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        watch: bool = False,
+        refresh_interval: tp.Optional[float] = None,
+        debounce: tp.Optional[float] = None,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
     ) -> "RxConf":
         """
         Classmethod for creating reactive configuration from file.
@@ -919,31 +2317,93 @@ class RxConf(MetaRxConf):
         :param file_config_resolver: file configuration resolver.
         If you want to support custom file formats / extensions, you should implement your own class
         inherited from MetaConfigResolver and provide custom resolver here.
+        :param watch: if True, the file is watched by a background thread (inotify on Linux, polling otherwise)
+        and reloaded once per edit, so decorated functions never touch the filesystem.
+        Call `close` to stop watching.
+        :param refresh_interval: freshness budget in seconds. The file is consulted at most once per interval.
+        :param debounce: debounce window in seconds (check `DebouncedConfFactory`). Changes arriving within
+        the window (e.g. truncate, write and rename steps of one edit) collapse into one change and one
+        dispatch of triggers. Transient empty or broken states within the window are never published.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
+        """
+
+        factory: MetaConfFactory
+        if watch:
+            factory = WatchedFileConfFactory(
+                config_path=config_path,
+                encoding=encoding,
+                file_config_resolver=file_config_resolver,
+                cache_dir=cache_dir,
+                lazy=lazy,
+            )
+        else:
+            factory = FileConfFactory(
+                config_path=config_path,
+                encoding=encoding,
+                file_config_resolver=file_config_resolver,
+                cache_dir=cache_dir,
+                lazy=lazy,
+            )
+        if debounce is not None:
+            factory = DebouncedConfFactory(factory=factory, window=debounce)
+        return cls(factory=factory, refresh_interval=refresh_interval)
+
+    @classmethod
+    def from_directory(
+        cls: tp.Type["RxConf"],
+        directory: tp.Union[str, pathlib.PurePath],
+        pattern: str = "*.yaml",
+        encoding: str = "utf-8",
+        file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        deep_merge: bool = True,
+        refresh_interval: tp.Optional[float] = None,
+        debounce: tp.Optional[float] = None,
+    ) -> "RxConf":
+        """
+        Classmethod for creating reactive configuration from a conf.d-like directory (check `DirectoryConfFactory`).
+        Files matching the pattern are merged in the order of their relative paths, later files override earlier ones.
+        Kubernetes ConfigMap volumes are reloaded atomically on the `..data` symlink swap.
+        :param directory: path to the directory on the local filesystem.
+        :param pattern: glob pattern of the configuration files relative to the directory. Example: "**/*.yaml".
+        :param encoding: encoding of the configuration files. Examples: `utf-8`, `cp1250`, `iso-8859-2` etc.
+        :param file_config_resolver: file configuration resolver.
+        :param deep_merge: if True, nested mappings are merged recursively; otherwise top-level keys are replaced.
+        :param refresh_interval: freshness budget in seconds. The directory is consulted at most once per interval.
+        :param debounce: debounce window in seconds (check `DebouncedConfFactory`).
         """
 
-        return cls(
-            factory=FileConfFactory(
-                config_path=config_path, encoding=encoding, file_config_resolver=file_config_resolver
-            )
+        factory: MetaConfFactory = DirectoryConfFactory(
+            directory=directory,
+            pattern=pattern,
+            encoding=encoding,
+            file_config_resolver=file_config_resolver,
+            deep_merge=deep_merge,
         )
+        if debounce is not None:
+            factory = DebouncedConfFactory(factory=factory, window=debounce)
+        return cls(factory=factory, refresh_interval=refresh_interval)
 
     @classmethod
     def from_env(
         cls: tp.Type["RxConf"],
         prefix: tp.Optional[str] = None,
         remove_prefix: tp.Optional[bool] = False,
+        refresh_interval: tp.Optional[float] = None,
     ) -> "RxConf":
         """
         Classmethod for creating reactive configuration from environment variables.
         WARNING: if you want to use dotenv files, use `from_file` method instead.
         :param prefix: prefix of the environment variables. It will load only variables with this prefix.
+        :param refresh_interval: freshness budget in seconds. Environment is consulted at most once per interval.
         """
 
         return cls(
             factory=EnvConfFactory(
                 prefix=prefix,
                 remove_prefix=remove_prefix,
-            )
+            ),
+            refresh_interval=refresh_interval,
         )
 
     @classmethod
@@ -952,6 +2412,7 @@ class RxConf(MetaRxConf):
         token: str,
         ip: str,
         path: tp.Union[str, pathlib.PurePath],
+        refresh_interval: tp.Optional[float] = None,
     ) -> "RxConf":
         """
         Classmethod for creating reactive configuration from HashiCorp Vault.
@@ -959,6 +2420,7 @@ class RxConf(MetaRxConf):
         :param token: token for accessing the Vault.
         :param ip: IP address of the Vault.
         :param path: path to the configuration in the Vault.
+        :param refresh_interval: freshness budget in seconds. Vault is consulted at most once per interval.
         """
 
         return cls(
@@ -966,9 +2428,26 @@ class RxConf(MetaRxConf):
                 token=token,
                 ip=ip,
                 path=path,
-            )
+            ),
+            refresh_interval=refresh_interval,
         )
 
+    @classmethod
+    def from_shared_memory(
+        cls: tp.Type["RxConf"],
+        name: str,
+        refresh_interval: tp.Optional[float] = None,
+    ) -> "RxConf":
+        """
+        Classmethod for creating reactive configuration from snapshots published to shared memory
+        by another process (check `SharedMemoryConfFactory` and `RxConf.publish_to_shared_memory`).
+        Meant for pre-fork servers: the master parses the configuration once, workers only read it.
+        :param name: name of the shared memory segment.
+        :param refresh_interval: freshness budget in seconds. The segment header is checked at most once per interval.
+        """
+
+        return cls(factory=SharedMemoryConfFactory(name=name), refresh_interval=refresh_interval)
+
     @property
     def current_conf(self) -> MetaConf:
         """
@@ -977,9 +2456,14 @@ class RxConf(MetaRxConf):
         According to OOP best-practices, it's not recommended to use this property directly.
         """
 
-        if self._current_conf is None:
-            self._current_conf = self._factory.create_conf()
-        return self._current_conf
+        conf = self._snapshot.conf
+        if conf is not None:
+            return conf
+        with self._write_lock:
+            snapshot = self._snapshot
+            if snapshot.conf is None:
+                self._snapshot = snapshot = snapshot.publish(self._factory.create_conf(), refreshed_at=0.0)
+            return snapshot.conf  # type: ignore[return-value]
 
     @current_conf.setter
     def current_conf(self, new_conf: MetaConf) -> None:
@@ -987,17 +2471,158 @@ class RxConf(MetaRxConf):
         Sets the current configuration.
         """
 
-        self._current_conf = new_conf
+        with self._write_lock:
+            self._snapshot = self._snapshot.publish(new_conf, refreshed_at=self._snapshot.refreshed_at)
+
+    @property
+    def snapshot(self) -> ConfSnapshot:
+        """
+        Returns the last published snapshot. Never blocks.
+        """
+
+        return self._snapshot
+
+    def close(self: "RxConf") -> None:
+        """
+        Releases resources owned by the configuration factory (watcher threads, etc.) and the trigger executor.
+        """
+
+        self._factory.close()
+        if self._trigger_executor is not None:
+            self._trigger_executor.shutdown()
+
+    def run_triggers_in_background(
+        self: "RxConf",
+        max_workers: int = 4,
+        max_queue_size: int = 1024,
+        parallel: bool = False,
+    ) -> "RxConf":
+        """
+        Moves execution of triggers to a thread pool (check `concurrency.TriggerExecutor`),
+        so slow triggers don't add their latency to the call which noticed the change.
+        Every trigger gets the changes in order. Use `wait_triggers` to wait for their completion.
+        Example:
+        ```python
+        observer = RxConf.from_file("config.yaml").run_triggers_in_background(parallel=True)
+        ```
+        :param max_workers: number of threads in the pool.
+        :param max_queue_size: maximum number of pending trigger calls. Decorated functions which noticed a change
+        block while it's full, after the new configuration is published.
+        :param parallel: if True, different triggers run concurrently. Otherwise, they run one by one.
+        """
+
+        self._trigger_executor = concurrency.TriggerExecutor(
+            max_workers=max_workers,
+            max_queue_size=max_queue_size,
+            parallel=parallel,
+        )
+        return self
+
+    def wait_triggers(self: "RxConf", timeout: tp.Optional[float] = None) -> None:
+        """
+        Waits until all triggers scheduled in the background are done.
+        Raises the first exception raised by them, if any. Does nothing if triggers run inline.
+        :param timeout: maximum time to wait in seconds.
+        """
+
+        if self._trigger_executor is not None:
+            self._pending_triggers.submit(self._submit_trigger)
+            self._trigger_executor.wait(timeout=timeout)
+
+    def refresh_in_background(
+        self: "RxConf",
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+    ) -> "RxConf":
+        """
+        Moves reloading of the configuration to a daemon thread (check `BackgroundConfFactory`).
+        Decorated functions get the last published snapshot and never wait for slow sources like Vault.
+        Call `close` to stop the thread.
+        Example:
+        ```python
+        observer = RxConf.from_vault(token, ip, path).refresh_in_background(min_interval=1, max_interval=30)
+        ```
+        :param min_interval: interval between two reloads right after a change, in seconds.
+        :param max_interval: upper bound of the interval while the configuration is stable, in seconds.
+        """
+
+        self._factory = BackgroundConfFactory(
+            factory=self._factory,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        return self
+
+    def publish_to_shared_memory(
+        self: "RxConf",
+        name: str,
+        size: int = 16 * 1024 * 1024,
+    ) -> "RxConf":
+        """
+        Publishes every changed configuration to a shared memory segment (check `SharedMemoryPublishingConfFactory`),
+        so worker processes read it with `RxConf.from_shared_memory` instead of parsing the source each.
+        Call `close` to destroy the segment.
+        Example:
+        ```python
+        # Master process. Background refresh publishes changes even if the master doesn't call decorated functions.
+        observer = RxConf.from_file("config.yaml").publish_to_shared_memory("app-config").refresh_in_background()
+        # Worker processes.
+        observer = RxConf.from_shared_memory("app-config")
+        ```
+        :param name: name of the shared memory segment. Created if it doesn't exist.
+        :param size: capacity of the segment in bytes.
+        """
+
+        self._factory = SharedMemoryPublishingConfFactory(factory=self._factory, name=name, size=size)
+        return self
+
+    def unbox_leaves(self: "RxConf") -> "RxConf":
+        """
+        Injects configurations which return leaves as native Python values (check `unboxed_view`).
+        Hot code like `conf.limits.rps * 2` or `conf.flags.enabled is True` skips `AttributeType` wrappers.
+        Example:
+        ```python
+        observer = RxConf.from_file("config.yaml").unbox_leaves()
+        ```
+        """
+
+        self._factory = UnboxedConfFactory(factory=self._factory)
+        return self
 
     def include_config(
         self: "RxConf",
         triggers: tp.Optional[tp.Iterable[MetaTrigger]] = None,
+        refresh_interval: tp.Optional[float] = None,
     ) -> tp.Callable:
         """
         Decorator for injecting actual configuration into the function.
         :param triggers: triggers that will be called when configuration changes. Executes one by one sequentially.
+        :param refresh_interval: freshness budget in seconds for this function. Overrides the observer's one.
+        Example: latency-critical functions may accept 5 seconds of staleness, while `refresh_interval=0`
+        reloads the configuration on every call.
+        Concurrent calls are coalesced: one caller reloads the configuration (and executes the triggers),
+        the others wait for its result.
         """
 
+        interval = refresh_interval if refresh_interval is not None else self._refresh_interval
+        index = _TriggerIndex(triggers or ())
+
+        def refresh() -> MetaConf:
+            with self._write_lock:
+                refreshed_at = time.monotonic()
+                current_conf = self.current_conf
+                new_conf = self._factory.create_conf()
+                calls: tp.List[_TriggerCall] = []
+                if index and new_conf is not current_conf and new_conf != current_conf:
+                    calls = index.dispatch(old_conf=current_conf, actual_conf=new_conf)
+                if self._trigger_executor is None:
+                    for _, _, call in calls:
+                        call()
+                self._snapshot = self._snapshot.publish(new_conf, refreshed_at=refreshed_at)
+                if self._trigger_executor is not None:
+                    self._pending_triggers.extend(calls)
+                return new_conf
+
         def decorator(func: tp.Callable) -> tp.Callable:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
@@ -1009,21 +2634,42 @@ class RxConf(MetaRxConf):
                 as a keyword argument in the function for other purposes.
                 """
 
-                new_conf = self._factory.create_conf()
-                if new_conf != self.current_conf:
-                    for trigger in triggers or []:
-                        trigger(
-                            old_conf=self.current_conf,
-                            actual_conf=new_conf,
-                        )
-                self.current_conf = new_conf
-                kwargs[self._di_arg_name] = self.current_conf
+                snapshot = self._snapshot
+                if snapshot.is_fresh(refresh_interval=interval) or self._is_published(snapshot):
+                    kwargs[self._di_arg_name] = snapshot.conf
+                else:
+                    kwargs[self._di_arg_name] = self._flight.do(refresh)
+                    if self._pending_triggers:
+                        self._pending_triggers.submit(self._submit_trigger)
                 return func(*args, **kwargs)
 
             return wrapper
 
         return decorator
 
+    def _submit_trigger(self: "RxConf", call: _TriggerCall) -> None:
+        trigger, _, func = call
+        self._trigger_executor.submit(lane=trigger, func=func)  # type: ignore[union-attr]
+
+    def _is_published(self: "RxConf", snapshot: ConfSnapshot) -> bool:
+        """
+        Lock-free check for non-blocking factories: True if the factory still returns the published configuration.
+        """
+
+        return (
+            self._factory.nonblocking
+            and snapshot.conf is not None
+            and self._factory.create_conf() is snapshot.conf
+        )
+
+
+def _is_changed(index: _TriggerIndex, old_conf: MetaConf, actual_conf: MetaConf) -> bool:
+    return bool(index) and actual_conf is not old_conf and actual_conf != old_conf
+
+
+def _run_in_bridge(func: tp.Callable[[], tp.Coroutine[tp.Any, tp.Any, tp.Any]]) -> tp.Any:
+    return concurrency.get_loop_bridge().run(func())
+
 
 @exceptions.handle_unknown_exception
 class AsyncRxConf(MetaRxConf):
@@ -1033,7 +2679,12 @@ class AsyncRxConf(MetaRxConf):
     Use classmethods `AsyncRxConf.from_file`, `AsyncRxConf.from_env` or `AsyncRxConf.from_vault` instead.
     """
 
-    def __init__(self, factory: tp.Union[MetaAsyncConfFactory, MetaConfFactory], di_arg_name: str = "conf") -> None:
+    def __init__(
+        self,
+        factory: tp.Union[MetaAsyncConfFactory, MetaConfFactory],
+        di_arg_name: str = "conf",
+        refresh_interval: tp.Optional[float] = None,
+    ) -> None:
         """
         :param factory: configuration factory.
         :param di_arg_name: name of the argument that will be injected into the function.
@@ -1044,11 +2695,25 @@ class AsyncRxConf(MetaRxConf):
         def my_function(conf: MetaConf):  # <- conf == di_arg_name.
             pass
         ```
+        :param refresh_interval: freshness budget in seconds. If provided, the factory is consulted at most once
+        per interval, calls inside the window get the current configuration. By default, every call reloads.
         """
 
         self._factory = factory
         self._di_arg_name = di_arg_name
-        self._current_conf: tp.Optional[MetaConf] = None
+        self._refresh_interval = refresh_interval
+        self._snapshot = _EMPTY_SNAPSHOT
+        # Concurrent callers share a single reload instead of parsing the same source once per caller.
+        self._flight: concurrency.SingleFlight[MetaConf] = concurrency.SingleFlight()
+        self._async_flight: concurrency.AsyncSingleFlight[MetaConf] = concurrency.AsyncSingleFlight()
+        # Sync and async callers reload independently: loads are numbered, and a load is published only if
+        # no later one has been, so the snapshot never goes back in time. Held only to swap the snapshot.
+        self._publish_lock = threading.Lock()
+        self._loads = 0
+        self._published_load = 0
+        self._trigger_executor: tp.Optional[concurrency.TriggerExecutor] = None
+        self._async_trigger_executor: tp.Optional[concurrency.AsyncTriggerExecutor] = None
+        self._pending_triggers = _PendingTriggers()
 
     @classmethod
     def from_file(
@@ -1056,6 +2721,11 @@ class AsyncRxConf(MetaRxConf):
         config_path: tp.Union[str, pathlib.PurePath],
         encoding: str = "utf-8",
         file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        watch: bool = False,
+        refresh_interval: tp.Optional[float] = None,
+        debounce: tp.Optional[float] = None,
+        cache_dir: tp.Optional[tp.Union[str, pathlib.PurePath]] = None,
+        lazy: bool = False,
     ) -> "AsyncRxConf":
         """
         Classmethod for creating reactive configuration from file.
@@ -1064,31 +2734,93 @@ class AsyncRxConf(MetaRxConf):
         :param file_config_resolver: file configuration resolver.
         If you want to support custom file formats / extensions, you should implement your own class
         inherited from MetaConfigResolver and provide custom resolver here.
+        :param watch: if True, the file is watched with inotify registered in the running event loop
+        (Linux only, other platforms fall back to the default behavior) and reloaded once per edit,
+        so decorated functions don't touch the filesystem. Call `close` to stop watching.
+        :param refresh_interval: freshness budget in seconds. The file is consulted at most once per interval.
+        :param debounce: debounce window in seconds (check `DebouncedConfFactory`). Changes arriving within
+        the window (e.g. truncate, write and rename steps of one edit) collapse into one change and one
+        dispatch of triggers. Transient empty or broken states within the window are never published.
+        :param cache_dir: on-disk snapshot cache directory (check `snapshots.SnapshotCache`).
+        :param lazy: build the lazy attribute tree (check `attributes.LazyAttribute`).
+        """
+
+        factory: MetaAsyncConfFactory
+        if watch:
+            factory = AsyncWatchedFileConfFactory(
+                config_path=config_path,
+                encoding=encoding,
+                file_config_resolver=file_config_resolver,
+                cache_dir=cache_dir,
+                lazy=lazy,
+            )
+        else:
+            factory = AsyncFileConfFactory(
+                config_path=config_path,
+                encoding=encoding,
+                file_config_resolver=file_config_resolver,
+                cache_dir=cache_dir,
+                lazy=lazy,
+            )
+        if debounce is not None:
+            factory = AsyncDebouncedConfFactory(factory=factory, window=debounce)
+        return cls(factory=factory, refresh_interval=refresh_interval)
+
+    @classmethod
+    def from_directory(
+        cls: tp.Type["AsyncRxConf"],
+        directory: tp.Union[str, pathlib.PurePath],
+        pattern: str = "*.yaml",
+        encoding: str = "utf-8",
+        file_config_resolver: config_resolver.FileConfigResolver = config_resolver.DefaultFileConfigResolver,
+        deep_merge: bool = True,
+        refresh_interval: tp.Optional[float] = None,
+        debounce: tp.Optional[float] = None,
+    ) -> "AsyncRxConf":
+        """
+        Classmethod for creating reactive configuration from a conf.d-like directory (check `DirectoryConfFactory`).
+        Files matching the pattern are merged in the order of their relative paths, later files override earlier ones.
+        Kubernetes ConfigMap volumes are reloaded atomically on the `..data` symlink swap.
+        :param directory: path to the directory on the local filesystem.
+        :param pattern: glob pattern of the configuration files relative to the directory. Example: "**/*.yaml".
+        :param encoding: encoding of the configuration files. Examples: `utf-8`, `cp1250`, `iso-8859-2` etc.
+        :param file_config_resolver: file configuration resolver.
+        :param deep_merge: if True, nested mappings are merged recursively; otherwise top-level keys are replaced.
+        :param refresh_interval: freshness budget in seconds. The directory is consulted at most once per interval.
+        :param debounce: debounce window in seconds (check `DebouncedConfFactory`).
         """
 
-        return cls(
-            factory=AsyncFileConfFactory(
-                config_path=config_path, encoding=encoding, file_config_resolver=file_config_resolver
-            )
+        factory: MetaConfFactory = DirectoryConfFactory(
+            directory=directory,
+            pattern=pattern,
+            encoding=encoding,
+            file_config_resolver=file_config_resolver,
+            deep_merge=deep_merge,
         )
+        if debounce is not None:
+            factory = DebouncedConfFactory(factory=factory, window=debounce)
+        return cls(factory=factory, refresh_interval=refresh_interval)
 
     @classmethod
     def from_env(
         cls: tp.Type["AsyncRxConf"],
         prefix: tp.Optional[str] = None,
         remove_prefix: tp.Optional[bool] = False,
+        refresh_interval: tp.Optional[float] = None,
     ) -> "AsyncRxConf":
         """
         Classmethod for creating reactive configuration from environment variables.
         WARNING: if you want to use dotenv files, use `from_file` method instead.
         :param prefix: prefix of the environment variables. Will load only variables with this prefix.
+        :param refresh_interval: freshness budget in seconds. Environment is consulted at most once per interval.
         """
 
         return cls(
             factory=EnvConfFactory(
                 prefix=prefix,
                 remove_prefix=remove_prefix,
-            )
+            ),
+            refresh_interval=refresh_interval,
         )
 
     @classmethod
@@ -1097,6 +2829,7 @@ class AsyncRxConf(MetaRxConf):
         token: str,
         ip: str,
         path: tp.Union[str, pathlib.PurePath],
+        refresh_interval: tp.Optional[float] = None,
     ) -> "AsyncRxConf":
         """
         Classmethod for creating reactive configuration from HashiCorp Vault.
@@ -1104,6 +2837,7 @@ class AsyncRxConf(MetaRxConf):
         :param token: token for accessing the Vault.
         :param ip: IP address of the Vault.
         :param path: path to the configuration in the Vault.
+        :param refresh_interval: freshness budget in seconds. Vault is consulted at most once per interval.
         """
 
         return cls(
@@ -1111,9 +2845,26 @@ class AsyncRxConf(MetaRxConf):
                 token=token,
                 ip=ip,
                 path=path,
-            )
+            ),
+            refresh_interval=refresh_interval,
         )
 
+    @classmethod
+    def from_shared_memory(
+        cls: tp.Type["AsyncRxConf"],
+        name: str,
+        refresh_interval: tp.Optional[float] = None,
+    ) -> "AsyncRxConf":
+        """
+        Classmethod for creating reactive configuration from snapshots published to shared memory
+        by another process (check `SharedMemoryConfFactory` and `RxConf.publish_to_shared_memory`).
+        Meant for pre-fork servers: the master parses the configuration once, workers only read it.
+        :param name: name of the shared memory segment.
+        :param refresh_interval: freshness budget in seconds. The segment header is checked at most once per interval.
+        """
+
+        return cls(factory=SharedMemoryConfFactory(name=name), refresh_interval=refresh_interval)
+
     @property
     async def current_conf(self) -> MetaConf:
         """
@@ -1122,25 +2873,97 @@ class AsyncRxConf(MetaRxConf):
         According to OOP best-practises, it's not recommend using this property directly.
         """
 
-        if self._current_conf is None:
-            if isinstance(self._factory, MetaAsyncConfFactory):
-                self._current_conf = await self._factory.create_conf()
-            else:
-                self._current_conf = self._factory.create_conf()
-        return self._current_conf
+        return await self._aget_current_conf()
 
     @current_conf.setter
     def current_conf(self, new_conf: MetaConf) -> None:
         """
-        Sets the current configuration.
+        Sets the current configuration. Reloads which are in flight are not published over it.
+        """
+
+        with self._publish_lock:
+            self._snapshot = self._snapshot.publish(new_conf, refreshed_at=self._snapshot.refreshed_at)
+            self._published_load = self._loads + 1
+
+    @property
+    def snapshot(self) -> ConfSnapshot:
         """
+        Returns the last published snapshot. Never blocks.
+        """
+
+        return self._snapshot
 
-        self._current_conf = new_conf
+    def close(self: "AsyncRxConf") -> None:
+        """
+        Releases resources owned by the configuration factory (watcher threads, etc.) and the trigger executors.
+        """
+
+        self._factory.close()
+        if self._trigger_executor is not None:
+            self._trigger_executor.shutdown()
+        if self._async_trigger_executor is not None:
+            self._async_trigger_executor.shutdown()
+
+    def run_triggers_in_background(
+        self: "AsyncRxConf",
+        max_workers: int = 4,
+        max_queue_size: int = 1024,
+        parallel: bool = False,
+    ) -> "AsyncRxConf":
+        """
+        Moves execution of triggers off the request path: MetaTrigger instances run in a thread pool
+        (check `concurrency.TriggerExecutor`), MetaAsyncTrigger instances run as background tasks
+        (check `concurrency.AsyncTriggerExecutor`). Every trigger gets the changes in order.
+        Use `wait_triggers` to wait for their completion. `gather` of `include_config` is ignored, use `parallel`.
+        :param max_workers: number of threads in the pool for sync triggers.
+        :param max_queue_size: maximum number of pending trigger calls per executor.
+        :param parallel: if True, different triggers run concurrently. Otherwise, they run one by one.
+        """
+
+        self._trigger_executor = concurrency.TriggerExecutor(
+            max_workers=max_workers,
+            max_queue_size=max_queue_size,
+            parallel=parallel,
+        )
+        self._async_trigger_executor = concurrency.AsyncTriggerExecutor(
+            max_queue_size=max_queue_size,
+            parallel=parallel,
+        )
+        return self
+
+    async def wait_triggers(self: "AsyncRxConf", timeout: tp.Optional[float] = None) -> None:
+        """
+        Waits until all triggers scheduled in the background are done.
+        Raises the first exception raised by them, if any. Does nothing if triggers run inline.
+        :param timeout: maximum time to wait in seconds.
+        """
+
+        if self._pending_triggers:
+            await self._pending_triggers.asubmit(self._submit_trigger_async)
+        if self._async_trigger_executor is not None:
+            await asyncio.wait_for(self._async_trigger_executor.wait(), timeout=timeout)
+        if self._trigger_executor is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self._trigger_executor.wait, timeout=timeout)
+            )
+
+    def unbox_leaves(self: "AsyncRxConf") -> "AsyncRxConf":
+        """
+        Injects configurations which return leaves as native Python values (check `unboxed_view`).
+        Hot code like `conf.limits.rps * 2` or `conf.flags.enabled is True` skips `AttributeType` wrappers.
+        """
+
+        if isinstance(self._factory, MetaAsyncConfFactory):
+            self._factory = AsyncUnboxedConfFactory(factory=self._factory)
+        else:
+            self._factory = UnboxedConfFactory(factory=self._factory)
+        return self
 
     def include_config(
         self: "AsyncRxConf",
         triggers: tp.Optional[tp.Iterable[tp.Union[MetaTrigger, MetaAsyncTrigger]]] = None,
         gather: bool = False,
+        refresh_interval: tp.Optional[float] = None,
     ) -> tp.Callable:
         """
         Decorator for injecting actual configuration into the function.
@@ -1148,51 +2971,169 @@ class AsyncRxConf(MetaRxConf):
         :param triggers: triggers that will be called when configuration changes.
         :param gather: if True, async triggers will be executed concurrently using asyncio.gather;
                        otherwise, they will be awaited sequentially.
+        :param refresh_interval: freshness budget in seconds for this function. Overrides the observer's one.
+        Concurrent calls are coalesced: one caller (thread or task) reloads the configuration
+        and executes the triggers, the others wait for its result. Cancellation of the reloading task
+        does not interrupt the reload, so the waiting tasks still get the configuration.
+        Sync and async callers reload independently, but a reload never publishes its configuration
+        over the one of a later reload: the stale result is dropped and the published one is injected.
         """
 
+        interval = refresh_interval if refresh_interval is not None else self._refresh_interval
+
+        sync_trigs, async_trigs = self._split_triggers(triggers=triggers)
+        index = _TriggerIndex([*async_trigs, *sync_trigs])
+        refresh_async = functools.partial(self._refresh_async, index=index, gather=gather)
+        refresh_sync = functools.partial(self._refresh_sync, index=index, gather=gather)
+
         def decorator(func: tp.Callable) -> tp.Callable:
             if asyncio.iscoroutinefunction(func):
 
                 @functools.wraps(func)
                 async def async_wrapper(*args, **kwargs):
-                    new_conf = await self._aget_conf()
-                    current_conf = await self._aget_current_conf()
-                    if new_conf != current_conf:
-                        sync_trigs, async_trigs = self._split_triggers(triggers=triggers)
-                        await self._process_triggers_async(
-                            current_conf=current_conf,
-                            new_conf=new_conf,
-                            sync_triggers=sync_trigs,
-                            async_triggers=async_trigs,
-                            gather=gather,
-                        )
-                    self._current_conf = new_conf
-                    kwargs[self._di_arg_name] = new_conf
+                    snapshot = self._snapshot
+                    if snapshot.is_fresh(refresh_interval=interval) or self._is_published(snapshot):
+                        kwargs[self._di_arg_name] = snapshot.conf
+                    else:
+                        kwargs[self._di_arg_name] = await self._async_flight.do(refresh_async)
+                        if self._pending_triggers:
+                            await self._pending_triggers.asubmit(self._submit_trigger_async)
                     return await func(*args, **kwargs)
 
                 return async_wrapper
 
             @functools.wraps(func)
             def sync_wrapper(*args, **kwargs):
-                new_conf = self._get_conf()
-                current_conf = self._get_current_conf()
-                if new_conf != current_conf:
-                    sync_trigs, async_trigs = self._split_triggers(triggers=triggers)
-                    self._process_triggers_sync(
-                        current_conf=current_conf,
-                        new_conf=new_conf,
-                        sync_triggers=sync_trigs,
-                        async_triggers=async_trigs,
-                        gather=gather,
-                    )
-                self._current_conf = new_conf
-                kwargs[self._di_arg_name] = new_conf
+                snapshot = self._snapshot
+                if snapshot.is_fresh(refresh_interval=interval) or self._is_published(snapshot):
+                    kwargs[self._di_arg_name] = snapshot.conf
+                else:
+                    kwargs[self._di_arg_name] = self._flight.do(refresh_sync)
+                    if self._pending_triggers:
+                        self._pending_triggers.submit(self._submit_trigger_sync)
                 return func(*args, **kwargs)
 
             return sync_wrapper
 
         return decorator
 
+    async def _submit_trigger_async(self: "AsyncRxConf", call: _TriggerCall) -> None:
+        trigger, callee, func = call
+        if isinstance(callee, MetaAsyncTrigger):
+            await self._async_trigger_executor.submit(lane=trigger, func=func)  # type: ignore[union-attr]
+        else:
+            self._trigger_executor.submit(lane=trigger, func=func)  # type: ignore[union-attr]
+
+    def _submit_trigger_sync(self: "AsyncRxConf", call: _TriggerCall) -> None:
+        trigger, callee, func = call
+        if isinstance(callee, MetaAsyncTrigger):
+            # The async executor belongs to the event loop of async callers, which may be blocked by this call:
+            # async triggers run through the bridge in the thread pool, with its backpressure and `wait`.
+            func = functools.partial(_run_in_bridge, func)
+        self._trigger_executor.submit(lane=trigger, func=func)  # type: ignore[union-attr]
+
+    def _is_published(self: "AsyncRxConf", snapshot: ConfSnapshot) -> bool:
+        """
+        Lock-free check for non-blocking synchronous factories (check `RxConf._is_published`):
+        sync functions skip the round-trip through the loop bridge and the reload.
+        """
+
+        factory = self._factory
+        return (
+            isinstance(factory, MetaConfFactory)
+            and factory.nonblocking
+            and snapshot.conf is not None
+            and factory.create_conf() is snapshot.conf
+        )
+
+    async def _refresh_async(
+        self: "AsyncRxConf",
+        index: _TriggerIndex,
+        gather: bool,
+    ) -> MetaConf:
+        """
+        Reloads the configuration and executes the triggers if it has changed. Returns the actual configuration.
+        Triggers which run in the background are queued by `_publish` instead.
+        """
+
+        await self._aget_current_conf()
+        refreshed_at = time.monotonic()
+        load = self._start_load()
+        new_conf = await self._aget_conf()
+        replaced = self._publish(load, new_conf, refreshed_at=refreshed_at, index=index)
+        if replaced is None:
+            return self._snapshot.conf  # type: ignore[return-value]
+        current_conf = replaced.conf
+        if self._trigger_executor is None and current_conf is not None and _is_changed(index, current_conf, new_conf):
+            await self._process_triggers_async(
+                calls=index.dispatch(old_conf=current_conf, actual_conf=new_conf),
+                gather=gather,
+            )
+        return new_conf
+
+    def _refresh_sync(
+        self: "AsyncRxConf",
+        index: _TriggerIndex,
+        gather: bool,
+    ) -> MetaConf:
+        """
+        Synchronous version of `_refresh_async`.
+        """
+
+        self._get_current_conf()
+        refreshed_at = time.monotonic()
+        load = self._start_load()
+        new_conf = self._get_conf()
+        replaced = self._publish(load, new_conf, refreshed_at=refreshed_at, index=index)
+        if replaced is None:
+            return self._snapshot.conf  # type: ignore[return-value]
+        current_conf = replaced.conf
+        if self._trigger_executor is None and current_conf is not None and _is_changed(index, current_conf, new_conf):
+            self._process_triggers_sync(
+                calls=index.dispatch(old_conf=current_conf, actual_conf=new_conf),
+                gather=gather,
+            )
+        return new_conf
+
+    def _start_load(self: "AsyncRxConf") -> int:
+        """
+        Returns the sequence number of a new load of the configuration.
+        """
+
+        with self._publish_lock:
+            self._loads += 1
+            return self._loads
+
+    def _publish(
+        self: "AsyncRxConf",
+        load: int,
+        conf: MetaConf,
+        refreshed_at: float,
+        index: tp.Optional[_TriggerIndex] = None,
+    ) -> tp.Optional[ConfSnapshot]:
+        """
+        Publishes the configuration of the load unless a later load has already been published.
+        Returns the replaced snapshot, or None if the configuration is stale and was dropped.
+        If triggers run in the background, queues the calls of the triggers of `index` in the publication order.
+        The caller submits them after the reload (check `_PendingTriggers`).
+        """
+
+        with self._publish_lock:
+            if load < self._published_load:
+                return None
+            replaced = self._snapshot
+            self._snapshot = replaced.publish(conf, refreshed_at=refreshed_at)
+            self._published_load = load
+            old_conf = replaced.conf
+            if (
+                index is not None
+                and self._trigger_executor is not None
+                and old_conf is not None
+                and _is_changed(index, old_conf, conf)
+            ):
+                self._pending_triggers.extend(index.dispatch(old_conf=old_conf, actual_conf=conf))
+            return replaced
+
     async def _aget_conf(self) -> MetaConf:
         if isinstance(self._factory, MetaAsyncConfFactory):
             return await self._factory.create_conf()
@@ -1200,18 +3141,20 @@ class AsyncRxConf(MetaRxConf):
 
     def _get_conf(self) -> MetaConf:
         if isinstance(self._factory, MetaAsyncConfFactory):
-            return asyncio.run(self._factory.create_conf())
+            return concurrency.get_loop_bridge().run(self._factory.create_conf())
         return self._factory.create_conf()
 
     async def _aget_current_conf(self) -> MetaConf:
-        if self._current_conf is None:
-            self._current_conf = await self._aget_conf()
-        return self._current_conf
+        if self._snapshot.conf is None:
+            load = self._start_load()
+            self._publish(load, await self._aget_conf(), refreshed_at=0.0)
+        return self._snapshot.conf  # type: ignore[return-value]
 
     def _get_current_conf(self) -> MetaConf:
-        if self._current_conf is None:
-            self._current_conf = self._get_conf()
-        return self._current_conf
+        if self._snapshot.conf is None:
+            load = self._start_load()
+            self._publish(load, self._get_conf(), refreshed_at=0.0)
+        return self._snapshot.conf  # type: ignore[return-value]
 
     def _split_triggers(
         self: "AsyncRxConf",
@@ -1230,43 +3173,36 @@ class AsyncRxConf(MetaRxConf):
 
     async def _process_triggers_async(
         self: "AsyncRxConf",
-        current_conf: MetaConf,
-        new_conf: MetaConf,
-        sync_triggers: tp.List[MetaTrigger],
-        async_triggers: tp.List[MetaAsyncTrigger],
+        calls: tp.List[_TriggerCall],
         gather: bool,
     ) -> None:
-        if async_triggers:
+        async_calls = [(trig, call) for trig, callee, call in calls if isinstance(callee, MetaAsyncTrigger)]
+        sync_calls = [(trig, call) for trig, callee, call in calls if not isinstance(callee, MetaAsyncTrigger)]
+        if async_calls:
             if gather:
-                tasks: tp.List[tp.Awaitable] = [
-                    async_trig(old_conf=current_conf, actual_conf=new_conf) for async_trig in async_triggers
-                ]
-                await asyncio.gather(*tasks)
+                await asyncio.gather(*(async_call() for _, async_call in async_calls))
             else:
-                for async_trig in async_triggers:
-                    await async_trig(old_conf=current_conf, actual_conf=new_conf)
-        for sync_trig in sync_triggers:
-            sync_trig(old_conf=current_conf, actual_conf=new_conf)
+                for _, async_call in async_calls:
+                    await async_call()
+        for _, sync_call in sync_calls:
+            sync_call()
 
     def _process_triggers_sync(
         self: "AsyncRxConf",
-        current_conf: MetaConf,
-        new_conf: MetaConf,
-        sync_triggers: tp.List[MetaTrigger],
-        async_triggers: tp.List[MetaAsyncTrigger],
+        calls: tp.List[_TriggerCall],
         gather: bool,
     ) -> None:
-        if async_triggers:
+        async_calls = [(trig, call) for trig, callee, call in calls if isinstance(callee, MetaAsyncTrigger)]
+        sync_calls = [(trig, call) for trig, callee, call in calls if not isinstance(callee, MetaAsyncTrigger)]
+        if async_calls:
 
             async def run_async() -> None:
                 if gather:
-                    await asyncio.gather(
-                        *(trig(old_conf=current_conf, actual_conf=new_conf) for trig in async_triggers)
-                    )
+                    await asyncio.gather(*(async_call() for _, async_call in async_calls))
                 else:
-                    for trig in async_triggers:
-                        await trig(old_conf=current_conf, actual_conf=new_conf)
+                    for _, async_call in async_calls:
+                        await async_call()
 
-            asyncio.run(run_async())
-        for trig in sync_triggers:
-            trig(old_conf=current_conf, actual_conf=new_conf)
+            concurrency.get_loop_bridge().run(run_async())
+        for _, sync_call in sync_calls:
+            sync_call()
@@ -0,0 +1,584 @@
+import contextlib
+import datetime
+import functools
+import hashlib
+import importlib.metadata
+import os
+import pathlib
+import struct
+import sys
+import tempfile
+import threading
+import time
+import typing as tp
+from multiprocessing import resource_tracker, shared_memory
+
+import aiofiles
+
+from . import attributes, config_types, exceptions, hashtools
+
+
+# Snapshot blob: header, config hash, config digest, root node.
+# Node: tag (u8), subtree hash length (u8), subtree hash (unsigned little-endian, containers only), payload.
+# Containers store a table of absolute child offsets, so children are decoded only when they are accessed.
+FORMAT_VERSION: tp.Final[int] = 1
+
+_MAGIC: tp.Final[bytes] = b"RXCS"
+_HEADER: tp.Final[struct.Struct] = struct.Struct("<4sHHH")  # magic, format version, hash length, digest length
+_NODE: tp.Final[struct.Struct] = struct.Struct("<BB")  # tag, subtree hash length
+_U8: tp.Final[struct.Struct] = struct.Struct("<B")
+_U32: tp.Final[struct.Struct] = struct.Struct("<I")
+_F64: tp.Final[struct.Struct] = struct.Struct("<d")
+_ENTRY: tp.Final[struct.Struct] = struct.Struct("<II")  # key offset, value offset
+
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR = (ord(tag) for tag in "NTFIDS")
+_DATE, _DATETIME, _TIME, _MAP, _LIST, _SET = (ord(tag) for tag in "dthMLE")
+
+# Shared memory segment: header with the seqlock sequence (odd while the snapshot is being written), blob.
+_SEGMENT_MAGIC: tp.Final[bytes] = b"RXSM"
+_SEGMENT_HEADER: tp.Final[struct.Struct] = struct.Struct("<4sHHQQ")  # magic, format version, reserved, sequence, size
+_SEGMENT_DATA: tp.Final[int] = 32
+_READ_RETRIES: tp.Final[int] = 100
+
+_attach_lock = threading.Lock()
+
+
+def dumps(config: config_types.MetaConfigType) -> bytes:
+    """
+    Serializes the config into a compact read-only snapshot. Check `loads`.
+    Subtree hashes of containers are stored too, so the loaded config is compared and diffed without rehashing.
+    :param config: config to serialize (any config type).
+    """
+
+    hash_bytes = _int_to_bytes(config.hash)
+    digest = config.digest or b""
+    out = bytearray(_HEADER.pack(_MAGIC, FORMAT_VERSION, len(hash_bytes), len(digest)))
+    out += hash_bytes
+    out += digest
+    _encode(config._root, out)  # type: ignore[attr-defined]
+    return bytes(out)
+
+
+def loads(data: bytes) -> "SnapshotConfig":
+    """
+    Creates the config from the snapshot made by `dumps`. Only the header is decoded here:
+    attributes are decoded lazily on first access, so reading a few keys of a large snapshot is cheap.
+    :param data: snapshot. It is referenced (not copied) by the config, so it must not be changed.
+    """
+
+    if len(data) < _HEADER.size:
+        raise exceptions.RxConfError("Broken snapshot: the header is truncated.")
+    magic, version, hash_length, digest_length = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        raise exceptions.RxConfError(f"Unsupported snapshot format: {magic!r} version {version}.")
+    offset = _HEADER.size
+    config_hash = int.from_bytes(data[offset : offset + hash_length], "little")
+    offset += hash_length
+    digest = data[offset : offset + digest_length] if digest_length else None
+    return SnapshotConfig(
+        root_attribute=SnapshotAttribute(data, offset + digest_length),
+        config_hash=config_hash,
+        digest=digest,
+    )
+
+
+def _int_to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "little")
+
+
+def _encode(attribute: attributes.AttributeType, out: bytearray) -> int:
+    """
+    Appends the node to the buffer (children after their parent). Returns the offset of the node.
+    """
+
+    offset = len(out)
+    value = object.__getattribute__(attribute, "_AttributeType__value")
+    if not isinstance(value, (attributes.AttributeMap, list, set)):
+        out += _encode_scalar(value)
+        return offset
+    hash_bytes = _int_to_bytes(hashtools.get_subtree_hash(attribute))
+    tag = _MAP if isinstance(value, attributes.AttributeMap) else _LIST if isinstance(value, list) else _SET
+    out += _NODE.pack(tag, len(hash_bytes))
+    out += hash_bytes
+    out += _U32.pack(len(value))
+    table = len(out)
+    if isinstance(value, attributes.AttributeMap):
+        out += bytes(_ENTRY.size * len(value))
+        for i, (key, child) in enumerate(value.items()):
+            if not isinstance(key, str):
+                raise exceptions.RxConfError(f"Unsupported key type in snapshot: {type(key)}")
+            key_offset = len(out)
+            out += _encode_str(key)
+            _ENTRY.pack_into(out, table + i * _ENTRY.size, key_offset, _encode(child, out))
+        return offset
+    out += bytes(_U32.size * len(value))
+    for i, child in enumerate(value):
+        _U32.pack_into(out, table + i * _U32.size, _encode(child, out))
+    return offset
+
+
+def _encode_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return _U32.pack(len(raw)) + raw
+
+
+def _encode_scalar(value: tp.Any) -> bytes:
+    if value is None:
+        return _NODE.pack(_NONE, 0)
+    if isinstance(value, bool):
+        return _NODE.pack(_TRUE if value else _FALSE, 0)
+    if isinstance(value, int):
+        raw = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+        if len(raw) > 255:
+            raise exceptions.RxConfError("Integer is too large for snapshot.")
+        return _NODE.pack(_INT, 0) + _U8.pack(len(raw)) + raw
+    if isinstance(value, float):
+        return _NODE.pack(_FLOAT, 0) + _F64.pack(value)
+    if isinstance(value, str):
+        return _NODE.pack(_STR, 0) + _encode_str(value)
+    if isinstance(value, datetime.datetime):
+        return _NODE.pack(_DATETIME, 0) + _encode_str(value.isoformat())
+    if isinstance(value, datetime.date):
+        return _NODE.pack(_DATE, 0) + _encode_str(value.isoformat())
+    if isinstance(value, datetime.time):
+        return _NODE.pack(_TIME, 0) + _encode_str(value.isoformat())
+    raise exceptions.RxConfError(f"Unsupported data type in snapshot: {type(value)}")
+
+
+def _decode_str(data: bytes, offset: int) -> str:
+    (length,) = _U32.unpack_from(data, offset)
+    return data[offset + _U32.size : offset + _U32.size + length].decode("utf-8")
+
+
+def _decode(data: bytes, offset: int) -> tp.Any:
+    """
+    Decodes the value of the node. Children of containers are wrapped into undecoded `SnapshotAttribute`s.
+    """
+
+    tag, hash_length = _NODE.unpack_from(data, offset)
+    offset += _NODE.size + hash_length
+    if tag == _STR:
+        return _decode_str(data, offset)
+    if tag == _MAP:
+        (count,) = _U32.unpack_from(data, offset)
+        return attributes.AttributeMap(
+            {
+                _decode_str(data, key_offset): SnapshotAttribute(data, value_offset)
+                for key_offset, value_offset in _ENTRY.iter_unpack(
+                    data[offset + _U32.size : offset + _U32.size + count * _ENTRY.size]
+                )
+            }
+        )
+    if tag in (_LIST, _SET):
+        (count,) = _U32.unpack_from(data, offset)
+        children = (
+            SnapshotAttribute(data, child_offset)
+            for (child_offset,) in _U32.iter_unpack(data[offset + _U32.size : offset + _U32.size + count * _U32.size])
+        )
+        return list(children) if tag == _LIST else set(children)
+    if tag == _INT:
+        (length,) = _U8.unpack_from(data, offset)
+        return int.from_bytes(data[offset + _U8.size : offset + _U8.size + length], "little", signed=True)
+    if tag == _FLOAT:
+        return _F64.unpack_from(data, offset)[0]
+    if tag in (_NONE, _TRUE, _FALSE):
+        return None if tag == _NONE else tag == _TRUE
+    if tag == _DATETIME:
+        return datetime.datetime.fromisoformat(_decode_str(data, offset))
+    if tag == _DATE:
+        return datetime.date.fromisoformat(_decode_str(data, offset))
+    if tag == _TIME:
+        return datetime.time.fromisoformat(_decode_str(data, offset))
+    raise exceptions.RxConfError(f"Broken snapshot: unknown node tag {tag}.")
+
+
+class SnapshotAttribute(attributes.AttributeType):
+    """
+    Attribute of a snapshot (check `loads`). The value is decoded from the snapshot on first access and memoized;
+    children of containers stay undecoded until they are accessed themselves.
+    The subtree hash of containers is read from the snapshot, so comparisons don't decode the subtree.
+    """
+
+    __slots__ = ("__data", "__offset")
+
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.__data = data
+        self.__offset = offset
+
+    # `AttributeType` and `hashtools` read these names with `object.__getattribute__`: properties of the subclass
+    # shadow the slots of `AttributeType`, which keep the decoded value and the hash once they are known.
+    @property
+    def _AttributeType__value(self) -> tp.Any:  # noqa: N802
+        try:
+            return attributes._VALUE_SLOT.__get__(self, SnapshotAttribute)
+        except AttributeError:
+            value = _decode(self.__data, self.__offset)
+            attributes._VALUE_SLOT.__set__(self, value)
+            return value
+
+    @property
+    def _AttributeType__subtree_hash(self) -> int:  # noqa: N802
+        try:
+            return attributes._HASH_SLOT.__get__(self, SnapshotAttribute)
+        except AttributeError:
+            _, hash_length = _NODE.unpack_from(self.__data, self.__offset)
+            start = self.__offset + _NODE.size
+            subtree_hash = (
+                int.from_bytes(self.__data[start : start + hash_length], "little")
+                if hash_length
+                else hashtools.compute_node_hash(self._AttributeType__value)
+            )
+            attributes._HASH_SLOT.__set__(self, subtree_hash)
+            return subtree_hash
+
+    @exceptions.handle_unknown_exception
+    def __getattr__(self, item: str) -> tp.Any:
+        value = object.__getattribute__(self, "_AttributeType__value")
+        if isinstance(value, attributes.AttributeMap):
+            try:
+                return value[item.lower()]
+            except KeyError as exc:
+                raise KeyError(f"Key `{item}` doesn't exist...") from exc
+
+        raise KeyError(f"Key `{item}` doesn't exist...")
+
+
+class SnapshotConfig(config_types.MetaConfigType):
+    """
+    Config loaded from a snapshot (check `loads`). Hash and digest are stored in the snapshot,
+    so equality checks are as cheap as for the original config.
+    """
+
+    _root: tp.Final[SnapshotAttribute]
+
+    def __init__(
+        self: "SnapshotConfig",
+        root_attribute: SnapshotAttribute,
+        config_hash: int,
+        digest: tp.Optional[bytes] = None,
+    ) -> None:
+        self._root = root_attribute
+        self._hash = config_hash
+        self._digest = digest
+
+    def __repr__(self) -> str:
+        return repr(self._root)
+
+    @exceptions.handle_unknown_exception
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, config_types.MetaConfigType):
+            raise TypeError("MetaConfigType is comparable only to MetaConfigType")
+        return self._hash == other.hash
+
+    @property
+    def hash(self) -> int:
+        return self._hash
+
+
+class SnapshotCache:
+    """
+    Content-addressed on-disk cache of file config snapshots (check `dumps`).
+    Entries are keyed by the digest of the raw file content, the config type, the encoding and the rxconf version,
+    so identical content is parsed and hashed once and later loads just read the snapshot.
+    Entries are never invalidated: a changed file has another key. Remove the directory to clean it up.
+    Broken or unwritable entries are ignored, the cache never makes a load fail.
+    Factories accept the directory as `cache_dir`; pre-populate it at deploy time with `python -m rxconf compile`.
+    """
+
+    _SUFFIX: tp.Final[str] = ".rxsnap"
+
+    def __init__(self, directory: tp.Union[str, pathlib.PurePath]) -> None:
+        """
+        :param directory: path to the cache directory. Created on the first write.
+        """
+
+        self._directory = pathlib.Path(directory)
+
+    @property
+    def directory(self) -> pathlib.Path:
+        return self._directory
+
+    def load(
+        self,
+        path: tp.Union[str, pathlib.PurePath],
+        encoding: str,
+        config_type: tp.Type[config_types.FileConfigType],
+        previous: tp.Optional[config_types.MetaConfigType] = None,
+        lazy: bool = False,
+    ) -> config_types.MetaConfigType:
+        """
+        Loads the file config from the cache or, on a miss, from the file (and stores its snapshot).
+        :param path: path to the config file.
+        :param encoding: file encoding (utf-8, cp1251, etc.).
+        :param config_type: file config type to parse the file with.
+        :param previous: previously loaded config. Returned as is if the raw content has the same digest.
+        :param lazy: build the lazy attribute tree on a miss. Snapshots are always decoded lazily.
+        """
+
+        digest = config_type._compute_digest(config_type._read_raw(path), encoding)
+        if previous is not None and previous.digest == digest:
+            return previous
+        entry = self._entry(digest)
+        with contextlib.suppress(OSError, exceptions.RxConfError):
+            return self._verified(entry.read_bytes(), digest)
+        config = config_type.load_from_path(
+            path=path,
+            encoding=encoding,
+            previous=_file_config(previous),
+            lazy=lazy,
+        )
+        self._store(config)
+        return config
+
+    async def load_async(
+        self,
+        path: tp.Union[str, pathlib.PurePath],
+        encoding: str,
+        config_type: tp.Type[config_types.FileConfigType],
+        previous: tp.Optional[config_types.MetaConfigType] = None,
+        lazy: bool = False,
+    ) -> config_types.MetaConfigType:
+        """
+        Asynchronous version of `load`.
+        """
+
+        digest = config_type._compute_digest(await config_type._read_raw_async(path), encoding)
+        if previous is not None and previous.digest == digest:
+            return previous
+        entry = self._entry(digest)
+        with contextlib.suppress(OSError, exceptions.RxConfError):
+            async with aiofiles.open(entry, mode="rb") as file:
+                return self._verified(await file.read(), digest)
+        config = await config_type.load_from_path_async(
+            path=path,
+            encoding=encoding,
+            previous=_file_config(previous),
+            lazy=lazy,
+        )
+        self._store(config)
+        return config
+
+    def compile(
+        self,
+        path: tp.Union[str, pathlib.PurePath],
+        encoding: str,
+        config_type: tp.Type[config_types.FileConfigType],
+    ) -> pathlib.Path:
+        """
+        Parses the file and stores its snapshot, even if it is cached already. Returns the path to the cache entry.
+        Unlike `load`, errors of writing the entry are raised. Used to pre-populate the cache at deploy time.
+        :param path: path to the config file.
+        :param encoding: file encoding (utf-8, cp1251, etc.).
+        :param config_type: file config type to parse the file with.
+        """
+
+        return self._write(config_type.load_from_path(path=path, encoding=encoding))
+
+    def _entry(self, digest: bytes) -> pathlib.Path:
+        key = hashlib.blake2b(digest, digest_size=16, person=_cache_salt()).hexdigest()
+        return self._directory / f"{key}{self._SUFFIX}"
+
+    @staticmethod
+    def _verified(data: bytes, digest: bytes) -> "SnapshotConfig":
+        config = loads(data)
+        if config.digest != digest:
+            raise exceptions.RxConfError("Snapshot doesn't match the cache key.")
+        return config
+
+    def _store(self, config: config_types.MetaConfigType) -> None:
+        with contextlib.suppress(OSError, exceptions.RxConfError):
+            self._write(config)
+
+    def _write(self, config: config_types.MetaConfigType) -> pathlib.Path:
+        """
+        Writes the snapshot atomically (temporary file and rename), so readers never see a partial entry.
+        The key is derived from the digest of the content the config was actually parsed from.
+        """
+
+        if config.digest is None:
+            raise exceptions.RxConfError("Only configs loaded from raw content can be cached.")
+        data = dumps(config)
+        entry = self._entry(config.digest)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temporary, entry)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return entry
+
+
+def _file_config(config: tp.Optional[config_types.MetaConfigType]) -> tp.Optional[config_types.FileConfigType]:
+    return config if isinstance(config, config_types.FileConfigType) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _cache_salt() -> bytes:
+    """
+    Mixed into cache keys: snapshots of another format or rxconf version are never read.
+    """
+
+    try:
+        version = importlib.metadata.version("rxconf")
+    except importlib.metadata.PackageNotFoundError:
+        version = "unknown"
+    return hashlib.blake2b(f"{FORMAT_VERSION}:{version}".encode(), digest_size=16).digest()
+
+
+class SnapshotPublisher:
+    """
+    Publishes snapshots (check `dumps`) into a `multiprocessing.shared_memory` segment,
+    so one process parses the config and any number of processes read it (check `SnapshotReader`).
+    Publication is a seqlock: the sequence in the segment header is odd while the snapshot is being written.
+    If the segment already exists (e.g. left by a crashed publisher), it is reused and its sequence continues.
+    """
+
+    def __init__(self, name: str, size: int = 16 * 1024 * 1024) -> None:
+        """
+        :param name: name of the shared memory segment.
+        :param size: capacity of the segment in bytes. Pages are allocated by the OS only when they are written.
+        """
+
+        try:
+            self._memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._sequence = 0
+        except FileExistsError:
+            self._memory = shared_memory.SharedMemory(name=name)
+            self._sequence = _read_header(_buffer(self._memory))[0] // 2 * 2
+        self._write_header(self._sequence, 0)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the last published snapshot. Zero if nothing is published.
+        """
+
+        return self._sequence // 2
+
+    def publish(self, config: config_types.MetaConfigType) -> int:
+        """
+        Writes the snapshot of the config into the segment. Returns its version.
+        Not thread-safe: publish from a single thread (or serialize the calls).
+        :param config: config to publish.
+        """
+
+        data = dumps(config)
+        if _SEGMENT_DATA + len(data) > self._memory.size:
+            raise exceptions.RxConfError(
+                f"Snapshot of {len(data)} bytes doesn't fit the shared memory segment of {self._memory.size} bytes."
+            )
+        self._write_header(self._sequence + 1, 0)
+        _buffer(self._memory)[_SEGMENT_DATA : _SEGMENT_DATA + len(data)] = data
+        self._sequence += 2
+        self._write_header(self._sequence, len(data))
+        return self.version
+
+    def close(self, unlink: bool = True) -> None:
+        """
+        Detaches from the segment.
+        :param unlink: if True, the segment is destroyed. Attached readers keep their already loaded snapshots.
+        """
+
+        self._memory.close()
+        if unlink:
+            self._memory.unlink()
+
+    def _write_header(self, sequence: int, size: int) -> None:
+        _SEGMENT_HEADER.pack_into(_buffer(self._memory), 0, _SEGMENT_MAGIC, FORMAT_VERSION, 0, sequence, size)
+
+
+class SnapshotReader:
+    """
+    Reads snapshots published by `SnapshotPublisher` from the shared memory segment.
+    Checking for a new version costs one header read; a new snapshot is copied out of the segment
+    (a consistent copy is guaranteed by the seqlock) and decoded lazily (check `loads`).
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        :param name: name of the shared memory segment.
+        """
+
+        try:
+            self._memory = _attach(name)
+        except FileNotFoundError as exc:
+            raise exceptions.ConfigNotFoundError(f"Shared memory segment not found: {name}") from exc
+        self._snapshot: tp.Optional[tp.Tuple[int, SnapshotConfig]] = None
+
+    @property
+    def version(self) -> int:
+        """
+        Version of the last published snapshot. Zero if nothing is published.
+        """
+
+        return _read_header(_buffer(self._memory))[0] // 2
+
+    def read(self) -> SnapshotConfig:
+        """
+        Returns the config of the last published snapshot. The same object is returned until a new one is published.
+        """
+
+        snapshot = self._snapshot
+        for _ in range(_READ_RETRIES):
+            sequence, size = _read_header(_buffer(self._memory))
+            if snapshot is not None and snapshot[0] == sequence:
+                return snapshot[1]
+            if sequence % 2 == 0 and sequence > 0:
+                data = bytes(_buffer(self._memory)[_SEGMENT_DATA : _SEGMENT_DATA + size])
+                if _read_header(_buffer(self._memory))[0] == sequence:
+                    self._snapshot = (sequence, loads(data))
+                    return self._snapshot[1]
+            elif sequence == 0:
+                break
+            time.sleep(0)
+        if snapshot is not None:
+            return snapshot[1]
+        raise exceptions.ConfigNotFoundError(f"Nothing is published to the shared memory segment: {self._memory.name}")
+
+    def close(self) -> None:
+        """
+        Detaches from the segment. Already loaded snapshots stay usable.
+        """
+
+        self._memory.close()
+
+
+def _buffer(memory: shared_memory.SharedMemory) -> memoryview:
+    if memory.buf is None:
+        raise exceptions.RxConfError(f"Shared memory segment is closed: {memory.name}")
+    return memory.buf
+
+
+def _read_header(buffer: memoryview) -> tp.Tuple[int, int]:
+    """
+    Returns (sequence, size) from the segment header.
+    """
+
+    magic, version, _, sequence, size = _SEGMENT_HEADER.unpack_from(buffer)
+    if magic != _SEGMENT_MAGIC or version != FORMAT_VERSION:
+        raise exceptions.RxConfError(f"Unsupported shared memory segment format: {magic!r} version {version}.")
+    return sequence, size
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attaches to the existing segment without registering it in the resource tracker: otherwise the tracker
+    (shared with the publisher after fork) would forget or destroy the segment when the reader exits.
+    """
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)  # pragma: no cover
+    with _attach_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
@@ -0,0 +1,592 @@
+import abc
+import contextlib
+import ctypes
+import ctypes.util
+import errno
+import functools
+import itertools
+import logging
+import os
+import pathlib
+import select
+import struct
+import sys
+import threading
+import typing as tp
+
+
+_logger = logging.getLogger(__name__)
+
+# Errors of exhausted inotify limits (fs.inotify.max_user_instances, fs.inotify.max_user_watches, open files).
+_INOTIFY_LIMIT_ERRORS: tp.Final[tp.FrozenSet[int]] = frozenset((errno.EMFILE, errno.ENFILE, errno.ENOSPC, errno.ENOMEM))
+
+# File validator: (st_mtime_ns, st_size, st_ino, st_ctime_ns).
+FileValidator = tp.Tuple[int, int, int, int]
+
+
+def stat_file(path: tp.Union[str, pathlib.PurePath]) -> tp.Optional[FileValidator]:
+    """
+    Returns the validator of the file on the local filesystem or None if the file can't be stat-ed.
+    Any write, truncation or replacement of the file changes at least one of the validator components.
+    :param path: path to the file on the local filesystem.
+    """
+
+    try:
+        return _validator(os.stat(path))
+    except OSError:
+        return None
+
+
+def _validator(stat: os.stat_result) -> FileValidator:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_ctime_ns
+
+
+class Inotify:
+    """
+    Thin ctypes wrapper around the Linux inotify API.
+    Check `man 7 inotify` for more information.
+    """
+
+    IN_MODIFY: tp.Final[int] = 0x00000002
+    IN_ATTRIB: tp.Final[int] = 0x00000004
+    IN_CLOSE_WRITE: tp.Final[int] = 0x00000008
+    IN_MOVED_FROM: tp.Final[int] = 0x00000040
+    IN_MOVED_TO: tp.Final[int] = 0x00000080
+    IN_CREATE: tp.Final[int] = 0x00000100
+    IN_DELETE: tp.Final[int] = 0x00000200
+    IN_DELETE_SELF: tp.Final[int] = 0x00000400
+    IN_MOVE_SELF: tp.Final[int] = 0x00000800
+    IN_Q_OVERFLOW: tp.Final[int] = 0x00004000
+    IN_IGNORED: tp.Final[int] = 0x00008000
+
+    # struct inotify_event {int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[];}
+    _EVENT_HEADER: tp.Final[struct.Struct] = struct.Struct("iIII")
+
+    def __init__(self) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError("inotify is not available on this platform.")
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path: tp.Union[str, pathlib.PurePath], mask: int) -> int:
+        """
+        Starts watching the path. Returns the watch descriptor.
+        Watching the same inode twice returns the same descriptor.
+        """
+
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), ctypes.c_uint32(mask))
+        if wd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def read_events(self) -> tp.List[tp.Tuple[int, int, int, str]]:
+        """
+        Reads all pending events without blocking. Returns a list of (wd, mask, cookie, name) tuples.
+        """
+
+        events: tp.List[tp.Tuple[int, int, int, str]] = []
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, cookie, length = self._EVENT_HEADER.unpack_from(buffer, offset)
+                offset += self._EVENT_HEADER.size
+                name = os.fsdecode(buffer[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                events.append((wd, mask, cookie, name))
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+@functools.lru_cache(maxsize=None)
+def _load_libc() -> tp.Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:  # pragma: no cover
+        return None
+    if not all(hasattr(libc, func) for func in ("inotify_init1", "inotify_add_watch", "inotify_rm_watch")):
+        return None  # pragma: no cover
+    return libc
+
+
+def inotify_available() -> bool:
+    """
+    Checks if the inotify API can be used on the current platform.
+    """
+
+    return _load_libc() is not None
+
+
+class MetaWatcher(metaclass=abc.ABCMeta):  # pragma: no cover
+    """
+    Interface for file watchers.
+    Watcher calls the provided callback from its own thread every time the watched file may have changed.
+    """
+
+    @abc.abstractmethod
+    def start(self) -> None:
+        """
+        Starts watching in the background.
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def stop(self) -> None:
+        """
+        Stops watching and releases all resources.
+        """
+
+        raise NotImplementedError()
+
+
+class PollingWatcher(MetaWatcher):
+    """
+    Fallback watcher for platforms without inotify.
+    Polls the file validator (see `stat_file`) from a single daemon thread.
+    """
+
+    def __init__(
+        self,
+        path: tp.Union[str, pathlib.PurePath],
+        callback: tp.Callable[[], None],
+        poll_interval: float = 1.0,
+    ) -> None:
+        """
+        :param path: path to the watched file on the local filesystem.
+        :param callback: function to call when the file may have changed.
+        :param poll_interval: interval between two checks in seconds.
+        """
+
+        self._path = path
+        self._callback = callback
+        self._poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: tp.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(stat_file(self._path),),
+            name=f"rxconf-watcher:{os.path.basename(self._path)}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, validator: tp.Optional[FileValidator]) -> None:
+        while not self._stop_event.wait(self._poll_interval):
+            new_validator = stat_file(self._path)
+            if new_validator != validator:
+                validator = new_validator
+                self._callback()
+
+
+# Subscriber callbacks of the changed paths: [(path, [callback, ...]), ...].
+_Notifications = tp.List[tp.Tuple[str, tp.List[tp.Callable[[], tp.Any]]]]
+
+
+class WatchRegistry:
+    """
+    Serves any number of watched files from a single daemon thread.
+    Watched paths are deduplicated: on Linux there is one inotify instance for the whole registry
+    with one watch per directory and per file. Close-write, move and delete events of both are handled,
+    so atomic replacements (write to a temporary file and rename) are detected too.
+    Otherwise, one polling thread lists every watched directory once per interval with `os.scandir`.
+    Events are fanned out only to the subscribers of the changed paths, so the cost of an event
+    is proportional to the number of changed files, not to the number of subscribers.
+    Callbacks are called from the registry thread, so they must be cheap (hand slow work over to another thread);
+    their exceptions are suppressed, so a broken subscriber can't stop the others.
+    If inotify can't be initialized or its limits are exhausted (thousands of watched files), the registry
+    switches to polling for all the watched files.
+    """
+
+    _DIR_MASK: tp.Final[int] = (
+        Inotify.IN_CLOSE_WRITE
+        | Inotify.IN_MOVED_TO
+        | Inotify.IN_MOVED_FROM
+        | Inotify.IN_CREATE
+        | Inotify.IN_DELETE
+        | Inotify.IN_DELETE_SELF
+        | Inotify.IN_MOVE_SELF
+    )
+    _FILE_MASK: tp.Final[int] = (
+        Inotify.IN_CLOSE_WRITE | Inotify.IN_ATTRIB | Inotify.IN_DELETE_SELF | Inotify.IN_MOVE_SELF
+    )
+
+    def __init__(self, use_inotify: tp.Optional[bool] = None) -> None:
+        """
+        :param use_inotify: use inotify (True) or polling (False). By default, inotify is used if available.
+        """
+
+        self._use_inotify = inotify_available() if use_inotify is None else use_inotify
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._subscriptions: tp.Dict[int, tp.Tuple[str, float]] = {}
+        self._callbacks: tp.Dict[str, tp.Dict[int, tp.Callable[[], tp.Any]]] = {}
+        self._directories: tp.Dict[str, tp.Set[str]] = {}
+        self._poll_interval = 1.0
+        self._validators: tp.Dict[str, tp.Optional[FileValidator]] = {}
+        self._inotify: tp.Optional[Inotify] = None
+        self._dir_wds: tp.Dict[str, int] = {}
+        self._wd_dirs: tp.Dict[int, str] = {}
+        self._file_wds: tp.Dict[str, int] = {}
+        self._wd_files: tp.Dict[int, tp.Set[str]] = {}
+        self._thread: tp.Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._stop_r, self._stop_w = -1, -1
+
+    def subscribe(
+        self,
+        path: tp.Union[str, pathlib.PurePath],
+        callback: tp.Callable[[], tp.Any],
+        poll_interval: float = 1.0,
+    ) -> int:
+        """
+        Starts calling the callback every time the file may have changed. Returns the subscription id.
+        The registry thread is started by the first subscription.
+        :param path: path to the watched file on the local filesystem.
+        :param callback: function to call when the file may have changed.
+        :param poll_interval: interval between two checks of the polling fallback in seconds.
+            The registry polls with the smallest interval of all subscriptions.
+        """
+
+        path = os.path.abspath(path)
+        with self._lock:
+            self._start()
+            callbacks = self._callbacks.get(path)
+            if callbacks is None:
+                self._watch(path)
+                callbacks = self._callbacks[path] = {}
+            subscription = next(self._ids)
+            callbacks[subscription] = callback
+            self._subscriptions[subscription] = (path, poll_interval)
+            if len(self._subscriptions) == 1:
+                self._poll_interval = poll_interval
+            else:
+                self._poll_interval = min(self._poll_interval, poll_interval)
+        return subscription
+
+    def unsubscribe(self, subscription: int) -> None:
+        """
+        Stops calling the callback of the subscription. Unknown subscriptions are ignored.
+        The file is unwatched when its last subscription is cancelled.
+        """
+
+        with self._lock:
+            entry = self._subscriptions.pop(subscription, None)
+            if entry is None:
+                return
+            path, poll_interval = entry
+            callbacks = self._callbacks[path]
+            del callbacks[subscription]
+            if not callbacks:
+                del self._callbacks[path]
+                self._unwatch(path)
+            if poll_interval <= self._poll_interval:
+                self._poll_interval = min((interval for _, interval in self._subscriptions.values()), default=1.0)
+
+    def close(self) -> None:
+        """
+        Stops the registry thread and cancels all subscriptions. The thread is restarted by the next `subscribe`.
+        """
+
+        with self._lock:
+            thread, stop_w = self._thread, self._stop_w
+            self._thread, self._inotify = None, None
+            self._stop_r, self._stop_w = -1, -1
+            for state in (
+                self._subscriptions,
+                self._callbacks,
+                self._directories,
+                self._validators,
+                self._dir_wds,
+                self._wd_dirs,
+                self._file_wds,
+                self._wd_files,
+            ):
+                state.clear()
+        if thread is None:
+            return
+        self._stop_event.set()
+        if stop_w >= 0:
+            # The inotify thread closes the pipe and the inotify instance itself.
+            os.write(stop_w, b"\0")
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+        if self._use_inotify:
+            try:
+                inotify = Inotify()
+            except OSError as error:
+                _logger.warning("Failed to initialize inotify, falling back to polling: %s", error)
+                self._use_inotify = False
+            else:
+                self._inotify = inotify
+                self._stop_r, self._stop_w = os.pipe()
+                self._start_thread(self._run_inotify, inotify, self._stop_r, self._stop_w)
+                return
+        self._start_thread(self._run_polling, self._stop_event)
+
+    def _start_thread(self, target: tp.Callable[..., None], *args: tp.Any) -> None:
+        self._thread = threading.Thread(target=target, args=args, name="rxconf-watch-registry", daemon=True)
+        self._thread.start()
+
+    def _fall_back_to_polling(self) -> None:
+        """
+        Replaces the inotify thread with the polling one. The inotify thread is stopped without waiting:
+        it may be waiting for the lock held by the caller.
+        """
+
+        self._use_inotify = False
+        self._inotify = None
+        os.write(self._stop_w, b"\0")
+        self._stop_r, self._stop_w = -1, -1
+        for state in (self._dir_wds, self._wd_dirs, self._file_wds, self._wd_files):
+            state.clear()
+        for directory, names in self._directories.items():
+            for name in names:
+                path = os.path.join(directory, name)
+                self._validators[path] = stat_file(path)
+        self._stop_event = threading.Event()
+        self._start_thread(self._run_polling, self._stop_event)
+
+    def _watch(self, path: str) -> None:
+        directory, name = os.path.split(path)
+        names = self._directories.get(directory)
+        if names is None:
+            if self._inotify is not None:
+                try:
+                    wd = self._inotify.add_watch(directory, self._DIR_MASK)
+                except OSError as error:
+                    if error.errno not in _INOTIFY_LIMIT_ERRORS:
+                        raise
+                    _logger.warning("Inotify limits are exhausted, falling back to polling: %s", error)
+                    self._fall_back_to_polling()
+                else:
+                    self._dir_wds[directory], self._wd_dirs[wd] = wd, directory
+            names = self._directories[directory] = set()
+        names.add(name)
+        if self._inotify is not None:
+            self._watch_file(path)
+        else:
+            self._validators[path] = stat_file(path)
+
+    def _unwatch(self, path: str) -> None:
+        directory, name = os.path.split(path)
+        names = self._directories[directory]
+        names.discard(name)
+        self._validators.pop(path, None)
+        if self._inotify is None:
+            if not names:
+                del self._directories[directory]
+            return
+        wd = self._file_wds.pop(path, None)
+        if wd is not None:
+            self._forget_file_wd(wd, path)
+        if not names:
+            del self._directories[directory]
+            dir_wd = self._dir_wds.pop(directory)
+            del self._wd_dirs[dir_wd]
+            self._inotify.rm_watch(dir_wd)
+
+    def _watch_file(self, path: str) -> None:
+        """
+        (Re)subscribes to the file itself. Needed after every replacement, because inotify watches inodes.
+        """
+
+        try:
+            wd = self._inotify.add_watch(path, self._FILE_MASK)  # type: ignore[union-attr]
+        except OSError:
+            return
+        previous = self._file_wds.get(path)
+        if previous is not None and previous != wd:
+            self._forget_file_wd(previous, path)
+        self._file_wds[path] = wd
+        self._wd_files.setdefault(wd, set()).add(path)
+
+    def _forget_file_wd(self, wd: int, path: str) -> None:
+        paths = self._wd_files.get(wd)
+        if paths is None:
+            return
+        paths.discard(path)
+        if not paths:
+            del self._wd_files[wd]
+            self._inotify.rm_watch(wd)  # type: ignore[union-attr]
+
+    def _run_inotify(self, inotify: Inotify, stop_r: int, stop_w: int) -> None:
+        try:
+            while True:
+                ready, _, _ = select.select([inotify.fileno(), stop_r], [], [])
+                if stop_r in ready:
+                    return
+                self._notify(self._read_changed(inotify))
+        finally:
+            os.close(stop_r)
+            os.close(stop_w)
+            inotify.close()
+
+    def _read_changed(self, inotify: Inotify) -> _Notifications:
+        with self._lock:
+            if inotify is not self._inotify:
+                return []
+            changed: tp.Set[str] = set()
+            for wd, mask, _, name in inotify.read_events():
+                changed.update(self._event_paths(wd, mask, name))
+            for path in changed:
+                self._watch_file(path)
+            return self._subscribers(changed)
+
+    def _event_paths(self, wd: int, mask: int, name: str) -> tp.Iterable[str]:
+        """
+        Returns the watched paths which may have been changed according to the event.
+        """
+
+        if mask & Inotify.IN_Q_OVERFLOW:
+            return list(self._callbacks)
+        directory = self._wd_dirs.get(wd)
+        if directory is not None:
+            names = self._directories[directory]
+            if not name:
+                # The directory itself is moved or deleted.
+                return [os.path.join(directory, child) for child in names]
+            return [os.path.join(directory, name)] if name in names else []
+        paths = self._wd_files.get(wd, set())
+        if mask & Inotify.IN_IGNORED:
+            # The file watch is removed by the kernel: the inode is deleted.
+            self._wd_files.pop(wd, None)
+            for path in paths:
+                if self._file_wds.get(path) == wd:
+                    del self._file_wds[path]
+        return list(paths)
+
+    def _run_polling(self, stop_event: threading.Event) -> None:
+        while not stop_event.wait(self._poll_interval):
+            self._notify(self._poll())
+
+    def _poll(self) -> _Notifications:
+        with self._lock:
+            directories = {directory: set(names) for directory, names in self._directories.items()}
+        validators: tp.Dict[str, FileValidator] = {}
+        for directory, names in directories.items():
+            with contextlib.suppress(OSError), os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        with contextlib.suppress(OSError):
+                            validators[entry.path] = _validator(entry.stat())
+        with self._lock:
+            changed = set()
+            for directory, names in directories.items():
+                for name in names:
+                    path = os.path.join(directory, name)
+                    validator = validators.get(path)
+                    if path in self._validators and self._validators[path] != validator:
+                        self._validators[path] = validator
+                        changed.add(path)
+            return self._subscribers(changed)
+
+    def _subscribers(self, changed: tp.Iterable[str]) -> _Notifications:
+        return [(path, list(self._callbacks[path].values())) for path in changed if path in self._callbacks]
+
+    @staticmethod
+    def _notify(notifications: _Notifications) -> None:
+        for _, callbacks in notifications:
+            for callback in callbacks:
+                with contextlib.suppress(Exception):
+                    callback()
+
+
+class SharedWatcher(MetaWatcher):
+    """
+    Watches the file through the `WatchRegistry` shared by the whole process (see `get_watch_registry`),
+    so any number of watched files costs a single thread and a single inotify instance.
+    """
+
+    def __init__(
+        self,
+        path: tp.Union[str, pathlib.PurePath],
+        callback: tp.Callable[[], None],
+        poll_interval: float = 1.0,
+        registry: tp.Optional[WatchRegistry] = None,
+    ) -> None:
+        """
+        :param path: path to the watched file on the local filesystem.
+        :param callback: function to call when the file may have changed.
+        :param poll_interval: interval between two checks of the polling fallback in seconds.
+        :param registry: registry to subscribe to. The process-wide one by default.
+        """
+
+        self._path = path
+        self._callback = callback
+        self._poll_interval = poll_interval
+        self._registry = registry if registry is not None else get_watch_registry()
+        self._subscription: tp.Optional[int] = None
+
+    def start(self) -> None:
+        self._subscription = self._registry.subscribe(
+            path=self._path,
+            callback=self._callback,
+            poll_interval=self._poll_interval,
+        )
+
+    def stop(self) -> None:
+        if self._subscription is None:
+            return
+        self._registry.unsubscribe(self._subscription)
+        self._subscription = None
+
+
+_watch_registry = WatchRegistry()
+
+
+def get_watch_registry() -> WatchRegistry:
+    """
+    Returns the watch registry shared by the whole process.
+    """
+
+    return _watch_registry
+
+
+def create_watcher(
+    path: tp.Union[str, pathlib.PurePath],
+    callback: tp.Callable[[], None],
+    poll_interval: float = 1.0,
+) -> MetaWatcher:
+    """
+    Creates the watcher subscribed to the process-wide `WatchRegistry`: inotify on Linux, polling otherwise.
+    :param path: path to the watched file on the local filesystem.
+    :param callback: function to call when the file may have changed.
+    :param poll_interval: interval between two checks of the polling fallback in seconds.
+    """
+
+    return SharedWatcher(path=path, callback=callback, poll_interval=poll_interval)
@@ -0,0 +1,1592 @@
+import asyncio
+import errno
+import multiprocessing
+import os
+import threading
+import time
+import typing as tp
+import uuid
+from pathlib import Path
+
+import pytest
+
+import rxconf
+from rxconf import rxconf as rx
+
+
+def _wait_for(condition: tp.Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _write(path: Path, content: str, age: float = 10.0) -> None:
+    """Writes the file and moves its mtime to the past, so it is not considered racily modified."""
+
+    path.write_text(content, encoding="utf-8")
+    mtime_ns = time.time_ns() - int(age * 1e9)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_file_factory_reuses_unchanged_conf(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    factory = rx.FileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+
+    first = factory.create_conf()
+    second = factory.create_conf()
+
+    assert first is second
+
+
+def test_file_factory_reloads_changed_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    factory = rx.FileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+
+    first = factory.create_conf()
+    _write(config_path, "value: 22")
+    second = factory.create_conf()
+
+    assert first is not second
+    assert second.value == 22
+
+
+@pytest.mark.asyncio
+async def test_async_file_factory_reuses_unchanged_conf(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    factory = rx.AsyncFileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+
+    first = await factory.create_conf()
+    second = await factory.create_conf()
+
+    assert first is second
+
+
+def test_file_factory_does_not_cache_racily_modified_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1", age=0)
+    factory = rx.FileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+
+    assert factory.create_conf().value == 1
+    # Same size, same (coarse) timestamp: only the racy check forces the re-read.
+    _write(config_path, "value: 2", age=0)
+    assert factory.create_conf().value == 2
+
+
+def test_file_factory_reuses_touched_file(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1", age=20)
+    factory = rx.FileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+
+    first = factory.create_conf()
+    _write(config_path, "value: 1")
+
+    assert factory.create_conf() is first
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("config.yaml", "value: 1"),
+        ("config.json", '{"value": 1}'),
+        ("config.toml", "value = 1"),
+        ("config.ini", "[section]\nvalue = 1"),
+        ("config.env", "VALUE=1"),
+    ],
+)
+def test_conf_from_file_reuses_previous_with_same_content(tmp_path: Path, name: str, content: str) -> None:
+    config_path = tmp_path / name
+    _write(config_path, content)
+    previous = rxconf.Conf.from_file(config_path=config_path)
+    _write(config_path, content, age=0)
+
+    assert rxconf.Conf.from_file(config_path=config_path, previous=previous) is previous
+    assert rxconf.Conf.from_file(config_path=config_path) == previous
+
+
+@pytest.mark.asyncio
+async def test_conf_from_file_async_reloads_previous_with_other_content(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    previous = await rxconf.Conf.from_file_async(config_path=config_path)
+
+    assert await rxconf.Conf.from_file_async(config_path=config_path, previous=previous) is previous
+    _write(config_path, "value: 2")
+    conf = await rxconf.Conf.from_file_async(config_path=config_path, previous=previous)
+    assert conf is not previous
+    assert conf.value == 2
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("config.yaml", "db:\n  host: a\n  pool: [1, 2]\napp:\n  port: {port}\n"),
+        ("config.json", '{{"db": {{"host": "a", "pool": [1, 2]}}, "app": {{"port": {port}}}}}'),
+        ("config.toml", "[db]\nhost = 'a'\npool = [1, 2]\n[app]\nport = {port}\n"),
+    ],
+)
+def test_conf_from_file_shares_unchanged_subtrees(tmp_path: Path, name: str, content: str) -> None:
+    config_path = tmp_path / name
+    _write(config_path, content.format(port=1))
+    previous = rxconf.Conf.from_file(config_path=config_path)
+    _write(config_path, content.format(port=2))
+
+    conf = rxconf.Conf.from_file(config_path=config_path, previous=previous)
+
+    assert conf is not previous
+    assert conf.db is previous.db
+    assert conf.db.pool is previous.db.pool
+    assert conf.app is not previous.app
+    assert conf.app.port == 2
+    assert conf == rxconf.Conf.from_file(config_path=config_path)
+
+
+def test_conf_from_file_does_not_share_values_of_other_types(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "a:\n  b: 1\nc:\n  d: x\n")
+    previous = rxconf.Conf.from_file(config_path=config_path)
+    _write(config_path, "a:\n  b: true\nc:\n  d: x\n  e: y\n")
+
+    conf = rxconf.Conf.from_file(config_path=config_path, previous=previous)
+
+    assert conf.a is not previous.a
+    assert conf.a.b is not previous.a.b
+    assert conf.c is not previous.c
+    assert conf.c.d is previous.c.d
+
+
+def test_stat_file_missing(tmp_path: Path) -> None:
+    assert rxconf.watchers.stat_file(tmp_path / "missing.yaml") is None
+    _write(tmp_path / "config.yaml", "value: 1")
+    stat = rxconf.watchers.stat_file(tmp_path / "config.yaml")
+    assert stat is not None
+    assert stat[1] == os.path.getsize(tmp_path / "config.yaml")
+
+
+def test_rxconf_triggers_on_change(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[str] = []
+    observer = rxconf.RxConf.from_file(config_path=config_path)
+
+    @observer.include_config(triggers=[rxconf.SimpleTrigger(calls.append, args=("changed",))])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert get_value() == 1
+    assert get_value() == 1
+    _write(config_path, "value: 2")
+    assert get_value() == 2
+    assert calls == ["changed"]
+
+
+def test_watched_rxconf_reloads_once_per_edit(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[str] = []
+    observer = rxconf.RxConf.from_file(config_path=config_path, watch=True)
+    factory = observer._factory
+    assert isinstance(factory, rx.WatchedFileConfFactory)
+
+    @observer.include_config(triggers=[rxconf.SimpleTrigger(calls.append, args=("changed",))])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert get_value() == 1
+        _write(config_path, "value: 2")
+        assert _wait_for(lambda: factory.version == 1)
+        assert get_value() == 2
+        assert get_value() == 2
+        assert calls == ["changed"]
+    finally:
+        observer.close()
+
+
+def test_watched_rxconf_detects_atomic_replace(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    observer = rxconf.RxConf.from_file(config_path=config_path, watch=True)
+    factory = observer._factory
+    assert isinstance(factory, rx.WatchedFileConfFactory)
+
+    try:
+        _write(tmp_path / "config.yaml.tmp", "value: 3")
+        os.replace(tmp_path / "config.yaml.tmp", config_path)
+        assert _wait_for(lambda: factory.version == 1)
+        assert factory.create_conf().value == 3
+    finally:
+        observer.close()
+
+
+def test_polling_watcher(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls = []
+    watcher = rxconf.watchers.PollingWatcher(path=config_path, callback=lambda: calls.append(1), poll_interval=0.01)
+    watcher.start()
+
+    try:
+        _write(config_path, "value: 2")
+        assert _wait_for(lambda: len(calls) >= 1)
+    finally:
+        watcher.stop()
+
+
+_REGISTRY_BACKENDS = [
+    pytest.param(
+        True,
+        id="inotify",
+        marks=pytest.mark.skipif(not rxconf.watchers.inotify_available(), reason="inotify is not available"),
+    ),
+    pytest.param(False, id="polling"),
+]
+
+
+@pytest.mark.parametrize("use_inotify", _REGISTRY_BACKENDS)
+def test_watch_registry_fans_out_changed_paths(tmp_path: Path, use_inotify: bool) -> None:
+    first, second = tmp_path / "first.yaml", tmp_path / "second.yaml"
+    _write(first, "value: 1")
+    _write(second, "value: 1")
+    calls: tp.List[str] = []
+    registry = rxconf.watchers.WatchRegistry(use_inotify=use_inotify)
+
+    try:
+        subscriptions = [
+            registry.subscribe(path=first, callback=lambda: calls.append("a"), poll_interval=0.01),
+            registry.subscribe(path=first, callback=lambda: calls.append("b"), poll_interval=0.01),
+            registry.subscribe(path=second, callback=lambda: calls.append("c"), poll_interval=0.01),
+        ]
+        assert len(registry._directories) == 1
+        assert len(registry._callbacks) == 2
+
+        _write(first, "value: 22")
+        assert _wait_for(lambda: {"a", "b"} <= set(calls))
+        assert "c" not in calls
+
+        registry.unsubscribe(subscriptions[0])
+        registry.unsubscribe(subscriptions[0])
+        calls.clear()
+        _write(tmp_path / "second.yaml.tmp", "value: 333")
+        os.replace(tmp_path / "second.yaml.tmp", second)
+        assert _wait_for(lambda: "c" in calls)
+        _write(first, "value: 4444")
+        assert _wait_for(lambda: "b" in calls)
+        assert "a" not in calls
+    finally:
+        registry.close()
+    assert not registry._callbacks
+
+
+def test_watch_registry_survives_broken_callbacks(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls = []
+    registry = rxconf.watchers.WatchRegistry(use_inotify=False)
+
+    def broken() -> None:
+        raise ValueError("broken")
+
+    try:
+        registry.subscribe(path=config_path, callback=broken, poll_interval=0.01)
+        registry.subscribe(path=config_path, callback=lambda: calls.append(1), poll_interval=0.01)
+        _write(config_path, "value: 22")
+        assert _wait_for(lambda: len(calls) == 1)
+        _write(config_path, "value: 333")
+        assert _wait_for(lambda: len(calls) == 2)
+    finally:
+        registry.close()
+
+
+def test_watch_registry_polls_if_inotify_fails_to_start(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[int] = []
+    registry = rxconf.watchers.WatchRegistry(use_inotify=True)
+
+    def exhausted(self: rxconf.watchers.Inotify) -> None:
+        raise OSError(errno.EMFILE, os.strerror(errno.EMFILE))
+
+    monkeypatch.setattr(rxconf.watchers.Inotify, "__init__", exhausted)
+    try:
+        registry.subscribe(path=config_path, callback=lambda: calls.append(1), poll_interval=0.01)
+        assert registry._inotify is None
+        _write(config_path, "value: 22")
+        assert _wait_for(lambda: len(calls) == 1)
+    finally:
+        registry.close()
+
+
+@pytest.mark.skipif(not rxconf.watchers.inotify_available(), reason="inotify is not available")
+def test_watch_registry_polls_if_inotify_watches_are_exhausted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first, second = tmp_path / "first" / "config.yaml", tmp_path / "second" / "config.yaml"
+    for path in (first, second):
+        path.parent.mkdir()
+        _write(path, "value: 1")
+    calls: tp.List[str] = []
+    registry = rxconf.watchers.WatchRegistry(use_inotify=True)
+    add_watch = rxconf.watchers.Inotify.add_watch
+
+    def limited_add_watch(self: rxconf.watchers.Inotify, path: tp.Union[str, Path], mask: int) -> int:
+        if os.fspath(path).startswith(str(second.parent)):
+            raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC), str(path))
+        return add_watch(self, path, mask)
+
+    monkeypatch.setattr(rxconf.watchers.Inotify, "add_watch", limited_add_watch)
+    try:
+        registry.subscribe(path=first, callback=lambda: calls.append("first"), poll_interval=0.01)
+        inotify_thread = registry._thread
+        assert registry._inotify is not None and inotify_thread is not None
+        registry.subscribe(path=second, callback=lambda: calls.append("second"), poll_interval=0.01)
+        assert registry._inotify is None
+        assert _wait_for(lambda: not inotify_thread.is_alive())
+
+        _write(first, "value: 22")
+        _write(second, "value: 22")
+        assert _wait_for(lambda: {"first", "second"} <= set(calls))
+    finally:
+        registry.close()
+
+
+def test_watched_rxconfs_share_registry(tmp_path: Path) -> None:
+    paths = [tmp_path / f"config_{i}.yaml" for i in range(5)]
+    for path in paths:
+        _write(path, "value: 1")
+    registry = rxconf.watchers.get_watch_registry()
+    observers = [rxconf.RxConf.from_file(config_path=path, watch=True) for path in paths]
+
+    try:
+        assert {str(path) for path in paths} <= set(registry._callbacks)
+        assert len([thread for thread in threading.enumerate() if thread.name == "rxconf-watch-registry"]) == 1
+    finally:
+        for observer in observers:
+            observer.close()
+    assert not {str(path) for path in paths} & set(registry._callbacks)
+
+
+def test_refresh_interval_per_function(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    observer = rxconf.RxConf.from_file(config_path=config_path, refresh_interval=60)
+
+    @observer.include_config()
+    def get_cached(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    @observer.include_config(refresh_interval=0)
+    def get_actual(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert get_cached() == 1
+    _write(config_path, "value: 2")
+    assert get_cached() == 1
+    assert get_actual() == 2
+    assert get_cached() == 2
+
+
+@pytest.mark.asyncio
+async def test_async_refresh_interval(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path, refresh_interval=60)
+
+    @observer.include_config()
+    async def get_cached(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    @observer.include_config(refresh_interval=0)
+    async def get_actual(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert await get_cached() == 1
+    _write(config_path, "value: 2")
+    assert await get_cached() == 1
+    assert await get_actual() == 2
+    assert await get_cached() == 2
+
+
+class _CountingFactory(rx.MetaConfFactory):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create_conf(self) -> rxconf.Conf:
+        self.calls += 1
+        return rxconf.Conf.from_env(prefix="RXCONF_TEST_")
+
+
+def test_background_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RXCONF_TEST_VALUE", "1")
+    observer = rxconf.RxConf.from_env(prefix="RXCONF_TEST_", remove_prefix=True).refresh_in_background(
+        min_interval=0.01,
+        max_interval=0.05,
+    )
+    factory = observer._factory
+    assert isinstance(factory, rx.BackgroundConfFactory)
+
+    @observer.include_config()
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert get_value() == 1
+        monkeypatch.setenv("RXCONF_TEST_VALUE", "2")
+        assert _wait_for(lambda: factory.version == 1)
+        assert get_value() == 2
+    finally:
+        observer.close()
+
+
+def test_background_refresh_backs_off() -> None:
+    inner = _CountingFactory()
+    factory = rx.BackgroundConfFactory(factory=inner, min_interval=0.01, max_interval=10)
+
+    try:
+        time.sleep(0.5)
+    finally:
+        factory.close()
+
+    # 0.01 + 0.02 + 0.04 + ... : about 6 reloads in 0.5 seconds instead of 50.
+    assert inner.calls < 10
+
+
+def test_background_refresh_survives_custom_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RXCONF_TEST_VALUE", "1")
+    inner = _CountingFactory()
+    factory = rx.BackgroundConfFactory(factory=inner, min_interval=0.01, max_interval=0.05)
+
+    try:
+        with monkeypatch.context() as patch:
+            patch.setattr(inner, "create_conf", lambda: 1 / 0)
+            time.sleep(0.1)
+            assert not factory.refresh()
+            assert factory.create_conf().rxconf_test_value == 1
+        assert factory._thread.is_alive()
+        monkeypatch.setenv("RXCONF_TEST_VALUE", "2")
+        assert _wait_for(lambda: factory.version == 1)
+        assert factory.create_conf().rxconf_test_value == 2
+    finally:
+        factory.close()
+
+
+def test_background_refresh_wrong_intervals() -> None:
+    with pytest.raises(rxconf.RxConfError):
+        rx.BackgroundConfFactory(factory=_CountingFactory(), min_interval=2, max_interval=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not rxconf.watchers.inotify_available(), reason="inotify is not available")
+async def test_async_watched_rxconf(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[str] = []
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path, watch=True)
+    factory = observer._factory
+    assert isinstance(factory, rx.AsyncWatchedFileConfFactory)
+
+    @observer.include_config(triggers=[rxconf.SimpleAsyncTrigger(calls.append, args=("changed",))])
+    async def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert await get_value() == 1
+        _write(config_path, "value: 2")
+        conf = await asyncio.wait_for(factory.wait_for_change(), timeout=5)
+        assert conf.value == 2
+        assert factory.version == 1
+        assert await get_value() == 2
+        assert await get_value() == 2
+        assert calls == ["changed"]
+    finally:
+        observer.close()
+
+
+@pytest.mark.skipif(not rxconf.watchers.inotify_available(), reason="inotify is not available")
+def test_async_watched_factory_rebinds_closed_loop(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    factory = rx.AsyncWatchedFileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+
+    async def get_value() -> int:
+        return int((await factory.create_conf()).value)
+
+    async def wait_for_value() -> int:
+        waiter = asyncio.ensure_future(factory.wait_for_change())
+        await asyncio.sleep(0.05)
+        _write(config_path, "value: 3")
+        return int((await asyncio.wait_for(waiter, timeout=5)).value)
+
+    try:
+        assert asyncio.run(get_value()) == 1
+        _write(config_path, "value: 2")
+        assert asyncio.run(get_value()) == 2
+        assert factory.version == 1
+        assert asyncio.run(wait_for_value()) == 3
+    finally:
+        factory.close()
+
+
+@pytest.mark.skipif(not rxconf.watchers.inotify_available(), reason="inotify is not available")
+def test_async_watched_factory_serves_two_loops(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    factory = rx.AsyncWatchedFileConfFactory(
+        config_path=config_path,
+        encoding="utf-8",
+        file_config_resolver=rxconf.config_resolver.DefaultFileConfigResolver,
+    )
+    bridge = rxconf.concurrency.LoopBridge()
+
+    async def wait_for_values(value: int) -> tp.List[int]:
+        waiters = [
+            asyncio.ensure_future(factory.wait_for_change()),
+            asyncio.ensure_future(asyncio.to_thread(bridge.run, factory.wait_for_change())),
+        ]
+        await asyncio.sleep(0.05)
+        _write(config_path, f"value: {value}")
+        confs = await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+        return [int(conf.value) for conf in confs]
+
+    async def close() -> None:
+        factory.close()
+
+    try:
+        # The loop bridge of sync functions binds the factory first.
+        assert int(bridge.run(factory.create_conf()).value) == 1
+        assert asyncio.run(wait_for_values(2)) == [2, 2]
+        assert asyncio.run(wait_for_values(3)) == [3, 3]
+        assert factory.version == 2
+    finally:
+        bridge.run(close())
+        bridge.close()
+
+
+def test_watch_callbacks_do_not_wait_for_reloads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    slow_path, fast_path = tmp_path / "slow.yaml", tmp_path / "fast.yaml"
+    _write(slow_path, "value: 1")
+    _write(fast_path, "value: 1")
+    resolver = rxconf.config_resolver.DefaultFileConfigResolver
+    slow = rx.WatchedFileConfFactory(config_path=slow_path, encoding="utf-8", file_config_resolver=resolver)
+    fast = rx.WatchedFileConfFactory(config_path=fast_path, encoding="utf-8", file_config_resolver=resolver)
+    release = threading.Event()
+    reload = slow.reload
+
+    def slow_reload() -> None:
+        release.wait(timeout=5)
+        reload()
+
+    monkeypatch.setattr(slow, "reload", slow_reload)
+    try:
+        _write(slow_path, "value: 2")
+        time.sleep(0.05)
+        _write(fast_path, "value: 2")
+        assert _wait_for(lambda: fast.version == 1)
+        assert slow.version == 0
+        release.set()
+        assert _wait_for(lambda: slow.version == 1)
+    finally:
+        release.set()
+        slow.close()
+        fast.close()
+
+
+class _SlowFactory(rx.MetaConfFactory):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def create_conf(self) -> rxconf.Conf:
+        self.calls += 1
+        time.sleep(0.05)
+        return rxconf.Conf.from_env(prefix="RXCONF_TEST_")
+
+
+def test_rxconf_coalesces_concurrent_reloads() -> None:
+    factory = _SlowFactory()
+    observer = rxconf.RxConf(factory=factory)
+    barrier = threading.Barrier(50)
+
+    @observer.include_config()
+    def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    def worker() -> None:
+        barrier.wait()
+        get_conf()
+
+    threads = [threading.Thread(target=worker) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert factory.calls < 50
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_coalesces_concurrent_reloads(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[int] = []
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path)
+    factory = observer._factory
+    assert isinstance(factory, rx.AsyncFileConfFactory)
+    create_conf = factory.create_conf
+
+    async def counting_create_conf() -> rx.MetaConf:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return await create_conf()
+
+    monkeypatch.setattr(factory, "create_conf", counting_create_conf)
+
+    @observer.include_config()
+    async def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert await asyncio.gather(*(get_value() for _ in range(200))) == [1] * 200
+    assert len(calls) <= 2
+
+
+class _AlternatingFactory(rx.MetaConfFactory):
+    def __init__(self, confs: tp.List[rxconf.Conf]) -> None:
+        self._confs = confs
+        self._calls = 0
+
+    def create_conf(self) -> rxconf.Conf:
+        self._calls += 1
+        return self._confs[self._calls % len(self._confs)]
+
+
+def test_rxconf_triggers_see_consistent_snapshots(tmp_path: Path) -> None:
+    confs = []
+    for value in range(2):
+        _write(tmp_path / f"config_{value}.yaml", f"value: {value}")
+        confs.append(rxconf.Conf.from_file(config_path=tmp_path / f"config_{value}.yaml"))
+    pairs: tp.List[tp.Tuple[rx.MetaConf, rx.MetaConf]] = []
+    observer = rxconf.RxConf(factory=_AlternatingFactory(confs))
+
+    class RecordingTrigger(rx.MetaTrigger):
+        def __call__(
+            self,
+            old_conf: rx.MetaConf,
+            actual_conf: rx.MetaConf,
+            changes: tp.Optional[rxconf.ChangeSet] = None,
+        ) -> None:
+            pairs.append((old_conf, actual_conf))
+
+    @observer.include_config(triggers=[RecordingTrigger()])
+    def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    def worker() -> None:
+        for _ in range(100):
+            get_conf()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert pairs
+    for (_, previous_actual), (old, _) in zip(pairs, pairs[1:]):  # noqa: B905 (Python 3.9)
+        assert old is previous_actual
+    assert observer.snapshot.conf is pairs[-1][1]
+    assert observer.snapshot.version == len(pairs) + 1
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_drops_stale_reloads(tmp_path: Path) -> None:
+    confs = []
+    for value in range(3):
+        _write(tmp_path / f"config_{value}.yaml", f"value: {value}")
+        confs.append(rxconf.Conf.from_file(config_path=tmp_path / f"config_{value}.yaml"))
+    entered, release = threading.Event(), threading.Event()
+
+    class SlowFirstFactory(rx.MetaConfFactory):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def create_conf(self) -> rxconf.Conf:
+            self.calls += 1
+            if self.calls == 1:
+                entered.set()
+                release.wait(timeout=5)
+                return confs[1]
+            return confs[2]
+
+    observer = rxconf.AsyncRxConf(factory=SlowFirstFactory())
+    observer.current_conf = confs[0]
+
+    @observer.include_config()
+    def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    @observer.include_config()
+    async def get_conf_async(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    loop = asyncio.get_running_loop()
+    slow = loop.run_in_executor(None, get_conf)
+    assert await loop.run_in_executor(None, entered.wait, 5)
+    assert await get_conf_async() is confs[2]
+    release.set()
+
+    assert await slow is confs[2]
+    assert observer.snapshot.conf is confs[2]
+
+
+def test_rxconf_reads_published_snapshot_without_reload(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    observer = rxconf.RxConf.from_file(config_path=config_path, watch=True)
+
+    @observer.include_config()
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert get_value() == 1
+        version = observer.snapshot.version
+        assert get_value() == 1
+        assert observer.snapshot.version == version
+    finally:
+        observer.close()
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_sync_function_inside_running_loop(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[str] = []
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path)
+
+    @observer.include_config(triggers=[rxconf.SimpleAsyncTrigger(calls.append, args=("changed",))])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert get_value() == 1
+    _write(config_path, "value: 2")
+    assert get_value() == 2
+    assert calls == ["changed"]
+
+
+def test_async_rxconf_sync_function_reads_published_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("RXCONF_TEST_VALUE", "1")
+    factory = rx.BackgroundConfFactory(factory=_CountingFactory(), min_interval=10, max_interval=10)
+    observer = rxconf.AsyncRxConf(factory=factory)
+
+    @observer.include_config()
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.rxconf_test_value)
+
+    try:
+        assert get_value() == 1
+        snapshot = observer.snapshot
+        assert get_value() == 1
+        assert observer.snapshot is snapshot
+    finally:
+        observer.close()
+
+
+def test_rxconf_runs_triggers_in_background(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    release = threading.Event()
+    calls = []
+
+    def slow_trigger() -> None:
+        release.wait(timeout=5)
+        calls.append("changed")
+
+    observer = rxconf.RxConf.from_file(config_path=config_path).run_triggers_in_background()
+
+    @observer.include_config(triggers=[rxconf.SimpleTrigger(slow_trigger)])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert get_value() == 1
+        _write(config_path, "value: 2")
+        assert get_value() == 2
+        assert calls == []
+        release.set()
+        observer.wait_triggers(timeout=5)
+        assert calls == ["changed"]
+    finally:
+        observer.close()
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_runs_triggers_in_background(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls = []
+
+    async def slow_trigger() -> None:
+        await asyncio.sleep(0.05)
+        calls.append("async")
+
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path).run_triggers_in_background(parallel=True)
+
+    @observer.include_config(
+        triggers=[rxconf.SimpleAsyncTrigger(slow_trigger), rxconf.SimpleTrigger(calls.append, args=("sync",))]
+    )
+    async def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert await get_value() == 1
+        _write(config_path, "value: 2")
+        assert await get_value() == 2
+        await observer.wait_triggers(timeout=5)
+        assert sorted(calls) == ["async", "sync"]
+    finally:
+        observer.close()
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_sync_function_runs_async_triggers_in_background(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    calls: tp.List[str] = []
+
+    async def slow_trigger() -> None:
+        await asyncio.sleep(0.05)
+        calls.append("async")
+
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path).run_triggers_in_background()
+
+    @observer.include_config(triggers=[rxconf.SimpleAsyncTrigger(slow_trigger)])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert get_value() == 1
+        _write(config_path, "value: 2")
+        assert get_value() == 2
+        await observer.wait_triggers(timeout=5)
+        assert calls == ["async"]
+    finally:
+        observer.close()
+
+
+@pytest.mark.parametrize("observer_cls", [rxconf.RxConf, rxconf.AsyncRxConf])
+def test_background_triggers_call_the_observer_while_the_queue_is_full(
+    tmp_path: Path,
+    observer_cls: tp.Type[tp.Union[rxconf.RxConf, rxconf.AsyncRxConf]],
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    values: tp.List[int] = []
+    observer = observer_cls.from_file(config_path=config_path)
+    observer.run_triggers_in_background(max_workers=1, max_queue_size=1)
+
+    def read_value() -> None:
+        values.append(get_value())
+
+    @observer.include_config(triggers=[rxconf.SimpleTrigger(read_value), rxconf.SimpleTrigger(read_value)])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    try:
+        assert get_value() == 1
+        _write(config_path, "value: 2")
+        # The second call is submitted while the first one, which reloads the configuration, holds the only slot.
+        caller = threading.Thread(target=get_value, daemon=True)
+        caller.start()
+        caller.join(timeout=5)
+        assert not caller.is_alive()
+        _wait_for(lambda: len(values) == 2)
+        assert values == [2, 2]
+    finally:
+        observer.close()
+
+
+def test_rxconf_debounces_bursts_of_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    values: tp.List[tp.Tuple[int, int]] = []
+    observer = rxconf.RxConf.from_file(config_path=config_path, debounce=0.2)
+
+    class RecordingTrigger(rx.MetaTrigger):
+        def __call__(
+            self,
+            old_conf: rx.MetaConf,
+            actual_conf: rx.MetaConf,
+            changes: tp.Optional[rxconf.ChangeSet] = None,
+        ) -> None:
+            values.append((int(old_conf.value), int(actual_conf.value)))
+
+    @observer.include_config(triggers=[RecordingTrigger()])
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert get_value() == 1
+    _write(config_path, "")
+    assert get_value() == 1
+    _write(config_path, "value: [")
+    assert get_value() == 1
+    _write(config_path, "value: 3")
+    assert get_value() == 1
+    time.sleep(0.25)
+    assert get_value() == 3
+    assert values == [(1, 3)]
+
+
+def test_rxconf_debounce_ignores_reverted_burst(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    observer = rxconf.RxConf.from_file(config_path=config_path, debounce=0.1)
+
+    @observer.include_config()
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert get_value() == 1
+    _write(config_path, "value: [")
+    assert get_value() == 1
+    time.sleep(0.15)
+    with pytest.raises(rxconf.RxConfError):
+        get_value()
+    _write(config_path, "value: 1")
+    assert get_value() == 1
+    assert observer.snapshot.version == 1
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_debounces_bursts_of_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "value: 1")
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path, debounce=0.1)
+
+    @observer.include_config()
+    async def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.value)
+
+    assert await get_value() == 1
+    _write(config_path, "value: 2")
+    assert await get_value() == 1
+    await asyncio.sleep(0.15)
+    assert await get_value() == 2
+
+
+def test_debounced_factory_wrong_window() -> None:
+    with pytest.raises(rxconf.RxConfError):
+        rx.DebouncedConfFactory(factory=_CountingFactory(), window=-1)
+
+
+def test_rxconf_passes_one_change_set_to_triggers(tmp_path: Path) -> None:
+    _write(tmp_path / "config_0.yaml", "db:\n  pool:\n    size: 1\n  host: a\n")
+    _write(tmp_path / "config_1.yaml", "db:\n  pool:\n    size: 2\n  host: a\nnew: 1\n")
+    confs = [rxconf.Conf.from_file(config_path=tmp_path / f"config_{i}.yaml") for i in range(2)]
+    observer = rxconf.RxConf(factory=_AlternatingFactory(confs))
+    received = []
+
+    class RecordingTrigger(rx.MetaTrigger):
+        accepts_changes = True
+
+        def __call__(
+            self,
+            old_conf: rx.MetaConf,
+            actual_conf: rx.MetaConf,
+            changes: tp.Optional[rxconf.ChangeSet] = None,
+        ) -> None:
+            received.append(changes)
+
+    recording = RecordingTrigger()
+    triggers = [
+        rxconf.OnChangeTrigger(trigger=recording, any_attributes=("db.pool",)),
+        rxconf.OnChangeTrigger(trigger=recording, all_attributes=("db.pool.size", "new")),
+        rxconf.OnChangeTrigger(trigger=recording, any_attributes=("db.host",)),
+        recording,
+    ]
+
+    @observer.include_config(triggers=triggers)
+    def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    get_conf()
+
+    assert len(received) == 3
+    assert received[0] is received[1] is received[2]
+    # The first conf comes from confs[1], the reload gives confs[0].
+    assert received[0] == rxconf.diff(confs[1], confs[0])
+    assert received[0].removed == {"new"}
+    assert received[0].changed == {"db", "db.pool", "db.pool.size"}
+
+
+def test_on_change_trigger_computes_changes_itself(tmp_path: Path) -> None:
+    _write(tmp_path / "config_0.yaml", "a: 1\n")
+    _write(tmp_path / "config_1.yaml", "a: 1\nb: 2\n")
+    old, actual = (rxconf.Conf.from_file(config_path=tmp_path / f"config_{i}.yaml") for i in range(2))
+    calls = []
+    trigger = rxconf.OnChangeTrigger(
+        trigger=rxconf.SimpleTrigger(lambda: calls.append(1)),
+        any_attributes=("b",),
+    )
+
+    trigger(old_conf=old, actual_conf=actual)
+    trigger(old_conf=old, actual_conf=old)
+
+    assert calls == [1]
+
+
+def test_on_change_triggers_reject_unknown_attributes(tmp_path: Path) -> None:
+    _write(tmp_path / "config_0.yaml", "a: 1\nb: 1\n")
+    _write(tmp_path / "config_1.yaml", "a: 2\nb: 1\nc: 1\n")
+    old, actual = (rxconf.Conf.from_file(config_path=tmp_path / f"config_{i}.yaml") for i in range(2))
+    calls: tp.List[str] = []
+
+    async def record(name: str) -> None:
+        calls.append(name)
+
+    typo = rxconf.OnChangeTrigger(trigger=rxconf.SimpleTrigger(calls.append, args=("typo",)), any_attributes=("a", "d"))
+    async_typo = rxconf.OnChangeAsyncTrigger(
+        trigger=rxconf.SimpleAsyncTrigger(record, args=("typo",)),
+        all_attributes=("a", "b.x"),
+    )
+    added = rxconf.OnChangeTrigger(
+        trigger=rxconf.SimpleTrigger(calls.append, args=("added",)),
+        any_attributes=("c", "*.x", "d.**"),
+    )
+
+    with pytest.raises(rxconf.InvalidAttributeError):
+        typo(old_conf=old, actual_conf=actual)
+    with pytest.raises(rxconf.InvalidAttributeError):
+        asyncio.run(async_typo(old_conf=old, actual_conf=actual))
+    typo(old_conf=old, actual_conf=old)
+    added(old_conf=old, actual_conf=actual)
+    assert calls == ["added"]
+
+    observer = rxconf.RxConf(factory=_AlternatingFactory([old, actual]))
+
+    @observer.include_config(
+        triggers=[added, rxconf.OnChangeTrigger(trigger=rxconf.SimpleTrigger(calls.append), any_attributes=("d",))]
+    )
+    def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    with pytest.raises(rxconf.InvalidAttributeError):
+        get_conf()
+    assert calls == ["added", "added"]
+
+
+def test_rxconf_dispatches_only_matching_triggers(tmp_path: Path) -> None:
+    _write(tmp_path / "config_0.yaml", "services:\n  api:\n    port: 1\n  web:\n    port: 2\ndb:\n  host: a\n")
+    _write(tmp_path / "config_1.yaml", "services:\n  api:\n    port: 1\n  web:\n    port: 3\ndb:\n  host: a\n")
+    confs = [rxconf.Conf.from_file(config_path=tmp_path / f"config_{i}.yaml") for i in range(2)]
+    observer = rxconf.RxConf(factory=_AlternatingFactory(confs))
+    calls: tp.List[str] = []
+
+    def on_change(name: str) -> rxconf.OnChangeTrigger:
+        return rxconf.OnChangeTrigger(trigger=rxconf.SimpleTrigger(calls.append, args=(name,)), any_attributes=(name,))
+
+    @observer.include_config(
+        triggers=[
+            on_change("services.*.port"),
+            on_change("Services.**"),
+            on_change("db.**"),
+            on_change("*.api.port"),
+            rxconf.OnChangeTrigger(
+                trigger=rxconf.SimpleTrigger(calls.append, args=("all",)),
+                all_attributes=("services.web.port", "services.*"),
+            ),
+        ]
+    )
+    def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    get_conf()
+
+    assert calls == ["services.*.port", "Services.**", "all"]
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_dispatches_only_matching_triggers(tmp_path: Path) -> None:
+    _write(tmp_path / "config_0.yaml", "a:\n  b: 1\nc: 1\n")
+    _write(tmp_path / "config_1.yaml", "a:\n  b: 2\nc: 1\n")
+    confs = [rxconf.Conf.from_file(config_path=tmp_path / f"config_{i}.yaml") for i in range(2)]
+    observer = rxconf.AsyncRxConf(factory=_AlternatingFactory(confs))
+    calls: tp.List[str] = []
+
+    async def record(name: str) -> None:
+        calls.append(name)
+
+    @observer.include_config(
+        triggers=[
+            rxconf.OnChangeTrigger(trigger=rxconf.SimpleTrigger(calls.append, args=("sync",)), any_attributes=("c",)),
+            rxconf.OnChangeAsyncTrigger(
+                trigger=rxconf.SimpleAsyncTrigger(record, args=("a.*",)),
+                any_attributes=("a.*",),
+            ),
+            rxconf.OnChangeAsyncTrigger(trigger=rxconf.SimpleAsyncTrigger(record, args=("c",)), any_attributes=("c",)),
+        ]
+    )
+    async def get_conf(conf: rxconf.Conf) -> rxconf.Conf:
+        return conf
+
+    await get_conf()
+
+    assert calls == ["a.*"]
+
+
+def _layered_factory(tmp_path: Path, deep_merge: bool = True) -> rx.LayeredConfFactory:
+    resolver = rxconf.config_resolver.DefaultFileConfigResolver
+    return rx.LayeredConfFactory(
+        factories=[
+            rx.FileConfFactory(config_path=tmp_path / "base.yaml", encoding="utf-8", file_config_resolver=resolver),
+            rx.FileConfFactory(config_path=tmp_path / "prod.json", encoding="utf-8", file_config_resolver=resolver),
+            rx.FileConfFactory(config_path=tmp_path / "config.env", encoding="utf-8", file_config_resolver=resolver),
+            rx.EnvConfFactory(prefix="RXCONF_LAYER_", remove_prefix=True),
+        ],
+        deep_merge=deep_merge,
+    )
+
+
+def test_layered_factory_merges_layers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write(tmp_path / "base.yaml", "db:\n  host: localhost\n  port: 5432\n  pool: [1, 2]\nname: base\ndebug: true\n")
+    _write(tmp_path / "prod.json", '{"db": {"host": "db.prod", "pool": [3]}, "name": "prod"}')
+    _write(tmp_path / "config.env", "DEBUG=false\n")
+    monkeypatch.setenv("RXCONF_LAYER_WORKERS", "8")
+
+    conf = _layered_factory(tmp_path).create_conf()
+    shallow = _layered_factory(tmp_path, deep_merge=False).create_conf()
+
+    assert conf.db.host == "db.prod"
+    assert conf.db.port == 5432
+    assert conf.db.pool == [3]
+    assert conf.name == "prod"
+    assert conf.debug == False  # noqa: E712
+    assert conf.workers == 8
+    assert shallow.db.host == "db.prod"
+    with pytest.raises(rxconf.RxConfError):
+        _ = shallow.db.port
+
+
+def test_layered_factory_remerges_only_changed_layers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write(tmp_path / "base.yaml", "db:\n  host: localhost\n  port: 5432\napp:\n  name: base\n")
+    _write(tmp_path / "prod.json", '{"db": {"host": "db.prod"}}')
+    _write(tmp_path / "config.env", "")
+    monkeypatch.setenv("RXCONF_LAYER_WORKERS", "8")
+    factory = _layered_factory(tmp_path)
+
+    first = factory.create_conf()
+    assert factory.create_conf() is first
+
+    _write(tmp_path / "base.yaml", "db:\n  host: localhost\n  port: 5432\napp:\n  name: changed\n")
+    second = factory.create_conf()
+    assert second is not first
+    assert second.app.name == "changed"
+    assert second.db is first.db
+
+    # The change is overridden by a higher layer: the merged configuration stays the same.
+    _write(tmp_path / "base.yaml", "db:\n  host: other\n  port: 5432\napp:\n  name: changed\n")
+    assert factory.create_conf() is second
+
+
+@pytest.mark.asyncio
+async def test_async_rxconf_with_layered_factory(tmp_path: Path) -> None:
+    _write(tmp_path / "base.yaml", "db:\n  host: localhost\n  port: 1\n")
+    _write(tmp_path / "overlay.yaml", "db:\n  port: 2\n")
+    resolver = rxconf.config_resolver.DefaultFileConfigResolver
+    factory = rx.AsyncLayeredConfFactory(
+        factories=[
+            rx.AsyncFileConfFactory(
+                config_path=tmp_path / "base.yaml",
+                encoding="utf-8",
+                file_config_resolver=resolver,
+            ),
+            rx.FileConfFactory(config_path=tmp_path / "overlay.yaml", encoding="utf-8", file_config_resolver=resolver),
+        ]
+    )
+    observer = rxconf.AsyncRxConf(factory=factory)
+    changes: tp.List[str] = []
+
+    @observer.include_config(
+        triggers=[
+            rxconf.OnChangeTrigger(
+                trigger=rxconf.SimpleTrigger(changes.append, args=("port",)),
+                any_attributes=("db.port",),
+            )
+        ]
+    )
+    async def get_port(conf: rxconf.Conf) -> int:
+        return int(conf.db.port)
+
+    assert await get_port() == 2
+    _write(tmp_path / "overlay.yaml", "db:\n  port: 3\n")
+    assert await get_port() == 3
+    assert changes == ["port"]
+
+
+def test_layered_factory_without_layers() -> None:
+    with pytest.raises(rxconf.RxConfError):
+        rx.LayeredConfFactory(factories=[])
+
+
+def _config_map_generation(root: Path, name: str, files: tp.Dict[str, str]) -> None:
+    """Publishes the files the way kubelet updates a ConfigMap volume: new directory and atomic `..data` swap."""
+
+    generation = root / name
+    generation.mkdir()
+    for file_name, content in files.items():
+        _write(generation / file_name, content)
+    (root / "..data_tmp").symlink_to(name)
+    os.replace(root / "..data_tmp", root / "..data")
+    for file_name in files:
+        if not (root / file_name).is_symlink():
+            (root / file_name).symlink_to(Path("..data") / file_name)
+
+
+def test_directory_factory_merges_files_in_order(tmp_path: Path) -> None:
+    _write(tmp_path / "10-base.yaml", "db:\n  host: localhost\n  port: 1\nname: base\n")
+    _write(tmp_path / "20-prod.yaml", "db:\n  host: db.prod\n")
+    _write(tmp_path / "30-local.yaml", "name: local\n")
+    _write(tmp_path / "ignored.json", '{"name": "json"}')
+    factory = rx.DirectoryConfFactory(directory=tmp_path)
+
+    conf = factory.create_conf()
+
+    assert conf.db.host == "db.prod"
+    assert conf.db.port == 1
+    assert conf.name == "local"
+    assert factory.create_conf() is conf
+    _write(tmp_path / "20-prod.yaml", "db:\n  host: db.stage\n")
+    assert factory.create_conf().db.host == "db.stage"
+    (tmp_path / "30-local.yaml").unlink()
+    assert factory.create_conf().name == "base"
+    factory.close()
+
+
+def test_directory_factory_parses_changed_files_in_parallel(tmp_path: Path) -> None:
+    for number in range(40):
+        _write(tmp_path / f"{number:02}.yaml", f"fragment_{number}:\n  value: {number}\n")
+    factory = rx.DirectoryConfFactory(directory=tmp_path, max_workers=4)
+
+    try:
+        conf = factory.create_conf()
+        assert conf.fragment_0.value == 0
+        assert conf.fragment_39.value == 39
+        _write(tmp_path / "07.yaml", "fragment_7:\n  value: 70\n")
+        changed = factory.create_conf()
+    finally:
+        factory.close()
+
+    assert changed.fragment_7.value == 70
+    assert changed.fragment_8 is conf.fragment_8
+
+
+def test_directory_factory_reloads_config_map_swap_atomically(tmp_path: Path) -> None:
+    _config_map_generation(tmp_path, "..2024_01", {"a.yaml": "version: 1\na: 1\n", "b.yaml": "b: 1\n"})
+    observer = rxconf.RxConf.from_directory(directory=tmp_path)
+    seen = []
+
+    @observer.include_config()
+    def get_conf(conf: rxconf.Conf) -> tp.Tuple[int, int, int]:
+        return int(conf.version), int(conf.a), int(conf.b)
+
+    seen.append(get_conf())
+    _config_map_generation(tmp_path, "..2024_02", {"a.yaml": "version: 2\na: 2\n", "b.yaml": "b: 2\nversion: 2\n"})
+    seen.append(get_conf())
+
+    assert seen == [(1, 1, 1), (2, 2, 2)]
+
+
+def test_directory_factory_without_files(tmp_path: Path) -> None:
+    with pytest.raises(rxconf.ConfigNotFoundError):
+        rx.DirectoryConfFactory(directory=tmp_path).create_conf()
+    with pytest.raises(rxconf.ConfigNotFoundError):
+        rx.DirectoryConfFactory(directory=tmp_path / "missing").create_conf()
+
+
+def _read_shared_value(name: str, queue: tp.Any) -> None:
+    observer = rxconf.RxConf.from_shared_memory(name=name)
+
+    @observer.include_config()
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.app.value)
+
+    try:
+        queue.put(get_value())
+    finally:
+        observer.close()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available")
+def test_shared_memory_publication(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "app:\n  value: 1")
+    name = f"rxconf-test-{uuid.uuid4().hex[:8]}"
+    publisher = rxconf.RxConf.from_file(config_path=config_path).publish_to_shared_memory(name=name, size=4096)
+    context = multiprocessing.get_context("fork")
+
+    @publisher.include_config()
+    def get_value(conf: rxconf.Conf) -> int:
+        return int(conf.app.value)
+
+    try:
+        reader = rx.SharedMemoryConfFactory(name=name)
+        worker = rxconf.RxConf(factory=reader)
+
+        @worker.include_config()
+        def get_worker_value(conf: rxconf.Conf) -> int:
+            return int(conf.app.value)
+
+        assert get_worker_value() == 1
+        _write(config_path, "app:\n  value: 22")
+        assert get_worker_value() == 1
+        assert get_value() == 22
+        assert get_worker_value() == 22
+        assert reader.version == 2
+
+        queue = context.Queue()
+        process = context.Process(target=_read_shared_value, args=(name, queue))
+        process.start()
+        assert queue.get(timeout=10) == 22
+        process.join(timeout=10)
+        assert process.exitcode == 0
+        worker.close()
+    finally:
+        publisher.close()
+
+
+def test_snapshot_cache_skips_parsing(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    cache_dir = tmp_path / "cache"
+    _write(config_path, "app:\n  name: rxconf\n  workers: 4\n")
+
+    parsed = rxconf.Conf.from_file(config_path, cache_dir=cache_dir)
+    cached = rxconf.Conf.from_file(config_path, cache_dir=cache_dir)
+
+    assert len(list(cache_dir.glob("*.rxsnap"))) == 1
+    assert isinstance(cached._MetaTree__structure, rxconf.snapshots.SnapshotConfig)
+    assert cached == parsed
+    assert cached.app.workers == 4
+
+    _write(config_path, "app:\n  name: rxconf\n  workers: 8\n")
+    assert rxconf.Conf.from_file(config_path, cache_dir=cache_dir).app.workers == 8
+    assert len(list(cache_dir.glob("*.rxsnap"))) == 2
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cache_async(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    cache_dir = tmp_path / "cache"
+    _write(config_path, "[app]\nworkers = 4\n")
+
+    parsed = await rxconf.Conf.from_file_async(config_path, cache_dir=cache_dir)
+    cached = await rxconf.Conf.from_file_async(config_path, cache_dir=cache_dir)
+
+    assert isinstance(cached._MetaTree__structure, rxconf.snapshots.SnapshotConfig)
+    assert cached == parsed
+
+
+def test_snapshot_cache_ignores_broken_entries(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    cache_dir = tmp_path / "cache"
+    _write(config_path, '{"workers": 4}')
+    rxconf.Conf.from_file(config_path, cache_dir=cache_dir)
+    (entry,) = cache_dir.glob("*.rxsnap")
+    entry.write_bytes(b"broken")
+
+    assert rxconf.Conf.from_file(config_path, cache_dir=cache_dir).workers == 4
+    assert rxconf.Conf.from_file(config_path, cache_dir=cache_dir).workers == 4
+    assert entry.read_bytes() != b"broken"
+
+
+def test_compile_cli_populates_cache(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    from rxconf.__main__ import main
+
+    conf_d = tmp_path / "conf.d"
+    conf_d.mkdir()
+    cache_dir = tmp_path / "cache"
+    _write(conf_d / "10-base.yaml", "workers: 4\n")
+    _write(conf_d / "20-extra.json", '{"debug": true}')
+    _write(conf_d / "README.md", "not a config")
+
+    assert main(["compile", "--cache-dir", str(cache_dir), str(conf_d)]) == 0
+    assert len(list(cache_dir.glob("*.rxsnap"))) == 2
+    assert "10-base.yaml" in capsys.readouterr().out
+    conf = rxconf.Conf.from_file(conf_d / "10-base.yaml", cache_dir=cache_dir)
+    assert isinstance(conf._MetaTree__structure, rxconf.snapshots.SnapshotConfig)
+
+    _write(conf_d / "30-broken.yaml", "workers: [")
+    assert main(["compile", "--cache-dir", str(cache_dir), str(conf_d), str(conf_d / "README.md")]) == 1
+    assert "30-broken.yaml" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "inner_structures.yml",
+        "inner_structures.json",
+        "inner_structures.toml",
+        "inner_structures.ini",
+        "primitives.env",
+    ],
+)
+def test_lazy_tree_matches_eager_tree(name: str) -> None:
+    path = Path.cwd() / "tests/resources" / name
+    eager = rxconf.Conf.from_file(path)
+    lazy = rxconf.Conf.from_file(path, lazy=True)
+
+    assert lazy._MetaTree__structure._hash is None
+    assert lazy._MetaTree__structure.hash == eager._MetaTree__structure.hash
+    assert repr(lazy) == repr(eager)
+    assert not rxconf.diff(eager, lazy)
+
+
+def test_lazy_tree_detects_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "db:\n  host: localhost\n  port: 5432\nservices:\n  a: 1\n")
+    old = rxconf.Conf.from_file(config_path, lazy=True)
+    assert old.db.port == 5432
+
+    _write(config_path, "db:\n  host: localhost\n  port: 5433\nservices:\n  a: 1\n")
+    new = rxconf.Conf.from_file(config_path, previous=old, lazy=True)
+    assert new is not old
+    assert new != old
+    assert rxconf.diff(old, new).changed == {"db", "db.port"}
+    assert rxconf.Conf.from_file(config_path, previous=new, lazy=True) is new
+
+
+@pytest.mark.asyncio
+async def test_lazy_tree_in_async_rxconf(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, '{"Workers": 4, "hosts": ["a", "b"]}')
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path, lazy=True)
+
+    @observer.include_config()
+    async def workers(conf: rxconf.Conf) -> int:
+        return int(conf.workers) + len(conf.hosts)
+
+    assert await workers() == 6
+
+
+def test_conf_helpers_do_not_shadow_keys(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "get: 1\nget_many: 2\nunboxed: 3\ncompile: 4\ndiff: 5\n")
+    conf = rxconf.Conf.from_file(config_path)
+
+    assert conf.get == 1 and conf.get_many == 2 and conf.unboxed == 3 and conf.compile == 4
+    assert rxconf.unboxed_view(conf).unboxed == 3
+    assert rxconf.compiled_view(conf).compile == 4
+    assert conf.diff == 5 and not rxconf.diff(conf, conf)
+    assert rxconf.lookup_many(conf, ["get", "get_many"]) == [1, 2]
+
+
+def test_unboxed_leaves(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "limits:\n  rps: 100\nflags:\n  x: true\nhosts: [a, {port: 1}]\n")
+    conf = rxconf.Conf.from_file(config_path)
+    unboxed = rxconf.unboxed_view(conf)
+
+    assert unboxed is rxconf.unboxed_view(conf) and rxconf.unboxed_view(unboxed) is unboxed
+    assert unboxed == conf
+    assert type(unboxed.limits.rps) is int and unboxed.limits.rps * 2 == 200
+    assert unboxed.flags.x is True
+    assert unboxed.hosts[1].port == 1
+    assert rxconf.lookup(unboxed, "hosts.0") == "a"
+    assert rxconf.lookup_many(unboxed, ["limits.rps", "missing"], default=0) == [100, 0]
+    assert isinstance(conf.limits.rps, rxconf.attributes.AttributeType)
+
+
+def test_unbox_leaves_observer(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "limits:\n  rps: 100\n")
+    calls: list = []
+    observer = rxconf.RxConf.from_file(config_path=config_path).unbox_leaves()
+
+    @observer.include_config(triggers=[rxconf.SimpleTrigger(calls.append, args=("changed",))])
+    def rps(conf: rxconf.Conf) -> int:
+        return conf.limits.rps
+
+    assert type(rps()) is int and rps() == 100
+    assert not calls
+    _write(config_path, "limits:\n  rps: 200\n")
+    assert rps() == 200
+    assert calls == ["changed"]
+
+
+@pytest.mark.asyncio
+async def test_unbox_leaves_async_observer(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.json"
+    _write(config_path, '{"limits": {"rps": 100}}')
+    observer = rxconf.AsyncRxConf.from_file(config_path=config_path).unbox_leaves()
+
+    @observer.include_config()
+    async def rps(conf: rxconf.Conf) -> int:
+        return conf.limits.rps
+
+    assert type(await rps()) is int
+
+
+def test_unboxed_factories_forward_nonblocking(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class PublishedAsyncFactory(rx.AsyncFileConfFactory):
+        nonblocking = True
+
+    config_path = tmp_path / "config.yaml"
+    resolver = rxconf.config_resolver.DefaultFileConfigResolver
+    published = PublishedAsyncFactory(config_path=config_path, encoding="utf-8", file_config_resolver=resolver)
+    loading = rx.AsyncFileConfFactory(config_path=config_path, encoding="utf-8", file_config_resolver=resolver)
+    monkeypatch.setenv("RXCONF_TEST_VALUE", "1")
+    background = rx.BackgroundConfFactory(factory=_CountingFactory(), min_interval=0.01, max_interval=10)
+
+    try:
+        assert rx.UnboxedConfFactory(factory=background).nonblocking
+        assert not rx.UnboxedConfFactory(factory=_CountingFactory()).nonblocking
+        assert rx.AsyncUnboxedConfFactory(factory=published).nonblocking
+        assert not rx.AsyncUnboxedConfFactory(factory=loading).nonblocking
+    finally:
+        background.close()
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compiled_conf(tmp_path: Path, lazy: bool) -> None:
+    config_path = tmp_path / "config.yaml"
+    _write(config_path, "db:\n  host: localhost\n  port: 5432\nhosts: [a, {port: 1}]\n")
+    conf = rxconf.Conf.from_file(config_path, lazy=lazy)
+    compiled = rxconf.compiled_view(conf)
+
+    assert compiled is rxconf.compiled_view(conf) and rxconf.compiled_view(compiled) is compiled
+    assert compiled == conf
+    assert type(compiled.db.port) is int and compiled.db.port == 5432
+    assert compiled.DB.HOST == "localhost"
+    assert compiled.hosts[1].port == 1
+    assert rxconf.lookup(compiled, "hosts.1.port") == 1
+    assert rxconf.lookup_many(compiled, ["db.port", "missing"], default=0) == [5432, 0]
+    assert "db.host" in compiled
+
+    _write(config_path, "db:\n  host: remote\n  port: 5433\nhosts: [a, {port: 1}]\n")
+    reloaded = rxconf.compiled_view(rxconf.Conf.from_file(config_path, lazy=lazy))
+    assert reloaded.db.port == 5433
+    assert type(reloaded.db) is type(compiled.db)
@@ -128,3 +128,31 @@ def test_inner_structures() -> None:
     assert list(conf.config.preferences.favorites) == ["a", "b", "c"]
     assert conf.config.is_active == True  # noqa: E712
     assert conf.second.element == "value"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_dotted_path_lookups(lazy: bool) -> None:
+    conf = rxconf.Conf.from_file(config_path=_RESOURCE_DIR / "inner_structures.yml", lazy=lazy)
+
+    assert rxconf.lookup(conf, "config.address.address") == "123 Main St"
+    assert rxconf.lookup(conf, "CONFIG.AdDRess.ADDRESS") is conf.config.address.address
+    assert rxconf.lookup(conf, "config.hobbies.1") == "2"
+    assert rxconf.lookup(conf, "config.preferences.favorites.2") == "c"
+    assert rxconf.lookup(conf, "config.hobbies.3") is None
+    assert rxconf.lookup(conf, "config.name.first", default="-") == "-"
+    assert rxconf.lookup_many(conf, ["second.element", "config.age", "missing"], default=0) == ["value", 42, 0]
+    assert "config.is_active" in conf
+    assert "config.address.city" in conf
+    assert rxconf.lookup(conf, "config.missing.key") is None
+    assert rxconf.lookup(conf, "config.missing.key", default=0) == 0
+    assert "config.missing" not in conf
+    assert 1 not in conf
+
+    index = conf._MetaTree__structure._path_index
+    assert "config.address.address" in index
+    assert "missing" not in index
+    assert rxconf.lookup(conf, "missing", default=-1) == -1
+
+    for number in range(1000):
+        assert rxconf.lookup(conf, f"missing.{number}") is None
+    assert len(conf._MetaTree__structure._missing_paths) <= rxconf.config_types._MISSING_PATHS_LIMIT
@@ -2,14 +2,19 @@ import unittest
 
 import rxconf
 from rxconf.attributes import (
+    AttributeMap,
     EnvAttribute,
     IniAttribute,
     JsonAttribute,
+    LazyAttribute,
     MockAttribute,
     TomlAttribute,
+    UnboxedAttribute,
     VaultAttribute,
     YamlAttribute,
+    unbox,
 )
+from rxconf.hashtools import compute_conf_hash, compute_node_hash, get_subtree_hash
 
 
 class TestAttributeType(unittest.TestCase):
@@ -220,3 +225,114 @@ class TestEnvAttribute(unittest.TestCase):
         attr = EnvAttribute({"key": "value"})  # type: ignore
         with self.assertRaises(rxconf.RxConfError):
             _ = attr.nonexistent_key
+
+
+class TestSubtreeHash(unittest.TestCase):
+
+    def test_hash_is_stored_on_creation(self):
+        leaf = YamlAttribute(1)
+        root = YamlAttribute({"a": YamlAttribute({"b": leaf})})
+        self.assertEqual(get_subtree_hash(leaf), compute_node_hash(1))
+        self.assertEqual(compute_conf_hash(root), get_subtree_hash(root))
+
+    def test_hash_is_type_strict(self):
+        hashes = {get_subtree_hash(YamlAttribute(value)) for value in (1, 1.0, True, "1")}
+        self.assertEqual(len(hashes), 4)
+
+    def test_only_changed_branch_differs(self):
+        old = YamlAttribute({"a": YamlAttribute({"b": YamlAttribute(1)}), "c": YamlAttribute([YamlAttribute(2)])})
+        new = YamlAttribute({"a": YamlAttribute({"b": YamlAttribute(3)}), "c": YamlAttribute([YamlAttribute(2)])})
+        self.assertNotEqual(get_subtree_hash(old), get_subtree_hash(new))
+        self.assertNotEqual(get_subtree_hash(old.a), get_subtree_hash(new.a))
+        self.assertEqual(get_subtree_hash(old.c), get_subtree_hash(new.c))
+
+
+class TestLazyAttribute(unittest.TestCase):
+
+    def test_materializes_on_access(self):
+        attr = LazyAttribute({"A": {"b": 1}, "c": [1, 2]}, convert=lambda value: value)
+        self.assertIsNotNone(attr._LazyAttribute__raw)
+        self.assertEqual(attr.a.b, 1)
+        self.assertIsNone(attr._LazyAttribute__raw)
+        self.assertIs(attr.a, attr.a)
+        self.assertIsNotNone(attr.c._LazyAttribute__raw)
+        self.assertEqual(list(attr.c), [1, 2])
+
+    def test_converts_scalars(self):
+        attr = LazyAttribute({"port": "8080"}, convert=int)
+        self.assertEqual(attr.port, 8080)
+        self.assertEqual(attr.port + 1, 8081)
+
+    def test_hash_matches_eager_tree(self):
+        eager = YamlAttribute({"a": YamlAttribute({"b": YamlAttribute(1)}), "c": YamlAttribute([YamlAttribute(2)])})
+        lazy = LazyAttribute({"A": {"b": 1}, "c": [2]}, convert=lambda value: value)
+        self.assertEqual(get_subtree_hash(lazy), get_subtree_hash(eager))
+        materialized = LazyAttribute({"a": eager.a})
+        self.assertEqual(get_subtree_hash(materialized), get_subtree_hash(YamlAttribute({"a": eager.a})))
+
+    def test_getattr_key_error(self):
+        attr = LazyAttribute({"key": "value"}, convert=str)
+        with self.assertRaises(rxconf.RxConfError):
+            _ = attr.nonexistent_key
+
+
+class TestAttributeMap(unittest.TestCase):
+
+    def test_mapping_protocol(self):
+        mapping = AttributeMap({"a": 1, "b": 2})
+        self.assertEqual(mapping["b"], 2)
+        self.assertEqual(list(mapping.items()), [("a", 1), ("b", 2)])
+        self.assertEqual(list(mapping.values()), [1, 2])
+        self.assertEqual(mapping.get("c", 3), 3)
+        self.assertIn("a", mapping)
+        self.assertEqual(mapping, {"a": 1, "b": 2})
+        self.assertEqual(repr(mapping), repr({"a": 1, "b": 2}))
+        with self.assertRaises(KeyError):
+            _ = mapping["c"]
+
+    def test_same_keys_share_table(self):
+        first, second = AttributeMap({"host": "a", "port": 1}), AttributeMap({"host": "b", "port": 2})
+        self.assertIs(first._table, second._table)
+        self.assertIsNot(first._table, AttributeMap({"port": 1, "host": "a"})._table)
+
+    def test_wide_mapping(self):
+        items = {f"key_{number}": number for number in range(100)}
+        mapping = AttributeMap(items)
+        self.assertIsNone(mapping._values)
+        self.assertEqual(mapping, items)
+        self.assertEqual(mapping.get("key_99"), 99)
+        self.assertEqual(list(mapping.values()), list(items.values()))
+
+    def test_attributes_have_no_instance_dict(self):
+        attr = YamlAttribute({"a": YamlAttribute(1)})
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(attr, "__dict__")
+        self.assertIsInstance(attr.__getattribute__("_AttributeType__value"), AttributeMap)
+        self.assertEqual(attr.a, 1)
+
+
+class TestUnboxedAttribute(unittest.TestCase):
+
+    def test_unbox_leaves(self):
+        attr = YamlAttribute({"rps": YamlAttribute(100), "hosts": YamlAttribute([YamlAttribute("a")])})
+        self.assertIs(type(unbox(attr.rps)), int)
+        view = unbox(attr)
+        self.assertIsInstance(view, UnboxedAttribute)
+        self.assertIs(type(view.rps), int)
+        self.assertEqual(view.rps * 2, 200)
+        self.assertEqual(list(view.hosts), ["a"])
+        self.assertEqual(view.hosts[0], "a")
+        self.assertEqual(view.hosts[:1], ["a"])
+        self.assertEqual(list(view), ["rps", "hosts"])
+
+    def test_shares_value_and_hash(self):
+        attr = LazyAttribute({"a": {"b": True}}, convert=lambda value: value)
+        view = unbox(attr)
+        self.assertIs(view.a.b, True)
+        self.assertEqual(get_subtree_hash(view), get_subtree_hash(attr))
+        self.assertEqual(view, attr)
+
+    def test_getattr_key_error(self):
+        view = unbox(YamlAttribute({"key": YamlAttribute("value")}))
+        with self.assertRaises(rxconf.RxConfError):
+            _ = view.nonexistent_key
@@ -0,0 +1,78 @@
+import pytest
+
+from rxconf.attributes import YamlAttribute
+from rxconf.changesets import ChangeSet, PathTrie, diff
+from rxconf.config_types import YamlConfig
+
+
+def _root(data):
+    return YamlConfig._process_data(data)
+
+
+def test_diff_marks_ancestors_as_changed():
+    changes = diff(_root({"db": {"pool": {"size": 1}, "host": "a"}}), _root({"db": {"pool": {"size": 2}, "host": "a"}}))
+
+    assert changes == ChangeSet(changed={"db", "db.pool", "db.pool.size"})
+    assert "DB.Pool" in changes
+    assert "db.host" not in changes
+
+
+def test_diff_collects_nested_added_and_removed_paths():
+    changes = diff(_root({"a": 1, "old": {"x": 1}}), _root({"a": 1, "new": {"y": {"z": 1}}}))
+
+    assert changes.added == {"new", "new.y", "new.y.z"}
+    assert changes.removed == {"old", "old.x"}
+    assert changes.changed == frozenset()
+
+
+def test_diff_is_type_strict():
+    changes = diff(_root({"a": 1, "b": [1, 2]}), _root({"a": True, "b": [1, 2]}))
+
+    assert changes.paths == {"a"}
+
+
+def test_diff_of_mapping_replaced_by_scalar():
+    changes = diff(_root({"a": {"b": 1}}), _root({"a": 1}))
+
+    assert changes == ChangeSet(removed={"a.b"}, changed={"a"})
+
+
+@pytest.mark.parametrize("value", [1, "1", [1], None])
+def test_diff_of_equal_trees_is_empty(value):
+    changes = diff(_root({"a": {"b": value}}), _root({"a": {"b": value}}))
+
+    assert not changes
+    assert diff(YamlAttribute(value), YamlAttribute(value)) == ChangeSet()
+
+
+@pytest.mark.parametrize(
+    "pattern, paths, is_matched",
+    [
+        ("db.pool.size", ["db", "db.pool", "db.pool.size"], True),
+        ("DB.Pool", ["db", "db.pool"], True),
+        ("db.pool.size", ["db", "db.pool"], False),
+        ("services.*.port", ["services.api.port"], True),
+        ("services.*.port", ["services.port"], False),
+        ("services.*.port", ["services.api.http.port"], False),
+        ("db.**", ["db"], True),
+        ("db.**", ["db.pool.size"], True),
+        ("db.**", ["dbx.pool"], False),
+        ("**.port", ["services.api.port"], True),
+        ("a.**.z", ["a.z", "a.b.c.z"], True),
+        ("a.**.z", ["a.b.c"], False),
+    ],
+)
+def test_path_trie_patterns(pattern, paths, is_matched):
+    trie = PathTrie()
+    trie.add(pattern, "value")
+
+    assert (trie.match(paths) == {"value"}) is is_matched
+
+
+def test_path_trie_collects_values_of_all_matched_patterns():
+    trie = PathTrie()
+    for number, pattern in enumerate(["a", "a.b", "a.*", "c", "**"]):
+        trie.add(pattern, number)
+
+    assert trie.match(["a", "a.b"]) == {0, 1, 2, 4}
+    assert trie.match([]) == set()
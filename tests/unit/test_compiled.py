@@ -0,0 +1,63 @@
+import pytest
+
+from rxconf.attributes import LazyAttribute, YamlAttribute
+from rxconf.compiled import CompiledNode, compile_attribute, lookup, shape_class
+from rxconf.exceptions import RxConfError
+
+
+def _tree(data):
+    return LazyAttribute(data, convert=lambda value: value)
+
+
+def test_compiles_into_slotted_classes():
+    node = compile_attribute(_tree({"db": {"host": "a", "port": 5432}, "hosts": ["a", {"b": 1}], "tags": {"x"}}))
+
+    assert isinstance(node, CompiledNode)
+    assert type(node.db).__slots__ == ("host", "port")
+    assert node.db.port == 5432
+    assert node.hosts == ("a", node.hosts[1]) and node.hosts[1].b == 1
+    assert node.tags == frozenset({"x"})
+    assert node.DB.Port == 5432
+    assert node["db"]["port"] == 5432
+    assert list(node.db) == ["host", "port"] and len(node.db) == 2
+    assert "port" in node.db and "user" not in node.db
+    assert node.db == {"host": "a", "port": 5432}
+    assert node.db == compile_attribute(YamlAttribute({"host": YamlAttribute("a"), "port": YamlAttribute(5432)}))
+
+
+def test_same_keys_share_class():
+    first = compile_attribute(_tree({"host": "a", "port": 1}))
+    second = compile_attribute(_tree({"host": "b", "port": 2}))
+
+    assert type(first) is type(second) is shape_class(("host", "port"))
+    assert type(first) is not type(compile_attribute(_tree({"port": 1, "host": "a"})))
+
+
+def test_non_identifier_keys():
+    node = compile_attribute(_tree({"my-key": 1, "_private": 2, "ok": 3}))
+
+    assert type(node).__slots__ == ("ok", "_extra")
+    assert getattr(node, "my-key") == 1
+    assert node["_private"] == 2
+    assert node.ok == 3
+    assert list(node) == ["my-key", "_private", "ok"]
+
+
+def test_read_only_and_missing_keys():
+    node = compile_attribute(_tree({"a": 1}))
+
+    with pytest.raises(RxConfError):
+        node.a = 2
+    with pytest.raises(RxConfError):
+        _ = node.nonexistent_key
+    with pytest.raises(RxConfError):
+        _ = node["nonexistent_key"]
+
+
+def test_lookup():
+    node = compile_attribute(_tree({"db": {"replicas": [{"host": "a"}]}}))
+
+    assert lookup(node, "db.replicas.0.host") == "a"
+    assert lookup(node, "DB.Replicas.0.Host") == "a"
+    assert lookup(node, "db.replicas.1.host", "missing") == "missing"
+    assert lookup(node, "db.nope") is None
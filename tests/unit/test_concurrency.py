@@ -0,0 +1,193 @@
+import asyncio
+import functools
+import threading
+import time
+
+import pytest
+
+from rxconf.concurrency import AsyncSingleFlight, AsyncTriggerExecutor, LoopBridge, SingleFlight, TriggerExecutor
+from rxconf.exceptions import RxConfError
+
+
+def test_single_flight_coalesces_threads():
+    flight = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(20)
+    results = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return len(calls)
+
+    def worker():
+        barrier.wait()
+        results.append(flight.do(slow))
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) < 20
+    assert len(results) == 20
+
+
+def test_single_flight_shares_exception():
+    flight = SingleFlight()
+
+    def broken():
+        raise ValueError("broken")
+
+    with pytest.raises(ValueError):
+        flight.do(broken)
+    assert flight.do(lambda: 1) == 1
+
+
+def test_single_flight_reentrant():
+    flight = SingleFlight()
+
+    assert flight.do(lambda: flight.do(lambda: 2)) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_coalesces_tasks():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    results = await asyncio.gather(*(flight.do(slow) for _ in range(200)))
+
+    assert calls == [1]
+    assert results == [1] * 200
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_cancelled_leader():
+    flight = AsyncSingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return 1
+
+    leader = asyncio.ensure_future(flight.do(slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.do(slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == 1
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_reentrant():
+    flight = AsyncSingleFlight()
+
+    async def inner():
+        return 2
+
+    async def outer():
+        return await flight.do(inner)
+
+    assert await flight.do(outer) == 2
+
+
+def test_loop_bridge_runs_coroutines():
+    bridge = LoopBridge()
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    try:
+        first = bridge.run(current_loop())
+        assert bridge.run(current_loop()) is first
+    finally:
+        bridge.close()
+    assert bridge.run(current_loop()) is not first
+    bridge.close()
+
+
+@pytest.mark.asyncio
+async def test_loop_bridge_inside_running_loop():
+    bridge = LoopBridge()
+
+    async def answer():
+        return 42
+
+    try:
+        assert bridge.run(answer()) == 42
+    finally:
+        bridge.close()
+
+
+def test_loop_bridge_from_bridge_loop():
+    bridge = LoopBridge()
+
+    async def nested():
+        return bridge.run(asyncio.sleep(0))
+
+    try:
+        with pytest.raises(RxConfError):
+            bridge.run(nested())
+    finally:
+        bridge.close()
+
+
+def test_trigger_executor_keeps_lane_order():
+    executor = TriggerExecutor(max_workers=4, parallel=True)
+    calls = {"a": [], "b": []}
+
+    try:
+        for i in range(100):
+            for lane in calls:
+                executor.submit(lane=lane, func=functools.partial(calls[lane].append, i))
+        executor.wait(timeout=5)
+    finally:
+        executor.shutdown()
+
+    assert calls == {"a": list(range(100)), "b": list(range(100))}
+
+
+def test_trigger_executor_raises_errors_on_wait():
+    executor = TriggerExecutor(max_queue_size=1)
+
+    def broken():
+        raise ValueError("broken")
+
+    try:
+        executor.submit(lane="a", func=broken)
+        executor.submit(lane="a", func=lambda: None)
+        with pytest.raises(ValueError):
+            executor.wait(timeout=5)
+        executor.wait(timeout=5)
+    finally:
+        executor.shutdown()
+
+
+def test_trigger_executor_wrong_sizes():
+    with pytest.raises(RxConfError):
+        TriggerExecutor(max_queue_size=0)
+
+
+@pytest.mark.asyncio
+async def test_async_trigger_executor_keeps_lane_order():
+    executor = AsyncTriggerExecutor(max_queue_size=10, parallel=True)
+    calls = {"a": [], "b": []}
+
+    async def record(lane, i):
+        await asyncio.sleep(0)
+        calls[lane].append(i)
+
+    for i in range(50):
+        for lane in calls:
+            await executor.submit(lane=lane, func=functools.partial(record, lane, i))
+    await executor.wait()
+
+    assert calls == {"a": list(range(50)), "b": list(range(50))}
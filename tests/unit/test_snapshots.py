@@ -0,0 +1,99 @@
+import datetime
+import uuid
+
+import pytest
+
+from rxconf import attributes, hashtools
+from rxconf.changesets import diff
+from rxconf.config_types import LayeredConfig, YamlConfig
+from rxconf.exceptions import ConfigNotFoundError, RxConfError
+from rxconf.snapshots import SnapshotPublisher, SnapshotReader, dumps, loads
+
+
+_DATA = {
+    "app": {"name": "rxconf", "workers": 8, "ratio": 0.25, "debug": False, "owner": None},
+    "hosts": ["a", "b", {"c": 1}],
+    "big": 2**100,
+    "negative": -1,
+    "date": datetime.date(2024, 1, 2),
+    "created": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+}
+
+
+def _config(data):
+    return LayeredConfig(root_attribute=YamlConfig._process_data(data))
+
+
+def _is_decoded(attribute):
+    try:
+        attributes._VALUE_SLOT.__get__(attribute, type(attribute))
+    except AttributeError:
+        return False
+    return True
+
+
+def test_snapshot_round_trip():
+    config = _config(_DATA)
+    loaded = loads(dumps(config))
+
+    assert loaded == config
+    assert loaded.hash == config.hash
+    assert loaded.app.workers == 8
+    assert loaded.app.ratio == 0.25
+    assert loaded.app.owner == None  # noqa: E711
+    assert loaded.hosts[2].c == 1
+    assert loaded.big == 2**100
+    assert loaded.created == _DATA["created"]
+    assert repr(loaded) == repr(config)
+    assert not diff(config._root, loaded._root)
+
+
+def test_snapshot_decodes_lazily():
+    loaded = loads(dumps(_config({"a": {"b": 1}, "c": {"d": 2}})))
+    value = object.__getattribute__(loaded._root, "_AttributeType__value")
+    hash_before = hashtools.get_subtree_hash(value["c"])
+
+    assert loaded.a.b == 1
+    assert _is_decoded(value["a"])
+    assert not _is_decoded(value["c"])
+    assert hash_before == hashtools.get_subtree_hash(YamlConfig._process_data({"d": 2}))
+
+
+def test_snapshot_keeps_digest():
+    config = YamlConfig(root_attribute=YamlConfig._process_data({"a": 1}), path=None, digest=b"digest")
+
+    assert loads(dumps(config)).digest == b"digest"
+    assert loads(dumps(_config({"a": 1}))).digest is None
+
+
+@pytest.mark.parametrize("data", [b"", b"XXXX\x01\x00\x00\x00\x00\x00"])
+def test_broken_snapshot(data):
+    with pytest.raises(RxConfError):
+        loads(data)
+
+
+def test_shared_memory_publication():
+    name = f"rxconf-test-{uuid.uuid4().hex[:8]}"
+    publisher = SnapshotPublisher(name=name, size=64 * 1024)
+    try:
+        reader = SnapshotReader(name=name)
+        with pytest.raises(ConfigNotFoundError):
+            reader.read()
+
+        assert publisher.publish(_config({"a": 1})) == 1
+        first = reader.read()
+        assert first.a == 1
+        assert reader.read() is first
+
+        publisher.publish(_config({"a": 2}))
+        assert reader.version == 2
+        assert reader.read().a == 2
+        assert first.a == 1
+
+        with pytest.raises(RxConfError):
+            publisher.publish(_config({"a": "x" * 128 * 1024}))
+        reader.close()
+    finally:
+        publisher.close()
+    with pytest.raises(ConfigNotFoundError):
+        SnapshotReader(name=name)